@@ -80,7 +80,7 @@ export const NodeDetails = memo(function NodeDetails({
   const [requestBodyDetails, setRequestBodyDetails] = useState<ClassDetails | null>(null);
   const [responseTypeDetails, setResponseTypeDetails] = useState<ClassDetails | null>(null);
   const [loading, setLoading] = useState(false);
-  const { getClassDetails, getEndpointDetails } = usePyloid();
+  const { getClassDetails, getEndpointDetails, getDetailsBulk } = usePyloid();
 
   useEffect(() => {
     if (!node) {
@@ -123,30 +123,19 @@ export const NodeDetails = memo(function NodeDetails({
 
     if (!endpointDetails) return;
 
-    const fetchRelatedClasses = async () => {
-      const promises: Promise<void>[] = [];
-
-      if (endpointDetails.requestBody) {
-        promises.push(
-          getClassDetails(endpointDetails.requestBody)
-            .then((details) => { if (!details.error) setRequestBodyDetails(details); })
-            .catch(() => { /* ignore */ })
-        );
-      }
-
-      if (endpointDetails.responseType) {
-        promises.push(
-          getClassDetails(endpointDetails.responseType)
-            .then((details) => { if (!details.error) setResponseTypeDetails(details); })
-            .catch(() => { /* ignore */ })
-        );
-      }
-
-      await Promise.all(promises);
-    };
-
-    fetchRelatedClasses();
-  }, [endpointDetails, getClassDetails]);
+    const { requestBody, responseType } = endpointDetails;
+    const fqns = [requestBody, responseType].filter((t): t is string => !!t);
+    if (fqns.length === 0) return;
+
+    getDetailsBulk(fqns)
+      .then(({ classes }) => {
+        const request = requestBody ? classes[requestBody] : undefined;
+        const response = responseType ? classes[responseType] : undefined;
+        if (request && !request.error) setRequestBodyDetails(request);
+        if (response && !response.error) setResponseTypeDetails(response);
+      })
+      .catch(() => { /* ignore */ });
+  }, [endpointDetails, getDetailsBulk]);
 
   const categorizedParams = useMemo(() => {
     if (!endpointDetails) return { path: [], query: [], header: [], body: [] };
@@ -7,6 +7,7 @@ import type {
   ProjectInfo,
   ClassDetails,
   EndpointDetails,
+  DetailsBulk,
   CodeGraph,
   SourceSnippet,
 } from "../types/graph";
@@ -16,6 +17,30 @@ import { markStart, markEnd } from "../utils/perf";
 
 const logger = createLogger("usePyloid");
 
+const JOB_POLL_INTERVAL_MS = 50;
+
+// Give up on a job after this long; LLM-backed generation can take many minutes
+const JOB_TIMEOUT_MS = 30 * 60 * 1000;
+
+/**
+ * Run a long bridge (scan, generate, parse) on a backend worker thread and
+ * poll until it finishes, so the UI thread is never blocked on the call.
+ * Resolves to an error result if the job does not finish within JOB_TIMEOUT_MS.
+ */
+async function runJob(name: string, arg: string) {
+  const started = JSON.parse(await ipc.DocmakerAPI.start_job(name, arg));
+  if (started.error) return started;
+
+  const deadline = Date.now() + JOB_TIMEOUT_MS;
+  while (Date.now() < deadline) {
+    await new Promise((resolve) => setTimeout(resolve, JOB_POLL_INTERVAL_MS));
+    const polled = JSON.parse(await ipc.DocmakerAPI.get_job_result(started.jobId));
+    if (polled.error) return polled;
+    if (polled.done) return polled.result;
+  }
+  return { error: `${name} did not finish within ${JOB_TIMEOUT_MS / 60000} minutes` };
+}
+
 interface GenerateOptions {
   incremental?: boolean;
   useLlm?: boolean;
@@ -77,8 +102,7 @@ export function usePyloid() {
   const scanProject = useCallback(async (path: string): Promise<ScanResult> => {
     logger.info("scanProject called with path:", path);
     try {
-      const result = await ipc.DocmakerAPI.scan_project(path);
-      const parsed = JSON.parse(result);
+      const parsed = await runJob("scan_project", path);
       if (parsed.error) {
         logger.error("scanProject error:", parsed.error);
       } else {
@@ -99,8 +123,7 @@ export function usePyloid() {
   const generateDocs = useCallback(async (options: GenerateOptions = {}): Promise<GenerateResult> => {
     logger.info("generateDocs called with options:", options);
     try {
-      const result = await ipc.DocmakerAPI.generate_docs(JSON.stringify(options));
-      const parsed = JSON.parse(result);
+      const parsed = await runJob("generate_docs", JSON.stringify(options));
       if (parsed.error) {
         logger.error("generateDocs error:", parsed.error);
       } else {
@@ -139,8 +162,7 @@ export function usePyloid() {
     logger.info("parseOnly called with path:", path);
     markStart("ipc:parseOnly");
     try {
-      const result = await ipc.DocmakerAPI.parse_only(path);
-      const parsed = JSON.parse(result);
+      const parsed = await runJob("parse_only", path);
       markEnd("ipc:parseOnly");
       if (parsed.error) {
         logger.error("parseOnly error:", parsed.error);
@@ -255,6 +277,54 @@ export function usePyloid() {
     }
   }, []);
 
+  const getDetailsBulk = useCallback(async (
+    classFqns: string[],
+    endpointKeys: string[] = [],
+  ): Promise<DetailsBulk> => {
+    const details: DetailsBulk = { classes: {}, endpoints: {} };
+    const missingClasses: string[] = [];
+    const missingEndpoints: string[] = [];
+
+    for (const fqn of classFqns) {
+      const cached = classDetailsCache.current.get(fqn);
+      if (cached) details.classes[fqn] = cached;
+      else missingClasses.push(fqn);
+    }
+    for (const key of endpointKeys) {
+      const cached = endpointDetailsCache.current.get(key);
+      if (cached) details.endpoints[key] = cached;
+      else missingEndpoints.push(key);
+    }
+    if (missingClasses.length === 0 && missingEndpoints.length === 0) return details;
+
+    logger.debug("getDetailsBulk called:", missingClasses.length, missingEndpoints.length);
+    markStart("details:fetchBulk");
+    try {
+      const result = await ipc.DocmakerAPI.get_details_bulk(
+        JSON.stringify({ classes: missingClasses, endpoints: missingEndpoints })
+      );
+      const parsed = JSON.parse(result);
+      markEnd("details:fetchBulk");
+      if (parsed.error) {
+        logger.error("getDetailsBulk error:", parsed.error);
+        return { ...details, error: parsed.error };
+      }
+      for (const [fqn, cls] of Object.entries(parsed.classes as Record<string, ClassDetails>)) {
+        if (!cls.error) classDetailsCache.current.set(fqn, cls);
+        details.classes[fqn] = cls;
+      }
+      for (const [key, ep] of Object.entries(parsed.endpoints as Record<string, EndpointDetails>)) {
+        if (!ep.error) endpointDetailsCache.current.set(key, ep);
+        details.endpoints[key] = ep;
+      }
+      return details;
+    } catch (error) {
+      markEnd("details:fetchBulk");
+      logger.error("getDetailsBulk failed:", error);
+      return { ...details, error: String(error) };
+    }
+  }, []);
+
   const getSettings = useCallback(async (): Promise<Record<string, unknown>> => {
     logger.debug("getSettings called");
     try {
@@ -399,6 +469,7 @@ export function usePyloid() {
     getProjectInfo,
     getClassDetails,
     getEndpointDetails,
+    getDetailsBulk,
     getSourceSnippet,
     getSettings,
     saveSettings,
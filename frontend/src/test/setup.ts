@@ -26,6 +26,8 @@ vi.mock("pyloid-js", () => ({
       save_settings_ipc: vi.fn().mockResolvedValue('{"success":true}'),
       reset_settings_ipc: vi.fn().mockResolvedValue("{}"),
       parse_only: vi.fn().mockResolvedValue('{"graph":{"nodes":[],"edges":[]},"stats":{"filesParsed":0,"classesFound":0,"endpointsFound":0}}'),
+      start_job: vi.fn().mockResolvedValue('{"jobId":"job"}'),
+      get_job_result: vi.fn().mockResolvedValue('{"done":true,"result":{"graph":{"nodes":[],"edges":[]},"stats":{"filesParsed":0,"classesFound":0,"endpointsFound":0}}}'),
       select_folder: vi.fn().mockResolvedValue(null),
       open_file: vi.fn().mockResolvedValue("{}"),
       resize_window: vi.fn().mockResolvedValue('{"success":true}'),
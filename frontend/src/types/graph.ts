@@ -37,12 +37,8 @@ export interface CodeGraph {
   edges: GraphEdge[];
 }
 
-export interface FileInfo {
-  path: string;
-  language: string;
-  category: string;
-  size: number;
-}
+/** Scanned file as a positional row, to keep large scan payloads compact. */
+export type FileInfo = [path: string, language: string, category: string, size: number];
 
 export interface ProjectStats {
   totalFiles: number;
@@ -163,3 +159,9 @@ export interface EndpointDetails {
   description: string | null;
   error?: string;
 }
+
+export interface DetailsBulk {
+  classes: Record<string, ClassDetails>;
+  endpoints: Record<string, EndpointDetails>;
+  error?: string;
+}
@@ -4,6 +4,7 @@
 This launcher bypasses the Click CLI and directly launches the desktop app.
 """
 
+import multiprocessing
 import sys
 
 
@@ -19,4 +20,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Lets parse worker processes start inside the frozen executable
+    multiprocessing.freeze_support()
     main()
@@ -8,10 +8,12 @@ This script handles the complete build process:
 """
 
 import argparse
+import io
+import os
 import platform
 import shutil
-import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Project paths
@@ -20,6 +22,9 @@ PACKAGING_DIR = PROJECT_ROOT / "packaging"
 FRONTEND_DIST = PROJECT_ROOT / "frontend" / "dist"
 SPEC_FILE = PACKAGING_DIR / "docmaker.spec"
 
+# Worker threads used to delete build/ and dist/ in parallel
+CLEAN_WORKERS = 8
+
 
 def get_platform():
     """Get normalized platform name."""
@@ -29,36 +34,36 @@ def get_platform():
     return system
 
 
-def check_frontend():
+def check_frontend(out=None):
     """Verify frontend is built."""
     if not FRONTEND_DIST.exists():
-        print("Error: Frontend not built.")
-        print("Run: cd frontend && npm install && npm run build")
+        print("Error: Frontend not built.", file=out)
+        print("Run: cd frontend && npm install && npm run build", file=out)
         return False
 
     index_html = FRONTEND_DIST / "index.html"
     if not index_html.exists():
-        print("Error: Frontend build incomplete (index.html missing).")
+        print("Error: Frontend build incomplete (index.html missing).", file=out)
         return False
 
-    print(f"Frontend found at: {FRONTEND_DIST}")
+    print(f"Frontend found at: {FRONTEND_DIST}", file=out)
     return True
 
 
-def check_pyinstaller():
+def check_pyinstaller(out=None):
     """Verify PyInstaller is installed."""
     try:
         import PyInstaller
 
-        print(f"PyInstaller version: {PyInstaller.__version__}")
+        print(f"PyInstaller version: {PyInstaller.__version__}", file=out)
         return True
     except ImportError:
-        print("Error: PyInstaller not installed.")
-        print("Run: pip install pyinstaller")
+        print("Error: PyInstaller not installed.", file=out)
+        print("Run: pip install pyinstaller", file=out)
         return False
 
 
-def check_icons():
+def check_icons(out=None):
     """Check if platform-specific icons exist."""
     plat = get_platform()
     icons_dir = PACKAGING_DIR / "icons"
@@ -71,11 +76,14 @@ def check_icons():
         icon_file = icons_dir / "docmaker.png"
 
     if not icon_file.exists():
-        print(f"Warning: Icon not found at {icon_file}")
-        print("Run: python packaging/scripts/convert_icons.py packaging/icons/docmaker.svg")
+        print(f"Warning: Icon not found at {icon_file}", file=out)
+        print(
+            "Run: python packaging/scripts/convert_icons.py packaging/icons/docmaker.svg",
+            file=out,
+        )
         return False
 
-    print(f"Icon found: {icon_file}")
+    print(f"Icon found: {icon_file}", file=out)
     return True
 
 
@@ -84,10 +92,29 @@ def clean_build():
     build_dir = PROJECT_ROOT / "build"
     dist_dir = PROJECT_ROOT / "dist"
 
-    for d in [build_dir, dist_dir]:
-        if d.exists():
-            print(f"Cleaning: {d}")
-            shutil.rmtree(d)
+    dirs = [d for d in (build_dir, dist_dir) if d.exists()]
+    for d in dirs:
+        print(f"Cleaning: {d}")
+
+    # Remove the top-level entries of both trees concurrently, then the empty roots
+    children = []
+    for d in dirs:
+        with os.scandir(d) as it:
+            children.extend(it)
+
+    with ThreadPoolExecutor(max_workers=CLEAN_WORKERS) as executor:
+        list(executor.map(_remove_entry, children))
+
+    for d in dirs:
+        shutil.rmtree(d)
+
+
+def _remove_entry(entry: os.DirEntry) -> None:
+    """Delete a file, symlink, or directory tree."""
+    if entry.is_dir(follow_symlinks=False):
+        shutil.rmtree(entry.path)
+    else:
+        os.unlink(entry.path)
 
 
 def run_pyinstaller(clean: bool = False, debug: bool = False):
@@ -96,22 +123,35 @@ def run_pyinstaller(clean: bool = False, debug: bool = False):
         print(f"Error: Spec file not found at {SPEC_FILE}")
         return False
 
-    cmd = [sys.executable, "-m", "PyInstaller"]
+    pyi_args = []
 
     if clean:
-        cmd.append("--clean")
+        pyi_args.append("--clean")
 
     if debug:
-        cmd.append("--log-level=DEBUG")
+        pyi_args.append("--log-level=DEBUG")
 
-    cmd.append(str(SPEC_FILE))
+    pyi_args.append(str(SPEC_FILE))
 
-    print(f"Running: {' '.join(cmd)}")
+    print(f"Running: PyInstaller {' '.join(pyi_args)}")
     print("-" * 60)
 
-    result = subprocess.run(cmd, cwd=PROJECT_ROOT)
+    # Run in-process to skip a second interpreter start-up and re-import
+    from PyInstaller.__main__ import run as pyi_run
+
+    previous_cwd = os.getcwd()
+    os.chdir(PROJECT_ROOT)
+    try:
+        pyi_run(pyi_args)
+    except SystemExit as e:
+        return e.code in (None, 0)
+    except Exception as e:
+        print(f"Error: PyInstaller failed: {e}")
+        return False
+    finally:
+        os.chdir(previous_cwd)
 
-    return result.returncode == 0
+    return True
 
 
 def report_output():
@@ -150,10 +190,33 @@ def report_output():
 
 def get_dir_size(path: Path) -> float:
     """Get directory size in MB."""
+    # GNU du walks the tree in native code; -b reports apparent size in bytes
+    if platform.system() == "Linux" and shutil.which("du"):
+        import subprocess
+
+        try:
+            output = subprocess.check_output(
+                ["du", "-sb", str(path)], stderr=subprocess.DEVNULL
+            )
+            return int(output.split()[0]) / (1024 * 1024)
+        except (subprocess.CalledProcessError, OSError, ValueError, IndexError):
+            pass
+
     total = 0
-    for f in path.rglob("*"):
-        if f.is_file():
-            total += f.stat().st_size
+    stack = [str(path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        pass
+        except OSError:
+            pass
     return total / (1024 * 1024)
 
 
@@ -176,11 +239,20 @@ def main():
             ("Icons", check_icons),
         ]
 
+        # Run checks concurrently, buffering each one's output so it prints in order
         all_passed = True
-        for name, check_fn in checks:
-            print(f"\nChecking {name}...")
-            if not check_fn():
-                all_passed = False
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            pending = []
+            for name, check_fn in checks:
+                buffer = io.StringIO()
+                pending.append((name, buffer, executor.submit(check_fn, buffer)))
+
+            for name, buffer, future in pending:
+                print(f"\nChecking {name}...")
+                passed = future.result()
+                print(buffer.getvalue(), end="")
+                if not passed:
+                    all_passed = False
 
         if not all_passed:
             print("\nSome checks failed. Fix issues above or use --skip-checks to proceed anyway.")
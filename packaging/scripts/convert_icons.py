@@ -9,15 +9,20 @@ Creates:
     - icon.icns (macOS - 512x512 PNG wrapped in ICNS container)
     - icon.png (Linux - 256x256)
 
-This script uses Playwright to render SVG with full CSS/gradient support.
-Install with: pip install playwright && playwright install chromium
+This script prefers resvg (pure-Rust rasterizer, no browser) when available
+and falls back to Playwright for full CSS/gradient support.
+Install with: pip install resvg-py
+        or:   pip install playwright && playwright install chromium
 """
 
 import argparse
+import asyncio
+import hashlib
 import io
+import os
 import struct
-import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -39,50 +44,306 @@ def check_playwright():
         return False
 
 
-def render_svg_with_playwright(svg_path: Path, size: int) -> bytes:
-    """Render SVG to PNG using Playwright (headless Chromium)."""
-    from playwright.sync_api import sync_playwright
+def check_resvg():
+    """Check if the resvg Python bindings are available."""
+    try:
+        import resvg_py  # noqa: F401
+
+        return True
+    except ImportError:
+        return False
+
+
+def select_backend() -> str:
+    """Pick the SVG rendering backend, preferring resvg over Playwright.
+
+    Only checks that resvg imports; Playwright is verified separately with
+    check_playwright() once it is known that something must be rendered.
+    """
+    if check_resvg():
+        print("Using resvg renderer")
+        return "resvg"
+    print("resvg not installed (pip install resvg-py), using Playwright")
+    return "playwright"
+
+
+def render_svg_with_resvg(svg_content: str, size: int) -> bytes:
+    """Render SVG to PNG in-process using resvg.
+
+    resvg-py only exposes PNG-encoded output (no raw RGBA pixmap), so callers
+    that need pixels decode the returned bytes once with Pillow.
+    """
+    import resvg_py
+
+    return resvg_py.svg_to_bytes(svg_string=svg_content, width=size, height=size)
+
+
+# Big-endian uint32 used for ICNS length fields
+_U32BE = struct.Struct(">I")
+
+# ICO header and directory entry layouts (little-endian)
+_ICONDIR = struct.Struct("<HHH")
+_ICONDIRENTRY = struct.Struct("<BBBBHHII")
+
+# Number of Chromium pages allowed to render concurrently
+MAX_CONCURRENT_PAGES = 4
+
+# Worker threads used to encode and write macOS iconset entries
+ICONSET_WRITE_WORKERS = 4
+
+# Rendered PNGs are cached here, keyed by SVG content hash and size
+ICON_CACHE_DIR = Path.home() / ".cache" / "docmaker" / "icons"
 
-    svg_content = svg_path.read_text(encoding="utf-8")
 
-    # Create HTML that renders the SVG at exact size
-    html = f"""<!DOCTYPE html>
+# Page that Playwright screenshots; the SVG scales with the viewport, so one
+# document serves every size. "__SVG__" is replaced with the SVG markup.
+_HTML_TEMPLATE = """<!DOCTYPE html>
 <html>
 <head>
     <style>
-        * {{ margin: 0; padding: 0; }}
-        body {{
-            width: {size}px;
-            height: {size}px;
+        * { margin: 0; padding: 0; }
+        html, body {
+            width: 100%;
+            height: 100%;
             overflow: hidden;
             background: transparent;
-        }}
-        svg {{
-            width: {size}px;
-            height: {size}px;
-        }}
+        }
+        svg {
+            display: block;
+            width: 100%;
+            height: 100%;
+        }
     </style>
 </head>
-<body>{svg_content}</body>
+<body>__SVG__</body>
 </html>"""
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page(viewport={"width": size, "height": size})
-        page.set_content(html)
 
-        # Screenshot the page
-        png_bytes = page.screenshot(
+class SvgRenderer:
+    """Render an SVG to PNG at arbitrary sizes.
+
+    With the "resvg" backend renders happen in-process. With the "playwright"
+    backend, launching Chromium dominates render time, so the browser is
+    started once in ``__enter__`` and reused for every size until ``__exit__``.
+    Playwright renders run on the async API over a small pool of pages that
+    load the SVG document once; each render only resizes the viewport, so
+    several sizes can be captured concurrently through ``render_many``.
+
+    Rendered PNGs are cached on disk under ``cache_dir`` keyed by the SHA-256
+    of the backend and SVG content plus the size, so unchanged icons are not
+    re-rendered on later runs. Pass ``cache_dir=None`` to disable the cache.
+    """
+
+    def __init__(
+        self,
+        svg_path: Path,
+        backend: str = "playwright",
+        max_pages: int = MAX_CONCURRENT_PAGES,
+        cache_dir: Path | None = ICON_CACHE_DIR,
+    ):
+        self.svg_content = svg_path.read_text(encoding="utf-8")
+        self.backend = backend
+        self.max_pages = max_pages
+        self.cache_dir = cache_dir
+        self._cache_key = hashlib.sha256(f"{backend}\0{self.svg_content}".encode()).hexdigest()
+        self._loop = None
+        self._playwright = None
+        self._browser = None
+        self._pages = []
+
+    def __enter__(self) -> "SvgRenderer":
+        # Chromium is launched lazily on the first cache miss
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._pages.clear()
+        if self._browser is not None:
+            self._loop.run_until_complete(self._browser.close())
+            self._browser = None
+        if self._playwright is not None:
+            self._loop.run_until_complete(self._playwright.stop())
+            self._playwright = None
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
+
+    def uncached_sizes(self, sizes) -> list[int]:
+        """Return the sizes that would need an actual render."""
+        return [size for size in sorted(set(sizes)) if self._load_cached(size) is None]
+
+    def render(self, size: int) -> bytes:
+        """Render the SVG to PNG bytes at the given square size."""
+        return self.render_many([size])[size]
+
+    def render_many(self, sizes) -> dict[int, bytes]:
+        """Render the SVG at several sizes, concurrently where possible.
+
+        Returns:
+            Mapping of size to PNG bytes, one entry per unique size
+        """
+        results: dict[int, bytes] = {}
+        missing = []
+        for size in sorted(set(sizes)):
+            cached = self._load_cached(size)
+            if cached is not None:
+                results[size] = cached
+            else:
+                missing.append(size)
+
+        if not missing:
+            return results
+
+        if self.backend == "resvg":
+            rendered = [render_svg_with_resvg(self.svg_content, size) for size in missing]
+        else:
+            if self._browser is None:
+                self._launch_browser()
+            rendered = self._loop.run_until_complete(self._render_on_pool(missing))
+
+        for size, png_data in zip(missing, rendered):
+            self._store_cached(size, png_data)
+            results[size] = png_data
+        return results
+
+    def _cache_path(self, size: int) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{self._cache_key}_{size}.png"
+
+    def _load_cached(self, size: int) -> bytes | None:
+        cache_path = self._cache_path(size)
+        if cache_path is None:
+            return None
+        try:
+            return cache_path.read_bytes()
+        except OSError:
+            return None
+
+    def _store_cached(self, size: int, png_data: bytes) -> None:
+        cache_path = self._cache_path(size)
+        if cache_path is None:
+            return
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file and rename so readers never see partial PNGs
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(png_data)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"  Warning: could not cache {size}px render: {e}")
+
+    def _launch_browser(self) -> None:
+        from playwright.async_api import async_playwright
+
+        self._loop = asyncio.new_event_loop()
+        self._playwright = self._loop.run_until_complete(async_playwright().start())
+        self._browser = self._loop.run_until_complete(
+            self._playwright.chromium.launch(headless=True)
+        )
+
+    async def _render_on_pool(self, sizes: list[int]) -> list[bytes]:
+        html = _HTML_TEMPLATE.replace("__SVG__", self.svg_content)
+        while len(self._pages) < min(self.max_pages, len(sizes)):
+            page = await self._browser.new_page()
+            await page.set_content(html)
+            self._pages.append(page)
+
+        idle_pages: asyncio.Queue = asyncio.Queue()
+        for page in self._pages:
+            idle_pages.put_nowait(page)
+
+        async def render_on_idle_page(size: int) -> bytes:
+            page = await idle_pages.get()
+            try:
+                return await self._render(page, size)
+            finally:
+                idle_pages.put_nowait(page)
+
+        return await asyncio.gather(*(render_on_idle_page(size) for size in sizes))
+
+    async def _render(self, page, size: int) -> bytes:
+        await page.set_viewport_size({"width": size, "height": size})
+
+        # Screenshot the viewport; it already equals the target size, so no clip
+        return await page.screenshot(
             type="png",
             omit_background=True,  # Transparent background
-            clip={"x": 0, "y": 0, "width": size, "height": size}
         )
 
-        browser.close()
-        return png_bytes
 
+# Output sizes for each format
+ICO_SIZES = [16, 24, 32, 48, 64, 128, 256]
+ICNS_ICONSET_SIZES = {
+    "icon_16x16.png": 16,
+    "icon_16x16@2x.png": 32,
+    "icon_32x32.png": 32,
+    "icon_32x32@2x.png": 64,
+    "icon_128x128.png": 128,
+    "icon_128x128@2x.png": 256,
+    "icon_256x256.png": 256,
+    "icon_256x256@2x.png": 512,
+    "icon_512x512.png": 512,
+    "icon_512x512@2x.png": 1024,
+}
+ICNS_SIMPLE_SIZE = 512
+PNG_SIZE = 256
+
+
+def has_iconutil() -> bool:
+    """Full ICNS output needs macOS iconutil; elsewhere a simplified ICNS is written."""
+    import platform
+
+    return platform.system() == "Darwin"
+
+
+def ico_render_sizes() -> set[int]:
+    """Sizes create_ico reads from the render dict (the rest are downsampled)."""
+    return {max(ICO_SIZES)}
+
+
+def icns_render_sizes() -> set[int]:
+    """Sizes create_icns reads from the render dict (the rest are downsampled)."""
+    if has_iconutil():
+        return {max(ICNS_ICONSET_SIZES.values())}
+    return {ICNS_SIMPLE_SIZE}
+
+
+def _decode_rgba(png_data: bytes):
+    """Decode PNG bytes once into a fully loaded RGBA image.
+
+    Loading eagerly means later resizes (possibly from several threads) work
+    on decoded pixels, and renders that are already RGBA skip a convert copy.
+    """
+    from PIL import Image
+
+    image = Image.open(io.BytesIO(png_data))
+    image.load()
+    if image.mode != "RGBA":
+        image = image.convert("RGBA")
+    return image
 
-def create_ico(svg_path: Path, output_path: Path):
+
+def build_ico(pngs: list[tuple[int, bytes]]) -> bytes:
+    """Assemble an ICO container from (size, PNG bytes) pairs.
+
+    Layout: ICONDIR (6 bytes) + N x ICONDIRENTRY (16 bytes) + N PNG payloads.
+    A width/height byte of 0 means 256px.
+    """
+    offset = _ICONDIR.size + _ICONDIRENTRY.size * len(pngs)
+    entries = []
+    for size, png_data in pngs:
+        dim = size if size < 256 else 0
+        # width, height, colors, reserved, planes, bit depth, data size, data offset
+        entries.append(_ICONDIRENTRY.pack(dim, dim, 0, 0, 1, 32, len(png_data), offset))
+        offset += len(png_data)
+    return (
+        _ICONDIR.pack(0, 1, len(pngs))  # reserved, type (1 = icon), count
+        + b"".join(entries)
+        + b"".join(png_data for _, png_data in pngs)
+    )
+
+
+def create_ico(rendered: dict[int, bytes], output_path: Path):
     """Create Windows ICO file with multiple resolutions.
 
     ICO spec: https://en.wikipedia.org/wiki/ICO_(file_format)
@@ -90,28 +351,35 @@ def create_ico(svg_path: Path, output_path: Path):
     """
     from PIL import Image
 
-    sizes = [16, 24, 32, 48, 64, 128, 256]
-    images = []
+    sizes = ICO_SIZES
+    largest = max(sizes)
+    largest_png = rendered[largest]
 
-    print(f"  Rendering {len(sizes)} sizes for ICO...")
+    # Only the largest size is rendered; smaller entries are LANCZOS downsamples.
+    # The rendered PNG is embedded as-is, so only the downsamples get encoded.
+    print(f"  Downsampling {largest}px render to {len(sizes) - 1} sizes for ICO...")
+    base = _decode_rgba(largest_png)
+    pngs = []
     for size in sizes:
-        png_data = render_svg_with_playwright(svg_path, size)
-        img = Image.open(io.BytesIO(png_data))
-        if img.mode != "RGBA":
-            img = img.convert("RGBA")
-        images.append(img)
-
-    # Save as ICO - Pillow handles multi-resolution ICO format
-    images[-1].save(
-        output_path,
-        format="ICO",
-        sizes=[(s, s) for s in sizes],
-        append_images=images[:-1]
-    )
+        if size == largest:
+            pngs.append((size, largest_png))
+        else:
+            buffer = io.BytesIO()
+            base.resize((size, size), Image.LANCZOS).save(buffer, format="PNG")
+            pngs.append((size, buffer.getvalue()))
+
+    output_path.write_bytes(build_ico(pngs))
     print(f"  Created: {output_path}")
 
 
-def create_icns(svg_path: Path, output_path: Path):
+def _save_resized_png(image, size: int, path: Path):
+    """Downsample an RGBA image with LANCZOS and save it as PNG."""
+    from PIL import Image
+
+    image.resize((size, size), Image.LANCZOS).save(path, format="PNG")
+
+
+def create_icns(rendered: dict[int, bytes], output_path: Path):
     """Create macOS ICNS file.
 
     On macOS: Uses iconutil for proper ICNS with all sizes
@@ -119,30 +387,32 @@ def create_icns(svg_path: Path, output_path: Path):
 
     ICNS spec: https://en.wikipedia.org/wiki/Apple_Icon_Image_format
     """
-    import platform
-
-    if platform.system() == "Darwin":
+    if has_iconutil():
         # macOS: Use iconutil for full ICNS support
-        iconset_sizes = {
-            "icon_16x16.png": 16,
-            "icon_16x16@2x.png": 32,
-            "icon_32x32.png": 32,
-            "icon_32x32@2x.png": 64,
-            "icon_128x128.png": 128,
-            "icon_128x128@2x.png": 256,
-            "icon_256x256.png": 256,
-            "icon_256x256@2x.png": 512,
-            "icon_512x512.png": 512,
-            "icon_512x512@2x.png": 1024,
-        }
+        iconset_sizes = ICNS_ICONSET_SIZES
 
         iconset_dir = output_path.parent / "docmaker.iconset"
         iconset_dir.mkdir(exist_ok=True)
 
-        print(f"  Rendering {len(iconset_sizes)} sizes for ICNS...")
-        for name, size in iconset_sizes.items():
-            png_data = render_svg_with_playwright(svg_path, size)
-            (iconset_dir / name).write_bytes(png_data)
+        # Only the largest size is rendered; smaller entries are LANCZOS downsamples
+        largest = max(iconset_sizes.values())
+        print(f"  Downsampling {largest}px render for ICNS...")
+        largest_png = rendered[largest]
+        base = _decode_rgba(largest_png)
+        # Resize/encode/write each entry on a pool; Pillow releases the GIL
+        with ThreadPoolExecutor(max_workers=ICONSET_WRITE_WORKERS) as pool:
+            futures = []
+            for name, size in iconset_sizes.items():
+                if size == largest:
+                    futures.append(pool.submit((iconset_dir / name).write_bytes, largest_png))
+                else:
+                    futures.append(
+                        pool.submit(_save_resized_png, base, size, iconset_dir / name)
+                    )
+            for future in futures:
+                future.result()
+
+        import subprocess
 
         try:
             subprocess.run(
@@ -160,31 +430,30 @@ def create_icns(svg_path: Path, output_path: Path):
     else:
         # Non-macOS: Create simplified ICNS with 512x512 PNG
         print("  Note: Full ICNS requires macOS. Creating simplified ICNS...")
-        png_data = render_svg_with_playwright(svg_path, 512)
+        png_data = rendered[ICNS_SIMPLE_SIZE]
 
         # ICNS format: magic(4) + size(4) + [type(4) + size(4) + data]...
         icon_type = b"ic09"  # 512x512 PNG
         icon_entry_size = 8 + len(png_data)  # type + size + data
         total_size = 8 + icon_entry_size  # header + entry
 
-        with open(output_path, "wb") as f:
-            f.write(b"icns")  # Magic number
-            f.write(struct.pack(">I", total_size))  # Total file size (big-endian)
-            f.write(icon_type)  # Icon type
-            f.write(struct.pack(">I", icon_entry_size))  # Entry size
-            f.write(png_data)  # PNG data
+        header = (
+            b"icns"  # Magic number
+            + _U32BE.pack(total_size)  # Total file size (big-endian)
+            + icon_type  # Icon type
+            + _U32BE.pack(icon_entry_size)  # Entry size
+        )
+        output_path.write_bytes(header + png_data)
 
         print(f"  Created: {output_path}")
 
 
-def create_png(svg_path: Path, output_path: Path, size: int = 256):
+def create_png(rendered: dict[int, bytes], output_path: Path, size: int = PNG_SIZE):
     """Create PNG file for Linux.
 
     Standard size: 256x256 for hicolor theme
     """
-    print(f"  Rendering {size}x{size} PNG...")
-    png_data = render_svg_with_playwright(svg_path, size)
-    output_path.write_bytes(png_data)
+    output_path.write_bytes(rendered[size])
     print(f"  Created: {output_path}")
 
 
@@ -199,8 +468,8 @@ Output specifications:
   PNG (Linux):    256x256 for hicolor icon theme
 
 Requirements:
-  pip install playwright pillow
-  playwright install chromium
+  pip install resvg-py pillow
+  (or: pip install playwright pillow && playwright install chromium)
 """
     )
     parser.add_argument("svg_path", type=Path, help="Path to source SVG file")
@@ -209,18 +478,10 @@ Requirements:
     parser.add_argument("--ico-only", action="store_true", help="Only create ICO")
     parser.add_argument("--icns-only", action="store_true", help="Only create ICNS")
     parser.add_argument("--png-only", action="store_true", help="Only create PNG")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"Re-render every size instead of using {ICON_CACHE_DIR}")
     args = parser.parse_args()
 
-    # Check dependencies
-    try:
-        from PIL import Image  # noqa: F401
-    except ImportError:
-        print("Error: Pillow not installed. Run: pip install pillow")
-        sys.exit(1)
-
-    if not check_playwright():
-        sys.exit(1)
-
     svg_path = args.svg_path.resolve()
     if not svg_path.exists():
         print(f"Error: SVG file not found: {svg_path}")
@@ -236,19 +497,53 @@ Requirements:
     print(f"Output to:  {output_dir}")
     print()
 
-    if create_all or args.ico_only:
+    want_ico = create_all or args.ico_only
+    want_icns = create_all or args.icns_only
+    want_png = create_all or args.png_only
+
+    # Every format reads from one shared render pass, so overlapping sizes
+    # (e.g. 256px for both ICO and PNG) are rendered only once
+    render_sizes: set[int] = set()
+    if want_ico:
+        render_sizes |= ico_render_sizes()
+    if want_icns:
+        render_sizes |= icns_render_sizes()
+    if want_png:
+        render_sizes.add(PNG_SIZE)
+
+    # Check dependencies; Pillow is only needed to build ICO/ICNS containers
+    if want_ico or want_icns:
+        try:
+            from PIL import Image  # noqa: F401
+        except ImportError:
+            print("Error: Pillow not installed. Run: pip install pillow")
+            sys.exit(1)
+
+    backend = select_backend()
+    cache_dir = None if args.no_cache else ICON_CACHE_DIR
+    with SvgRenderer(svg_path, backend=backend, cache_dir=cache_dir) as renderer:
+        # Playwright (and Chromium) are only touched if something isn't cached
+        missing = renderer.uncached_sizes(render_sizes)
+        if missing and backend == "playwright" and not check_playwright():
+            sys.exit(1)
+        print(f"Rendering {len(missing)} of {len(render_sizes)} sizes "
+              f"({len(render_sizes) - len(missing)} cached): {sorted(render_sizes)}")
+        rendered = renderer.render_many(render_sizes)
+    print()
+
+    if want_ico:
         print("Creating Windows ICO...")
-        create_ico(svg_path, output_dir / f"{base_name}.ico")
+        create_ico(rendered, output_dir / f"{base_name}.ico")
         print()
 
-    if create_all or args.icns_only:
+    if want_icns:
         print("Creating macOS ICNS...")
-        create_icns(svg_path, output_dir / f"{base_name}.icns")
+        create_icns(rendered, output_dir / f"{base_name}.icns")
         print()
 
-    if create_all or args.png_only:
+    if want_png:
         print("Creating Linux PNG...")
-        create_png(svg_path, output_dir / f"{base_name}.png", size=256)
+        create_png(rendered, output_dir / f"{base_name}.png")
         print()
 
     print("Icon conversion complete!")
@@ -1,11 +1,30 @@
 """Build graph data structures from SymbolTable for visualization."""
 
+import json
 from dataclasses import dataclass, field
 
+try:
+    import orjson
+except ImportError:  # optional: pip install docmaker[fast]
+    orjson = None
+
 from docmaker.models import ClassDef, EndpointDef, FileSymbols, SymbolTable
 
+# Node and edge type names shared by every GraphNode/GraphEdge
+_NODE_PACKAGE = "package"
+_NODE_FILE = "file"
+_NODE_CLASS = "class"
+_NODE_INTERFACE = "interface"
+_NODE_ENDPOINT = "endpoint"
+
+_EDGE_CONTAINS = "contains"
+_EDGE_EXTENDS = "extends"
+_EDGE_IMPLEMENTS = "implements"
+_EDGE_CALLS = "calls"
+_EDGE_IMPORTS = "imports"
+
 
-@dataclass
+@dataclass(slots=True)
 class GraphNode:
     """Represents a node in the code graph."""
 
@@ -24,7 +43,7 @@ class GraphNode:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class GraphEdge:
     """Represents an edge in the code graph."""
 
@@ -41,27 +60,59 @@ class GraphEdge:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeGraph:
-    """Complete code graph with nodes and edges."""
+    """Complete code graph with nodes and edges.
+
+    Edges are stored as ``(source, target, type)`` tuples in ``edge_rows``;
+    ``GraphEdge`` objects are only materialized when ``edges`` is read. Change
+    a graph's edges with ``add_edge`` or through ``edge_rows``, which is also
+    the constructor argument; ``edges`` is a read-only snapshot.
+    """
 
     nodes: list[GraphNode] = field(default_factory=list)
-    edges: list[GraphEdge] = field(default_factory=list)
+    edge_rows: list[tuple[str, str, str]] = field(default_factory=list)
+
+    @property
+    def edges(self) -> tuple[GraphEdge, ...]:
+        """Edges as GraphEdge objects, built on access.
+
+        A tuple, so code that tries to append to it fails instead of losing the edge.
+        """
+        return tuple(GraphEdge(source, target, type_) for source, target, type_ in self.edge_rows)
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
         return {
             "nodes": [n.to_dict() for n in self.nodes],
-            "edges": [e.to_dict() for e in self.edges],
+            "edges": self._edge_dicts(),
         }
 
+    def to_json(self) -> str:
+        """Serialize to a JSON string, using orjson when it is installed."""
+        return self.dump_json().decode()
+
+    def dump_json(self) -> bytes:
+        """Serialize to UTF-8 JSON bytes, e.g. for writing straight to a file."""
+        if orjson is not None:
+            # orjson serializes the node dataclasses natively, skipping their to_dict
+            return orjson.dumps({"nodes": self.nodes, "edges": self._edge_dicts()})
+        return json.dumps(self.to_dict(), ensure_ascii=False).encode()
+
+    def _edge_dicts(self) -> list[dict]:
+        """Convert edge rows to the dictionaries sent to the frontend."""
+        return [
+            {"source": source, "target": target, "type": type_}
+            for source, target, type_ in self.edge_rows
+        ]
+
     def add_node(self, node: GraphNode) -> None:
         """Add a node to the graph."""
         self.nodes.append(node)
 
     def add_edge(self, edge: GraphEdge) -> None:
-        """Add an edge to the graph."""
-        self.edges.append(edge)
+        """Add an edge to the graph; the way to add edges, as ``edges`` is read-only."""
+        self.edge_rows.append((edge.source, edge.target, edge.type))
 
 
 class GraphBuilder:
@@ -69,210 +120,266 @@ class GraphBuilder:
 
     def __init__(self, symbol_table: SymbolTable):
         self.symbol_table = symbol_table
-        self._node_ids: set[str] = set()
-        self._package_nodes: set[str] = set()
+        # Node registry keyed by ID, in insertion order; also answers membership
+        self._nodes: dict[str, GraphNode] = {}
+        # Class node IDs per package node ID, for the package "contains" edges
+        self._package_classes: dict[str, list[str]] = {}
 
     def build(self) -> CodeGraph:
         """Build the complete code graph from the symbol table."""
-        graph = CodeGraph()
+        files = list(self.symbol_table.files.values())
+
+        # First pass: create all nodes. Edge resolution looks up classes from
+        # any file, so every node must be registered before edges are built.
+        # The class node IDs built here are reused by the edge pass.
+        file_ids = [self._add_file_nodes(file_symbols) for file_symbols in files]
+
+        # Second pass: create edges as plain tuples, appended to a local list
+        # rather than dispatched through CodeGraph.add_edge one at a time
+        edges: list[tuple[str, str, str]] = []
+        for file_symbols, (file_id, class_ids) in zip(files, file_ids):
+            self._add_file_edges(edges, file_symbols, file_id, class_ids)
+
+        # Package contains class, emitted once per package/class pair
+        for pkg_id, class_ids in self._package_classes.items():
+            edges.extend(
+                (pkg_id, class_id, _EDGE_CONTAINS) for class_id in dict.fromkeys(class_ids)
+            )
 
-        # First pass: create all nodes
-        for file_path, file_symbols in self.symbol_table.files.items():
-            self._add_file_nodes(graph, file_symbols)
+        return CodeGraph(nodes=list(self._nodes.values()), edge_rows=edges)
 
-        # Second pass: create edges
-        for file_path, file_symbols in self.symbol_table.files.items():
-            self._add_file_edges(graph, file_symbols)
+    def _add_file_nodes(self, file_symbols: FileSymbols) -> tuple[str, list[str]]:
+        """Add nodes from a single file.
 
-        return graph
+        Returns the file node ID and the file's class node IDs, in order.
+        """
+        source = file_symbols.file
+        package = file_symbols.package
+        category = source.category.value
+        # Path.__str__ is comparatively slow; format each path once per file
+        path = source.path
+        path_str = str(path)
 
-    def _add_file_nodes(self, graph: CodeGraph, file_symbols: FileSymbols) -> None:
-        """Add nodes from a single file."""
         # Add package node if not already added
-        if file_symbols.package and file_symbols.package not in self._package_nodes:
-            self._package_nodes.add(file_symbols.package)
-            graph.add_node(
-                GraphNode(
-                    id=f"pkg:{file_symbols.package}",
-                    label=file_symbols.package,
-                    type="package",
-                    metadata={"fqn": file_symbols.package},
+        if package:
+            pkg_id = f"pkg:{package}"
+            if pkg_id not in self._nodes:
+                self._nodes[pkg_id] = GraphNode(
+                    id=pkg_id,
+                    label=package,
+                    type=_NODE_PACKAGE,
+                    metadata={"fqn": package},
                 )
-            )
 
         # Add file node
-        file_id = f"file:{file_symbols.file.relative_path}"
-        if file_id not in self._node_ids:
-            self._node_ids.add(file_id)
-            graph.add_node(
-                GraphNode(
-                    id=file_id,
-                    label=file_symbols.file.relative_path.name,
-                    type="file",
-                    metadata={
-                        "path": str(file_symbols.file.path),
-                        "relativePath": str(file_symbols.file.relative_path),
-                        "language": file_symbols.file.language.value,
-                        "category": file_symbols.file.category.value,
-                    },
-                )
+        relative_path = str(source.relative_path)
+        file_id = f"file:{relative_path}"
+        if file_id not in self._nodes:
+            self._nodes[file_id] = GraphNode(
+                id=file_id,
+                label=source.relative_path.name,
+                type=_NODE_FILE,
+                metadata={
+                    "path": path_str,
+                    "relativePath": relative_path,
+                    "language": source.language.value,
+                    "category": category,
+                },
             )
 
         # Add class nodes
-        for cls in file_symbols.classes:
-            self._add_class_node(graph, cls, file_symbols)
+        class_ids = [
+            self._add_class_node(
+                cls,
+                package,
+                category,
+                path_str if cls.file_path is path else str(cls.file_path),
+            )
+            for cls in file_symbols.classes
+        ]
 
         # Add endpoint nodes
         for endpoint in file_symbols.endpoints:
-            self._add_endpoint_node(graph, endpoint, file_symbols)
-
-    def _add_class_node(self, graph: CodeGraph, cls: ClassDef, file_symbols: FileSymbols) -> None:
-        """Add a class or interface node."""
-        fqn = f"{file_symbols.package}.{cls.name}" if file_symbols.package else cls.name
-        node_id = f"class:{fqn}"
+            self._add_endpoint_node(
+                endpoint,
+                category,
+                path_str if endpoint.file_path is path else str(endpoint.file_path),
+            )
 
-        if node_id in self._node_ids:
-            return
+        if package:
+            self._package_classes.setdefault(pkg_id, []).extend(class_ids)
 
-        self._node_ids.add(node_id)
+        return file_id, class_ids
 
-        # Determine if this is an interface
-        is_interface = "interface" in cls.modifiers
+    def _add_class_node(
+        self, cls: ClassDef, package: str | None, category: str, path_str: str
+    ) -> str:
+        """Add a class or interface node and return its ID."""
+        fqn = f"{package}.{cls.name}" if package else cls.name
+        node_id = f"class:{fqn}"
 
-        graph.add_node(
-            GraphNode(
-                id=node_id,
-                label=cls.name,
-                type="interface" if is_interface else "class",
-                metadata={
-                    "fqn": fqn,
-                    "path": str(cls.file_path),
-                    "line": cls.line_number,
-                    "endLine": cls.end_line,
-                    "package": file_symbols.package or "",
-                    "modifiers": cls.modifiers,
-                    "superclass": cls.superclass,
-                    "interfaces": cls.interfaces,
-                    "methodCount": len(cls.methods),
-                    "fieldCount": len(cls.fields),
-                    "category": file_symbols.file.category.value,
-                },
-            )
+        if node_id in self._nodes:
+            return node_id
+
+        self._nodes[node_id] = GraphNode(
+            id=node_id,
+            label=cls.name,
+            type=_NODE_INTERFACE if cls.is_interface else _NODE_CLASS,
+            metadata={
+                "fqn": fqn,
+                "path": path_str,
+                "line": cls.line_number,
+                "endLine": cls.end_line,
+                "package": package or "",
+                "modifiers": cls.modifiers,
+                "superclass": cls.superclass,
+                "interfaces": cls.interfaces,
+                "methodCount": len(cls.methods),
+                "fieldCount": len(cls.fields),
+                "category": category,
+            },
         )
+        return node_id
 
-    def _add_endpoint_node(
-        self, graph: CodeGraph, endpoint: EndpointDef, file_symbols: FileSymbols
-    ) -> None:
+    def _add_endpoint_node(self, endpoint: EndpointDef, category: str, path_str: str) -> None:
         """Add an endpoint node."""
-        node_id = f"endpoint:{endpoint.http_method}:{endpoint.path}"
+        http_method = endpoint.http_method
+        path = endpoint.path
+        node_id = f"endpoint:{http_method}:{path}"
 
-        if node_id in self._node_ids:
+        if node_id in self._nodes:
             return
 
-        self._node_ids.add(node_id)
-
-        graph.add_node(
-            GraphNode(
-                id=node_id,
-                label=f"{endpoint.http_method} {endpoint.path}",
-                type="endpoint",
-                metadata={
-                    "method": endpoint.http_method,
-                    "path": endpoint.path,
-                    "handler": f"{endpoint.handler_class}.{endpoint.handler_method}",
-                    "filePath": str(endpoint.file_path),
-                    "line": endpoint.line_number,
-                    "category": file_symbols.file.category.value,
-                },
-            )
+        self._nodes[node_id] = GraphNode(
+            id=node_id,
+            label=f"{http_method} {path}",
+            type=_NODE_ENDPOINT,
+            metadata={
+                "method": http_method,
+                "path": path,
+                "handler": f"{endpoint.handler_class}.{endpoint.handler_method}",
+                "filePath": path_str,
+                "line": endpoint.line_number,
+                "category": category,
+            },
         )
 
-    def _add_file_edges(self, graph: CodeGraph, file_symbols: FileSymbols) -> None:
-        """Add edges for relationships in a file."""
-        file_id = f"file:{file_symbols.file.relative_path}"
+    def _add_file_edges(
+        self,
+        edges: list[tuple[str, str, str]],
+        file_symbols: FileSymbols,
+        file_id: str,
+        class_ids: list[str],
+    ) -> None:
+        """Add edges for relationships in a file.
+
+        ``class_ids`` holds the node IDs of ``file_symbols.classes``, in order.
+        """
+        nodes = self._nodes
+        class_index = self.symbol_table.class_index
+        package = file_symbols.package
+        import_index = self._build_import_index(file_symbols)
+
+        # The same names recur across classes and call sites, so memoize per file
+        resolved: dict[str, str | None] = {}
+
+        def resolve(class_name: str) -> str | None:
+            if class_name not in resolved:
+                resolved[class_name] = self._resolve_class_id(
+                    class_name, file_symbols, import_index
+                )
+            return resolved[class_name]
 
         # File contains classes
-        for cls in file_symbols.classes:
-            fqn = f"{file_symbols.package}.{cls.name}" if file_symbols.package else cls.name
-            class_id = f"class:{fqn}"
-            graph.add_edge(GraphEdge(source=file_id, target=class_id, type="contains"))
-
-            # Package contains class
-            if file_symbols.package:
-                pkg_id = f"pkg:{file_symbols.package}"
-                graph.add_edge(GraphEdge(source=pkg_id, target=class_id, type="contains"))
+        for cls, class_id in zip(file_symbols.classes, class_ids):
+            edges.append((file_id, class_id, _EDGE_CONTAINS))
 
             # Class extends superclass
             if cls.superclass:
-                superclass_id = self._resolve_class_id(cls.superclass, file_symbols)
+                superclass_id = resolve(cls.superclass)
                 if superclass_id:
-                    graph.add_edge(GraphEdge(source=class_id, target=superclass_id, type="extends"))
+                    edges.append((class_id, superclass_id, _EDGE_EXTENDS))
 
             # Class implements interfaces
             for interface in cls.interfaces:
-                interface_id = self._resolve_class_id(interface, file_symbols)
+                interface_id = resolve(interface)
                 if interface_id:
-                    graph.add_edge(
-                        GraphEdge(source=class_id, target=interface_id, type="implements")
-                    )
+                    edges.append((class_id, interface_id, _EDGE_IMPLEMENTS))
 
         # Add calls edges from constructor instantiations
-        for cls in file_symbols.classes:
-            fqn = f"{file_symbols.package}.{cls.name}" if file_symbols.package else cls.name
-            class_id = f"class:{fqn}"
+        # (one edge per class/target pair, however many call sites there are)
+        for cls, class_id in zip(file_symbols.classes, class_ids):
+            called: set[str] = set()
             for method in cls.methods:
                 for callee in method.calls:
-                    target_id = self._resolve_class_id(callee, file_symbols)
-                    if target_id:
-                        graph.add_edge(GraphEdge(source=class_id, target=target_id, type="calls"))
-
-        # Add import edges
+                    target_id = resolve(callee)
+                    if target_id and target_id not in called:
+                        called.add(target_id)
+                        edges.append((class_id, target_id, _EDGE_CALLS))
+
+        # Add import edges, skipping modules imported more than once. Whether an
+        # import names a known class is checked once per import, not per class.
+        imported: set[str] = set()
         for imp in file_symbols.imports:
-            if not imp.is_wildcard:
-                target_id = f"class:{imp.module}"
-                if target_id in self._node_ids or self._class_exists(imp.module):
-                    for cls in file_symbols.classes:
-                        fqn = (
-                            f"{file_symbols.package}.{cls.name}"
-                            if file_symbols.package
-                            else cls.name
-                        )
-                        class_id = f"class:{fqn}"
-                        graph.add_edge(GraphEdge(source=class_id, target=target_id, type="imports"))
+            if imp.is_wildcard or not class_ids:
+                continue
+            target_id = f"class:{imp.module}"
+            if target_id in imported:
+                continue
+            imported.add(target_id)
+            if target_id in nodes or imp.module in class_index:
+                for class_id in class_ids:
+                    edges.append((class_id, target_id, _EDGE_IMPORTS))
 
         # Endpoint handled by class
         for endpoint in file_symbols.endpoints:
             endpoint_id = f"endpoint:{endpoint.http_method}:{endpoint.path}"
             handler_fqn = (
-                f"{file_symbols.package}.{endpoint.handler_class}"
-                if file_symbols.package
-                else endpoint.handler_class
+                f"{package}.{endpoint.handler_class}" if package else endpoint.handler_class
             )
             handler_id = f"class:{handler_fqn}"
-            if handler_id in self._node_ids:
-                graph.add_edge(GraphEdge(source=handler_id, target=endpoint_id, type="contains"))
+            if handler_id in nodes:
+                edges.append((handler_id, endpoint_id, _EDGE_CONTAINS))
+
+    def _build_import_index(self, file_symbols: FileSymbols) -> dict[str, str]:
+        """Map class names to the imported modules that define known classes.
 
-    def _resolve_class_id(self, class_name: str, file_symbols: FileSymbols) -> str | None:
+        Every dotted suffix of a module is indexed, so nested names such as
+        ``Outer.Inner`` resolve as well as short ones.
+        """
+        nodes = self._nodes
+        import_index: dict[str, str] = {}
+        for imp in file_symbols.imports:
+            module = imp.module
+            if imp.is_wildcard or f"class:{module}" not in nodes:
+                continue
+            dot = module.find(".")
+            while dot != -1:
+                import_index.setdefault(module[dot + 1 :], module)
+                dot = module.find(".", dot + 1)
+        return import_index
+
+    def _resolve_class_id(
+        self, class_name: str, file_symbols: FileSymbols, import_index: dict[str, str]
+    ) -> str | None:
         """Resolve a class name to its node ID using imports."""
+        nodes = self._nodes
+
         # Check if it's already a fully qualified name
-        if f"class:{class_name}" in self._node_ids:
-            return f"class:{class_name}"
+        class_id = f"class:{class_name}"
+        if class_id in nodes:
+            return class_id
 
         # Check imports for the class
-        for imp in file_symbols.imports:
-            if imp.module.endswith(f".{class_name}"):
-                if f"class:{imp.module}" in self._node_ids:
-                    return f"class:{imp.module}"
+        module = import_index.get(class_name)
+        if module:
+            return f"class:{module}"
 
         # Check same package
         if file_symbols.package:
-            same_pkg_fqn = f"{file_symbols.package}.{class_name}"
-            if f"class:{same_pkg_fqn}" in self._node_ids:
-                return f"class:{same_pkg_fqn}"
+            same_pkg_id = f"class:{file_symbols.package}.{class_name}"
+            if same_pkg_id in nodes:
+                return same_pkg_id
 
         # Return unresolved ID (will create edge even if target doesn't exist in our graph)
-        return f"class:{class_name}"
-
-    def _class_exists(self, fqn: str) -> bool:
-        """Check if a class exists in the symbol table."""
-        return fqn in self.symbol_table.class_index
+        return class_id
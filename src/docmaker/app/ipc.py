@@ -1,9 +1,17 @@
 """IPC bridges for communication between Python backend and frontend."""
 
+import copy
 import json
 import logging
+import multiprocessing
+import shutil
 import subprocess
 import sys
+import uuid
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 
 import httpx
@@ -17,25 +25,172 @@ from docmaker.app.settings import (
     reset_settings,
     save_settings,
 )
+from docmaker.cache import SymbolCache
 from docmaker.config import DocmakerConfig, LLMConfig
 from docmaker.crawler import FileCrawler
 from docmaker.llm import create_llm_provider
-from docmaker.models import FileCategory, SourceFile, SymbolTable
-from docmaker.parser.registry import get_parser_registry
+from docmaker.models import (
+    ClassDef,
+    EndpointDef,
+    FileCategory,
+    FileSymbols,
+    SourceFile,
+    SymbolTable,
+)
+from docmaker.parser.registry import get_parser_registry, parse_file
 from docmaker.pipeline import Pipeline
 
+try:
+    import orjson
+except ImportError:  # optional: pip install docmaker[fast]
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Below this many files, parsing in-process beats starting worker processes
+PARALLEL_PARSE_MIN_FILES = 64
+
+# Files handed to a parse worker per round trip
+PARSE_CHUNK_SIZE = 32
+
+# Long-running bridges that can be started as background jobs
+JOB_BRIDGES = frozenset({"scan_project", "generate_docs", "parse_only"})
+
+# Known editors: (name for logs, command with a line number, command without one)
+_EDITORS: dict[str, tuple[str, Callable[[str, int], list[str]], Callable[[str], list[str]]]] = {
+    "vscode": ("VS Code", lambda p, n: ["code", "--goto", f"{p}:{n}"], lambda p: ["code", p]),
+    "idea": ("IntelliJ IDEA", lambda p, n: ["idea", "--line", str(n), p], lambda p: ["idea", p]),
+    "sublime": ("Sublime Text", lambda p, n: ["subl", f"{p}:{n}"], lambda p: ["subl", p]),
+}
+
+# Absolute paths of editor executables already found on PATH, by command name
+_EXECUTABLE_PATHS: dict[str, str] = {}
+
+
+def _dumps(obj) -> str:
+    """Encode a bridge payload as JSON, using orjson when it is installed.
+
+    Paths and other non-JSON values are encoded with ``str()``.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, default=str)
+
+
+def _loads(data: str):
+    """Decode a JSON bridge argument, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _spawn(cmd: list[str]) -> None:
+    """Start an editor command, resolving its executable on PATH once per name.
+
+    Raises:
+        FileNotFoundError: If the executable is not on PATH
+    """
+    name = cmd[0]
+    executable = _EXECUTABLE_PATHS.get(name)
+    if executable is None:
+        executable = shutil.which(name)
+        if executable is None:
+            raise FileNotFoundError(f"Executable not found: {name}")
+        _EXECUTABLE_PATHS[name] = executable
+    try:
+        subprocess.Popen([executable, *cmd[1:]])
+    except FileNotFoundError:
+        # Removed since it was resolved; look it up again next time
+        _EXECUTABLE_PATHS.pop(name, None)
+        raise
+
+
+def _class_details(fqn: str, cls: ClassDef) -> dict:
+    """Build the details payload for a class."""
+    return {
+        "name": cls.name,
+        "fqn": fqn,
+        "path": cls.file_path,
+        "line": cls.line_number,
+        "endLine": cls.end_line,
+        "superclass": cls.superclass,
+        "interfaces": cls.interfaces,
+        "modifiers": cls.modifiers,
+        "docstring": cls.docstring,
+        "methods": [
+            {
+                "name": m.name,
+                "returnType": m.return_type,
+                "parameters": [{"name": p.name, "type": p.type} for p in m.parameters],
+                "modifiers": m.modifiers,
+                "line": m.line_number,
+                "endLine": m.end_line,
+                "docstring": m.docstring,
+                "annotations": [{"name": a.name, "arguments": a.arguments} for a in m.annotations],
+            }
+            for m in cls.methods
+        ],
+        "fields": [
+            {
+                "name": f.name,
+                "type": f.type,
+                "modifiers": f.modifiers,
+                "line": f.line_number,
+                "annotations": [{"name": a.name, "arguments": a.arguments} for a in f.annotations],
+            }
+            for f in cls.fields
+        ],
+    }
+
+
+def _endpoint_details(endpoint: EndpointDef) -> dict:
+    """Build the details payload for an endpoint."""
+    return {
+        "httpMethod": endpoint.http_method,
+        "path": endpoint.path,
+        "handlerClass": endpoint.handler_class,
+        "handlerMethod": endpoint.handler_method,
+        "filePath": endpoint.file_path,
+        "line": endpoint.line_number,
+        "parameters": [
+            {"name": p.name, "type": p.type, "description": p.description}
+            for p in endpoint.parameters
+        ],
+        "requestBody": endpoint.request_body,
+        "responseType": endpoint.response_type,
+        "description": endpoint.description,
+    }
+
+
+def _mtime_ns(path: Path) -> int | None:
+    """Return a file's modification time, or None if it does not exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
 
 class DocmakerAPI(PyloidIPC):
     """API exposed to the frontend via IPC bridges."""
 
-    def __init__(self):
+    def __init__(self, symbol_cache: SymbolCache | None = None):
         super().__init__()
         self._current_project: Path | None = None
         self._symbol_table: SymbolTable | None = None
         self._config: DocmakerConfig | None = None
         self._files: list[SourceFile] = []
+        self._symbol_cache = symbol_cache if symbol_cache is not None else SymbolCache()
+        # (symbol table, its version) the encoded details below were built from
+        self._details_key: tuple[SymbolTable | None, int] = (None, 0)
+        # Encoded detail payloads, keyed by "class:<name>" or "endpoint:<key>"
+        self._details_json: dict[str, str] = {}
+        # (symbol table, its version, encoded graph) from the last get_graph_data
+        self._graph_cache: tuple[SymbolTable, int, str] | None = None
+        # Config and crawler per project, with the mtimes of the files they were read from
+        self._projects: dict[Path, tuple[tuple[int | None, ...], DocmakerConfig, FileCrawler]] = {}
+        # One worker, so jobs that replace the project state never overlap
+        self._job_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="docmaker-job")
+        self._jobs: dict[str, Future[str]] = {}
 
     @Bridge(result=str)
     def select_folder(self) -> str:
@@ -54,12 +209,12 @@ class DocmakerAPI(PyloidIPC):
             )
             if selected:
                 logger.info("Folder selected: %s", selected)
-                return json.dumps({"path": selected})
+                return _dumps({"path": selected})
             logger.debug("Folder selection cancelled")
-            return json.dumps({"path": None})
+            return _dumps({"path": None})
         except Exception as e:
             logger.exception("Error opening folder dialog")
-            return json.dumps({"error": str(e)})
+            return _dumps({"error": str(e)})
 
     @Bridge(str, result=str)
     def scan_project(self, path: str) -> str:
@@ -76,52 +231,41 @@ class DocmakerAPI(PyloidIPC):
             project_path = Path(path).resolve()
             if not project_path.exists():
                 logger.error("Path does not exist: %s", path)
-                return json.dumps({"error": f"Path does not exist: {path}"})
+                return _dumps({"error": f"Path does not exist: {path}"})
 
             if not project_path.is_dir():
                 logger.error("Path is not a directory: %s", path)
-                return json.dumps({"error": f"Path is not a directory: {path}"})
+                return _dumps({"error": f"Path is not a directory: {path}"})
 
-            self._current_project = project_path
-            self._config = DocmakerConfig.load(project_path / "docmaker.yaml")
-            self._config.source_dir = project_path
-            self._apply_user_llm_settings()
-
-            crawler = FileCrawler(self._config)
-            self._files = crawler.crawl()
-
-            # Build statistics
-            by_language: dict[str, int] = {}
-            by_category: dict[str, int] = {}
-
-            file_list = []
-            for f in self._files:
-                lang = f.language.value
-                cat = f.category.value
-                by_language[lang] = by_language.get(lang, 0) + 1
-                by_category[cat] = by_category.get(cat, 0) + 1
-
-                file_list.append(
-                    {
-                        "path": str(f.relative_path),
-                        "language": lang,
-                        "category": cat,
-                        "size": f.size_bytes,
-                    }
-                )
+            config, crawler = self._load_project(project_path)
+            files = crawler.crawl()
 
+            # Build statistics; files are (path, language, category, size) rows
+            file_list = [
+                (str(f.relative_path), f.language.value, f.category.value, f.size_bytes)
+                for f in files
+            ]
+            by_language = dict(Counter(map(itemgetter(1), file_list)))
+            by_category = dict(Counter(map(itemgetter(2), file_list)))
+
+            total_files = len(file_list)
             logger.info(
                 "Scan complete: %d files found (%s)",
-                len(self._files),
+                total_files,
                 ", ".join(f"{k}:{v}" for k, v in by_language.items()),
             )
 
-            return json.dumps(
+            # Publish only finished results; UI-thread bridges read these while jobs run
+            self._current_project = project_path
+            self._config = config
+            self._files = files
+
+            return _dumps(
                 {
                     "projectPath": str(project_path),
                     "files": file_list,
                     "stats": {
-                        "totalFiles": len(self._files),
+                        "totalFiles": total_files,
                         "byLanguage": by_language,
                         "byCategory": by_category,
                     },
@@ -130,7 +274,7 @@ class DocmakerAPI(PyloidIPC):
 
         except Exception as e:
             logger.exception("Error scanning project")
-            return json.dumps({"error": str(e)})
+            return _dumps({"error": str(e)})
 
     @Bridge(str, result=str)
     def generate_docs(self, options_json: str) -> str:
@@ -146,13 +290,13 @@ class DocmakerAPI(PyloidIPC):
         """
         logger.info("generate_docs called with options: %s", options_json)
         try:
-            options = json.loads(options_json)
+            options = _loads(options_json)
             incremental = options.get("incremental", False)
             use_llm = options.get("useLlm", False)
 
             if not self._current_project or not self._config:
                 logger.error("No project loaded")
-                return json.dumps({"error": "No project loaded. Call scan_project first."})
+                return _dumps({"error": "No project loaded. Call scan_project first."})
 
             self._config.llm.enabled = use_llm
 
@@ -163,34 +307,37 @@ class DocmakerAPI(PyloidIPC):
 
             console = Console(file=StringIO(), force_terminal=False)
 
-            pipeline = Pipeline(self._config, console)
+            pipeline = Pipeline(self._config, console, symbol_cache=self._symbol_cache)
             generated = pipeline.run(incremental=incremental)
 
             # Store the symbol table for graph building
             self._symbol_table = pipeline.symbol_table
 
+            n_files = len(pipeline.symbol_table.files)
+            n_classes = len(pipeline.symbol_table.class_index)
+            n_endpoints = len(pipeline.symbol_table.endpoint_index)
             logger.info(
                 "Documentation generated: %d files, %d classes, %d endpoints",
-                len(pipeline.symbol_table.files),
-                len(pipeline.symbol_table.class_index),
-                len(pipeline.symbol_table.endpoint_index),
+                n_files,
+                n_classes,
+                n_endpoints,
             )
 
-            return json.dumps(
+            return _dumps(
                 {
                     "success": True,
-                    "generatedFiles": [str(p) for p in generated],
+                    "generatedFiles": generated,
                     "stats": {
-                        "filesProcessed": len(pipeline.symbol_table.files),
-                        "classesFound": len(pipeline.symbol_table.class_index),
-                        "endpointsFound": len(pipeline.symbol_table.endpoint_index),
+                        "filesProcessed": n_files,
+                        "classesFound": n_classes,
+                        "endpointsFound": n_endpoints,
                     },
                 }
             )
 
         except Exception as e:
             logger.exception("Error generating docs")
-            return json.dumps({"error": str(e)})
+            return _dumps({"error": str(e)})
 
     @Bridge(result=str)
     def get_graph_data(self) -> str:
@@ -201,16 +348,23 @@ class DocmakerAPI(PyloidIPC):
         """
         try:
             if not self._symbol_table:
-                return json.dumps({"error": "No symbol table available. Run generate_docs first."})
+                return _dumps({"error": "No symbol table available. Run generate_docs first."})
+
+            table = self._symbol_table
+            cached = self._graph_cache
+            if cached and cached[0] is table and cached[1] == table.version:
+                return cached[2]
 
-            builder = GraphBuilder(self._symbol_table)
+            builder = GraphBuilder(table)
             graph = builder.build()
 
-            return json.dumps(graph.to_dict())
+            encoded = graph.to_json()
+            self._graph_cache = (table, table.version, encoded)
+            return encoded
 
         except Exception as e:
             logger.exception("Error building graph")
-            return json.dumps({"error": str(e)})
+            return _dumps({"error": str(e)})
 
     @Bridge(str, result=str)
     def parse_only(self, path: str) -> str:
@@ -227,63 +381,143 @@ class DocmakerAPI(PyloidIPC):
             project_path = Path(path).resolve()
             if not project_path.exists():
                 logger.error("Path does not exist: %s", path)
-                return json.dumps({"error": f"Path does not exist: {path}"})
+                return _dumps({"error": f"Path does not exist: {path}"})
 
-            self._current_project = project_path
-            self._config = DocmakerConfig.load(project_path / "docmaker.yaml")
-            self._config.source_dir = project_path
-            self._apply_user_llm_settings()
+            config, crawler = self._load_project(project_path)
 
             # Crawl files
-            crawler = FileCrawler(self._config)
-            self._files = crawler.crawl()
+            files = crawler.crawl()
 
             # Filter to parseable files
             relevant_files = [
-                f for f in self._files if f.category not in (FileCategory.IGNORE, FileCategory.TEST)
+                f for f in files if f.category not in (FileCategory.IGNORE, FileCategory.TEST)
             ]
 
-            # Parse files
+            # Parse files into a table of our own, so readers never see it half filled
             logger.debug("Parsing %d relevant files", len(relevant_files))
             parser_registry = get_parser_registry()
-            self._symbol_table = SymbolTable()
+            table = SymbolTable()
+
+            parseable = [f for f in relevant_files if parser_registry.can_parse(f)]
+
+            # Reuse symbols cached from earlier runs and only parse changed files
+            file_symbols = [self._symbol_cache.get(f) for f in parseable]
+            misses = [i for i, symbols in enumerate(file_symbols) if symbols is None]
+            logger.debug(
+                "Symbol cache: %d hits, %d misses", len(parseable) - len(misses), len(misses)
+            )
 
-            for file in relevant_files:
-                if parser_registry.can_parse(file):
-                    logger.debug("Parsing file: %s", file.relative_path)
-                    symbols = parser_registry.parse(file)
-                    if symbols:
-                        self._symbol_table.add_file_symbols(symbols)
+            parsed = self._parse_files([parseable[i] for i in misses], parser_registry)
+            for i, symbols in zip(misses, parsed):
+                if symbols:
+                    file_symbols[i] = symbols
+                    self._symbol_cache.put(parseable[i], symbols)
+
+            for symbols in file_symbols:
+                if symbols:
+                    table.add_file_symbols(symbols)
 
             # Build graph
             logger.debug("Building graph from symbol table")
-            builder = GraphBuilder(self._symbol_table)
+            builder = GraphBuilder(table)
             graph = builder.build()
 
+            stats = {
+                "filesScanned": len(files),
+                "filesParsed": len(table.files),
+                "classesFound": len(table.class_index),
+                "endpointsFound": len(table.endpoint_index),
+                "cacheHits": len(parseable) - len(misses),
+                "cacheMisses": len(misses),
+            }
             logger.info(
                 "Parse complete: %d files scanned, %d parsed, %d classes, %d endpoints",
-                len(self._files),
-                len(self._symbol_table.files),
-                len(self._symbol_table.class_index),
-                len(self._symbol_table.endpoint_index),
+                stats["filesScanned"],
+                stats["filesParsed"],
+                stats["classesFound"],
+                stats["endpointsFound"],
             )
 
-            return json.dumps(
-                {
-                    "success": True,
-                    "stats": {
-                        "filesScanned": len(self._files),
-                        "filesParsed": len(self._symbol_table.files),
-                        "classesFound": len(self._symbol_table.class_index),
-                        "endpointsFound": len(self._symbol_table.endpoint_index),
-                    },
-                    "graph": graph.to_dict(),
-                }
-            )
+            # Encode the graph once, straight from its rows, and keep it for get_graph_data
+            encoded_graph = graph.to_json()
+
+            # Publish only finished results; UI-thread bridges read these while jobs run
+            self._current_project = project_path
+            self._config = config
+            self._files = files
+            self._graph_cache = (table, table.version, encoded_graph)
+            self._symbol_table = table
+            return f'{{"success": true, "stats": {_dumps(stats)}, "graph": {encoded_graph}}}'
 
         except Exception as e:
             logger.exception("Error parsing project")
-            return json.dumps({"error": str(e)})
+            return _dumps({"error": str(e)})
+
+    def _parse_files(self, files: list[SourceFile], parser_registry) -> list[FileSymbols | None]:
+        """Parse files, using worker processes for large batches.
+
+        Args:
+            files: Files the registry can parse
+            parser_registry: Registry used for in-process parsing
+
+        Returns:
+            Parsed symbols (or None on failure) for each file, in order
+        """
+        if len(files) < PARALLEL_PARSE_MIN_FILES:
+            return [parser_registry.parse(f) for f in files]
+
+        # Parsing is CPU-bound and independent per file, so spread it over
+        # processes; results are merged by the caller on the main thread.
+        # Spawn rather than fork: this runs on a job thread of a threaded Qt process,
+        # and parse_file lives outside this module so workers never import Qt
+        logger.debug("Parsing %d files in worker processes", len(files))
+        spawn = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(mp_context=spawn) as executor:
+            return list(executor.map(parse_file, files, chunksize=PARSE_CHUNK_SIZE))
+
+    @Bridge(str, str, result=str)
+    def start_job(self, name: str, arg: str) -> str:
+        """Run a long bridge on a background thread so the UI stays responsive.
+
+        Args:
+            name: Bridge to run, one of JOB_BRIDGES
+            arg: The bridge's single string argument
+
+        Returns:
+            JSON string with the job ID to pass to get_job_result
+        """
+        if name not in JOB_BRIDGES:
+            return _dumps({"error": f"Not a job bridge: {name}"})
+
+        job_id = uuid.uuid4().hex
+        self._jobs[job_id] = self._job_executor.submit(getattr(self, name), arg)
+        logger.debug("Started job %s: %s", job_id, name)
+        return _dumps({"jobId": job_id})
+
+    @Bridge(str, result=str)
+    def get_job_result(self, job_id: str) -> str:
+        """Poll a job started with start_job.
+
+        Args:
+            job_id: ID returned by start_job
+
+        Returns:
+            JSON string with "done"; once true, "result" holds the bridge's
+            response and the job is forgotten
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            return _dumps({"error": f"Unknown job: {job_id}"})
+        if not job.done():
+            return '{"done": false}'
+
+        del self._jobs[job_id]
+        try:
+            result = job.result()
+        except Exception as e:
+            logger.exception("Job %s failed", job_id)
+            result = _dumps({"error": str(e)})
+        return f'{{"done": true, "result": {result}}}'
 
     @Bridge(str, int, result=str)
     def open_file(self, path: str, line: int) -> str:
@@ -299,26 +533,19 @@ class DocmakerAPI(PyloidIPC):
         try:
             file_path = Path(path)
             if not file_path.exists():
-                return json.dumps({"error": f"File does not exist: {path}"})
+                return _dumps({"error": f"File does not exist: {path}"})
 
             settings = load_settings()
             cmd_template, editor_type = get_editor_command(settings)
 
             # If alwaysAsk is true, signal frontend to show picker
             if editor_type == "ask":
-                return json.dumps({"success": False, "askUser": True})
+                return _dumps({"success": False, "askUser": True})
 
-            # Handle auto-detect: try VS Code first, then system default
-            if editor_type == "auto":
-                try:
-                    if line > 0:
-                        subprocess.Popen(["code", "--goto", f"{path}:{line}"])
-                    else:
-                        subprocess.Popen(["code", path])
-                    return json.dumps({"success": True, "editor": "vscode"})
-                except FileNotFoundError:
-                    # Fall through to system default
-                    editor_type = "system"
+            # Auto-detect: try VS Code quietly, then the system default
+            auto = editor_type == "auto"
+            if auto:
+                editor_type = "vscode"
 
             # Handle custom command with placeholders
             if cmd_template and editor_type == "custom":
@@ -328,45 +555,21 @@ class DocmakerAPI(PyloidIPC):
                     part = part.replace("{line}", str(line if line > 0 else 1))
                     cmd.append(part)
                 try:
-                    subprocess.Popen(cmd)
-                    return json.dumps({"success": True, "editor": "custom"})
+                    _spawn(cmd)
+                    return _dumps({"success": True, "editor": "custom"})
                 except FileNotFoundError:
                     logger.warning("Custom editor command not found: %s", cmd[0])
-                    editor_type = "system"
 
             # Handle specific editors
-            if editor_type == "vscode":
-                try:
-                    if line > 0:
-                        subprocess.Popen(["code", "--goto", f"{path}:{line}"])
-                    else:
-                        subprocess.Popen(["code", path])
-                    return json.dumps({"success": True, "editor": "vscode"})
-                except FileNotFoundError:
-                    logger.warning("VS Code not found, falling back to system")
-                    editor_type = "system"
-
-            elif editor_type == "idea":
-                try:
-                    if line > 0:
-                        subprocess.Popen(["idea", "--line", str(line), path])
-                    else:
-                        subprocess.Popen(["idea", path])
-                    return json.dumps({"success": True, "editor": "idea"})
-                except FileNotFoundError:
-                    logger.warning("IntelliJ IDEA not found, falling back to system")
-                    editor_type = "system"
-
-            elif editor_type == "sublime":
+            editor = _EDITORS.get(editor_type)
+            if editor:
+                name, with_line, without_line = editor
                 try:
-                    if line > 0:
-                        subprocess.Popen(["subl", f"{path}:{line}"])
-                    else:
-                        subprocess.Popen(["subl", path])
-                    return json.dumps({"success": True, "editor": "sublime"})
+                    _spawn(with_line(path, line) if line > 0 else without_line(path))
+                    return _dumps({"success": True, "editor": editor_type})
                 except FileNotFoundError:
-                    logger.warning("Sublime Text not found, falling back to system")
-                    editor_type = "system"
+                    if not auto:
+                        logger.warning("%s not found, falling back to system", name)
 
             # System default fallback
             if sys.platform == "win32":
@@ -374,15 +577,15 @@ class DocmakerAPI(PyloidIPC):
 
                 os.startfile(path)
             elif sys.platform == "darwin":
-                subprocess.Popen(["open", path])
+                _spawn(["open", path])
             else:
-                subprocess.Popen(["xdg-open", path])
+                _spawn(["xdg-open", path])
 
-            return json.dumps({"success": True, "editor": "system"})
+            return _dumps({"success": True, "editor": "system"})
 
         except Exception as e:
             logger.exception("Error opening file")
-            return json.dumps({"error": str(e)})
+            return _dumps({"error": str(e)})
 
     @Bridge(result=str)
     def get_project_info(self) -> str:
@@ -392,9 +595,9 @@ class DocmakerAPI(PyloidIPC):
             JSON string with project information
         """
         if not self._current_project:
-            return json.dumps({"loaded": False})
+            return _dumps({"loaded": False})
 
-        return json.dumps(
+        return _dumps(
             {
                 "loaded": True,
                 "path": str(self._current_project),
@@ -424,62 +627,24 @@ class DocmakerAPI(PyloidIPC):
         """
         try:
             if not self._symbol_table:
-                return json.dumps({"error": "No symbol table available"})
-
-            cls = self._symbol_table.class_index.get(class_fqn)
-            if not cls:
-                for fqn, class_def in self._symbol_table.class_index.items():
-                    if class_def.name == class_fqn or fqn.endswith(f".{class_fqn}"):
-                        cls = class_def
-                        class_fqn = fqn
-                        break
-            if not cls:
-                return json.dumps({"error": f"Class not found: {class_fqn}"})
-
-            return json.dumps(
-                {
-                    "name": cls.name,
-                    "fqn": class_fqn,
-                    "path": str(cls.file_path),
-                    "line": cls.line_number,
-                    "endLine": cls.end_line,
-                    "superclass": cls.superclass,
-                    "interfaces": cls.interfaces,
-                    "modifiers": cls.modifiers,
-                    "docstring": cls.docstring,
-                    "methods": [
-                        {
-                            "name": m.name,
-                            "returnType": m.return_type,
-                            "parameters": [{"name": p.name, "type": p.type} for p in m.parameters],
-                            "modifiers": m.modifiers,
-                            "line": m.line_number,
-                            "endLine": m.end_line,
-                            "docstring": m.docstring,
-                            "annotations": [
-                                {"name": a.name, "arguments": a.arguments} for a in m.annotations
-                            ],
-                        }
-                        for m in cls.methods
-                    ],
-                    "fields": [
-                        {
-                            "name": f.name,
-                            "type": f.type,
-                            "modifiers": f.modifiers,
-                            "line": f.line_number,
-                            "annotations": [
-                                {"name": a.name, "arguments": a.arguments} for a in f.annotations
-                            ],
-                        }
-                        for f in cls.fields
-                    ],
-                }
-            )
+                return _dumps({"error": "No symbol table available"})
+
+            cache = self._details_cache()
+            cached = cache.get(f"class:{class_fqn}")
+            if cached is not None:
+                return cached
+
+            found = self._symbol_table.find_class(class_fqn)
+            if not found:
+                return _dumps({"error": f"Class not found: {class_fqn}"})
+
+            result = _dumps(_class_details(*found))
+            cache[f"class:{class_fqn}"] = result
+            return result
 
         except Exception as e:
             logger.exception("Error getting class details")
-            return json.dumps({"error": str(e)})
+            return _dumps({"error": str(e)})
 
     @Bridge(str, result=str)
     def get_endpoint_details(self, endpoint_key: str) -> str:
@@ -493,33 +658,72 @@ class DocmakerAPI(PyloidIPC):
         """
         try:
             if not self._symbol_table:
-                return json.dumps({"error": "No symbol table available"})
+                return _dumps({"error": "No symbol table available"})
+
+            cache = self._details_cache()
+            cached = cache.get(f"endpoint:{endpoint_key}")
+            if cached is not None:
+                return cached
 
             endpoint = self._symbol_table.endpoint_index.get(endpoint_key)
             if not endpoint:
-                return json.dumps({"error": f"Endpoint not found: {endpoint_key}"})
+                return _dumps({"error": f"Endpoint not found: {endpoint_key}"})
 
-            return json.dumps(
-                {
-                    "httpMethod": endpoint.http_method,
-                    "path": endpoint.path,
-                    "handlerClass": endpoint.handler_class,
-                    "handlerMethod": endpoint.handler_method,
-                    "filePath": str(endpoint.file_path),
-                    "line": endpoint.line_number,
-                    "parameters": [
-                        {"name": p.name, "type": p.type, "description": p.description}
-                        for p in endpoint.parameters
-                    ],
-                    "requestBody": endpoint.request_body,
-                    "responseType": endpoint.response_type,
-                    "description": endpoint.description,
-                }
-            )
+            result = _dumps(_endpoint_details(endpoint))
+            cache[f"endpoint:{endpoint_key}"] = result
+            return result
 
         except Exception as e:
             logger.exception("Error getting endpoint details")
-            return json.dumps({"error": str(e)})
+            return _dumps({"error": str(e)})
+
+    def _details_cache(self) -> dict[str, str]:
+        """Return the encoded-details cache, emptied if the symbol table was replaced or changed."""
+        table = self._symbol_table
+        cached_table, cached_version = self._details_key
+        if cached_table is not table or cached_version != table.version:
+            self._details_key = (table, table.version)
+            self._details_json = {}
+        return self._details_json
+
+    @Bridge(str, result=str)
+    def get_details_bulk(self, keys_json: str) -> str:
+        """Get details for many classes and endpoints in one call.
+
+        Args:
+            keys_json: JSON object with "classes" (FQNs or short names) and
+                "endpoints" (keys in format "METHOD:path") lists
+
+        Returns:
+            JSON string with "classes" and "endpoints" objects keyed by the
+            requested keys; keys that are not found map to an error object
+        """
+        try:
+            if not self._symbol_table:
+                return _dumps({"error": "No symbol table available"})
+
+            keys = _loads(keys_json)
+            classes = {}
+            for key in keys.get("classes", []):
+                found = self._symbol_table.find_class(key)
+                classes[key] = (
+                    _class_details(*found) if found else {"error": f"Class not found: {key}"}
+                )
+
+            endpoints = {}
+            for key in keys.get("endpoints", []):
+                endpoint = self._symbol_table.endpoint_index.get(key)
+                endpoints[key] = (
+                    _endpoint_details(endpoint)
+                    if endpoint
+                    else {"error": f"Endpoint not found: {key}"}
+                )
+
+            return _dumps({"classes": classes, "endpoints": endpoints})
+
+        except Exception as e:
+            logger.exception("Error getting bulk details")
+            return _dumps({"error": str(e)})
 
     @Bridge(result=str)
     def get_settings(self) -> str:
@@ -530,10 +734,10 @@ class DocmakerAPI(PyloidIPC):
         """
         try:
             settings = load_settings()
-            return json.dumps(settings)
+            return _dumps(settings)
         except Exception as e:
             logger.exception("Error loading settings")
-            return json.dumps({"error": str(e)})
+            return _dumps({"error": str(e)})
 
     @Bridge(str, result=str)
     def save_settings_ipc(self, settings_json: str) -> str:
@@ -546,12 +750,12 @@ class DocmakerAPI(PyloidIPC):
             JSON string with success status
         """
         try:
-            settings = json.loads(settings_json)
+            settings = _loads(settings_json)
             save_settings(settings)
-            return json.dumps({"success": True})
+            return _dumps({"success": True})
         except Exception as e:
             logger.exception("Error saving settings")
-            return json.dumps({"error": str(e)})
+            return _dumps({"error": str(e)})
 
     @Bridge(result=str)
     def reset_settings_ipc(self) -> str:
@@ -562,10 +766,10 @@ class DocmakerAPI(PyloidIPC):
         """
         try:
             defaults = reset_settings()
-            return json.dumps(defaults)
+            return _dumps(defaults)
         except Exception as e:
             logger.exception("Error resetting settings")
-            return json.dumps({"error": str(e)})
+            return _dumps({"error": str(e)})
 
     @Bridge(int, int, result=str)
     def resize_window(self, width: int, height: int) -> str:
@@ -586,12 +790,12 @@ class DocmakerAPI(PyloidIPC):
             if window:
                 window.resize(width, height)
                 logger.info("Window resized to %dx%d", width, height)
-                return json.dumps({"success": True, "width": width, "height": height})
+                return _dumps({"success": True, "width": width, "height": height})
             else:
-                return json.dumps({"error": "Window not available"})
+                return _dumps({"error": "Window not available"})
         except Exception as e:
             logger.exception("Error resizing window")
-            return json.dumps({"error": str(e)})
+            return _dumps({"error": str(e)})
 
     @Bridge(str, int, int, result=str)
     def get_source_snippet(self, path: str, start_line: int, end_line: int) -> str:
@@ -608,7 +812,7 @@ class DocmakerAPI(PyloidIPC):
         logger.debug("get_source_snippet called: %s lines %d-%d", path, start_line, end_line)
         try:
             if not self._current_project:
-                return json.dumps({"error": "No project loaded. Call scan_project first."})
+                return _dumps({"error": "No project loaded. Call scan_project first."})
 
             file_path = Path(path)
             if not file_path.is_absolute():
@@ -620,13 +824,13 @@ class DocmakerAPI(PyloidIPC):
             try:
                 file_path.relative_to(self._current_project.resolve())
             except ValueError:
-                return json.dumps({"error": "Path is outside the project directory"})
+                return _dumps({"error": "Path is outside the project directory"})
 
             if not file_path.exists():
-                return json.dumps({"error": f"File not found: {path}"})
+                return _dumps({"error": f"File not found: {path}"})
 
             if not file_path.is_file():
-                return json.dumps({"error": f"Not a file: {path}"})
+                return _dumps({"error": f"Not a file: {path}"})
 
             lines = file_path.read_text(encoding="utf-8", errors="replace").splitlines()
 
@@ -636,12 +840,12 @@ class DocmakerAPI(PyloidIPC):
 
             if start > len(lines):
                 msg = f"Start line {start_line} exceeds file length ({len(lines)} lines)"
-                return json.dumps({"error": msg})
+                return _dumps({"error": msg})
 
             snippet_lines = lines[start - 1 : end]
             snippet = "\n".join(snippet_lines)
 
-            return json.dumps(
+            return _dumps(
                 {
                     "source": snippet,
                     "lines": snippet_lines,
@@ -654,23 +858,48 @@ class DocmakerAPI(PyloidIPC):
 
         except Exception as e:
             logger.exception("Error reading source snippet")
-            return json.dumps({"error": str(e)})
+            return _dumps({"error": str(e)})
 
-    def _apply_user_llm_settings(self) -> None:
-        """Override self._config.llm fields with user settings from settings.json."""
-        if not self._config:
-            return
+    def _load_project(self, project_path: Path) -> tuple[DocmakerConfig, FileCrawler]:
+        """Load a project's config and crawler, reusing them while their inputs are unchanged.
+
+        Args:
+            project_path: Resolved project directory
+
+        Returns:
+            A fresh copy of the project's config, with user LLM settings applied,
+            and its crawler bound to that copy
+        """
+        key = (_mtime_ns(project_path / "docmaker.yaml"), _mtime_ns(project_path / ".gitignore"))
+        cached = self._projects.get(project_path)
+        if cached and cached[0] == key:
+            _, loaded, crawler = cached
+        else:
+            loaded = DocmakerConfig.load(project_path / "docmaker.yaml")
+            loaded.source_dir = project_path
+            crawler = FileCrawler(loaded)
+            self._projects[project_path] = (key, loaded, crawler)
+
+        # Runs mutate their config (user settings, generate_docs' useLlm), so
+        # each gets its own copy and the cached one stays as loaded from disk
+        config = copy.deepcopy(loaded)
+        self._apply_user_llm_settings(config)
+        crawler.config = config
+        return config, crawler
+
+    def _apply_user_llm_settings(self, config: DocmakerConfig) -> None:
+        """Override config.llm fields with user settings from settings.json."""
         try:
             user_llm = load_settings().get("llm", {})
             if user_llm:
-                self._config.llm.enabled = user_llm.get("enabled", self._config.llm.enabled)
-                self._config.llm.provider = user_llm.get("provider", self._config.llm.provider)
-                self._config.llm.model = user_llm.get("model", self._config.llm.model)
-                self._config.llm.base_url = user_llm.get("baseUrl", self._config.llm.base_url)
+                config.llm.enabled = user_llm.get("enabled", config.llm.enabled)
+                config.llm.provider = user_llm.get("provider", config.llm.provider)
+                config.llm.model = user_llm.get("model", config.llm.model)
+                config.llm.base_url = user_llm.get("baseUrl", config.llm.base_url)
                 api_key = user_llm.get("apiKey", "")
                 if api_key:
-                    self._config.llm.api_key = api_key
-                self._config.llm.timeout = user_llm.get("timeout", self._config.llm.timeout)
+                    config.llm.api_key = api_key
+                config.llm.timeout = user_llm.get("timeout", config.llm.timeout)
         except Exception as e:
             logger.warning("Failed to apply user LLM settings: %s", e)
 
@@ -691,10 +920,10 @@ class DocmakerAPI(PyloidIPC):
                 if response.status_code == 200:
                     data = response.json()
                     models = [m["name"] for m in data.get("models", [])]
-                    return json.dumps({"available": True, "models": models})
-                return json.dumps({"available": False, "models": []})
+                    return _dumps({"available": True, "models": models})
+                return _dumps({"available": False, "models": []})
         except Exception:
-            return json.dumps({"available": False, "models": []})
+            return _dumps({"available": False, "models": []})
 
     @Bridge(str, result=str)
     def test_llm_connection(self, config_json: str) -> str:
@@ -708,7 +937,7 @@ class DocmakerAPI(PyloidIPC):
         """
         logger.debug("test_llm_connection called")
         try:
-            config = json.loads(config_json)
+            config = _loads(config_json)
             llm_config = LLMConfig(
                 enabled=True,
                 provider=config.get("provider", "ollama"),
@@ -720,11 +949,11 @@ class DocmakerAPI(PyloidIPC):
             provider = create_llm_provider(llm_config)
             available = provider.is_available()
             if available:
-                return json.dumps({"success": True})
-            return json.dumps({"success": False, "error": "Provider not available"})
+                return _dumps({"success": True})
+            return _dumps({"success": False, "error": "Provider not available"})
         except Exception as e:
             logger.exception("Error testing LLM connection")
-            return json.dumps({"success": False, "error": str(e)})
+            return _dumps({"success": False, "error": str(e)})
 
     @Bridge(result=str)
     def get_window_size(self) -> str:
@@ -739,9 +968,9 @@ class DocmakerAPI(PyloidIPC):
             window = get_app_window()
             if window:
                 size = window.size()
-                return json.dumps({"width": size.width(), "height": size.height()})
+                return _dumps({"width": size.width(), "height": size.height()})
             else:
-                return json.dumps({"error": "Window not available"})
+                return _dumps({"error": "Window not available"})
         except Exception as e:
             logger.exception("Error getting window size")
-            return json.dumps({"error": str(e)})
+            return _dumps({"error": str(e)})
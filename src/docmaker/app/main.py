@@ -10,6 +10,9 @@ from docmaker.app.ipc import DocmakerAPI
 
 logger = logging.getLogger(__name__)
 
+# Repository root when running from a source checkout (src/docmaker/app/main.py)
+_SOURCE_ROOT = Path(__file__).resolve().parents[3]
+
 
 def get_icon_path() -> Path | None:
     """Get the application icon path.
@@ -24,9 +27,7 @@ def get_icon_path() -> Path | None:
         icon_path = Path(sys._MEIPASS) / "icons" / "docmaker.png"
     else:
         # Development mode
-        icon_path = (
-            Path(__file__).parent.parent.parent.parent / "packaging" / "icons" / "docmaker.png"
-        )
+        icon_path = _SOURCE_ROOT / "packaging" / "icons" / "docmaker.png"
     return icon_path if icon_path.exists() else None
 
 
@@ -42,11 +43,12 @@ def get_frontend_dir() -> Path:
         # Running as PyInstaller bundle
         return Path(sys._MEIPASS) / "frontend"
     # Development mode
-    return Path(__file__).parent.parent.parent.parent / "frontend" / "dist"
+    return _SOURCE_ROOT / "frontend" / "dist"
 
 
 # Get the frontend directory path
 FRONTEND_DIR = get_frontend_dir()
+INDEX_PATH = FRONTEND_DIR / "index.html"
 DEV_URL = "http://localhost:5173"
 
 # Global reference to the main window for IPC access
@@ -155,12 +157,11 @@ def create_window(app: Pyloid, dev_mode: bool = False, project_path: str | None
         window.load_url(DEV_URL)
         window.open_dev_tools()
     else:
-        index_path = FRONTEND_DIR / "index.html"
-        if index_path.exists():
-            logger.info(f"Loading frontend from {index_path}")
-            window.load_file(str(index_path))
+        if INDEX_PATH.exists():
+            logger.info(f"Loading frontend from {INDEX_PATH}")
+            window.load_file(str(INDEX_PATH))
         else:
-            logger.error(f"Frontend not found at {index_path}")
+            logger.error(f"Frontend not found at {INDEX_PATH}")
             logger.info("Run 'npm run build' in the frontend directory first")
             # Load a simple error page
             window.load_url(
@@ -1,8 +1,10 @@
 """Settings management for the Docmaker desktop app."""
 
+import copy
 import json
 import logging
 import sys
+from functools import cache
 from pathlib import Path
 from typing import Any
 
@@ -51,7 +53,22 @@ DEFAULT_SETTINGS: dict[str, Any] = {
     },
 }
 
+# Private copy of the defaults, so changes made to DEFAULT_SETTINGS or to a
+# returned settings dict never leak into later loads
+_DEFAULTS_PROTOTYPE = copy.deepcopy(DEFAULT_SETTINGS)
 
+# Editor command templates: {file} and {line} are placeholders
+_EDITOR_COMMANDS: dict[str, list[str]] = {
+    "vscode": ["code", "--goto", "{file}:{line}"],
+    "idea": ["idea", "--line", "{line}", "{file}"],
+    "sublime": ["subl", "{file}:{line}"],
+}
+
+# Last merged settings, keyed by (path, mtime_ns, size) of the file they were read from
+_settings_cache: tuple[tuple[str, int, int], dict[str, Any]] | None = None
+
+
+@cache
 def get_settings_dir() -> Path:
     """Get the platform-appropriate settings directory.
 
@@ -76,6 +93,7 @@ def get_settings_dir() -> Path:
         return xdg_config / "docmaker"
 
 
+@cache
 def get_settings_path() -> Path:
     """Get the path to the settings JSON file.
 
@@ -95,15 +113,24 @@ def _deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any
     Returns:
         Merged dictionary
     """
-    result = base.copy()
+    if not override:
+        return base.copy()
+
+    # Plain overrides land in one merge; only dicts overriding dicts recurse
+    result = {**base, **override}
     for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = _deep_merge(result[key], value)
-        else:
-            result[key] = value
+        if isinstance(value, dict):
+            base_value = base.get(key)
+            if isinstance(base_value, dict):
+                result[key] = _deep_merge(base_value, value)
     return result
 
 
+def _default_settings() -> dict[str, Any]:
+    """Return a fresh deep copy of the default settings."""
+    return copy.deepcopy(_DEFAULTS_PROTOTYPE)
+
+
 def load_settings() -> dict[str, Any]:
     """Load settings from disk, merging with defaults.
 
@@ -113,27 +140,42 @@ def load_settings() -> dict[str, Any]:
     Returns:
         Settings dictionary with all keys guaranteed to exist
     """
+    global _settings_cache
+
     settings_path = get_settings_path()
 
-    if not settings_path.exists():
+    try:
+        stat = settings_path.stat()
+    except OSError:
         logger.info("No settings file found, using defaults")
-        return DEFAULT_SETTINGS.copy()
+        return _default_settings()
+
+    key = (str(settings_path), stat.st_mtime_ns, stat.st_size)
+    if _settings_cache is not None and _settings_cache[0] == key:
+        return copy.deepcopy(_settings_cache[1])
 
     try:
         with open(settings_path, encoding="utf-8") as f:
             saved_settings = json.load(f)
 
         # Deep merge with defaults to handle missing keys
-        merged = _deep_merge(DEFAULT_SETTINGS, saved_settings)
+        merged = _deep_merge(_default_settings(), saved_settings)
         logger.debug("Settings loaded from %s", settings_path)
+        _settings_cache = (key, copy.deepcopy(merged))
         return merged
 
     except json.JSONDecodeError as e:
         logger.warning("Invalid settings file, using defaults: %s", e)
-        return DEFAULT_SETTINGS.copy()
+        return _default_settings()
     except Exception as e:
         logger.warning("Error loading settings, using defaults: %s", e)
-        return DEFAULT_SETTINGS.copy()
+        return _default_settings()
+
+
+def _clear_settings_cache() -> None:
+    """Forget the cached settings so the next load re-reads the file."""
+    global _settings_cache
+    _settings_cache = None
 
 
 def save_settings(settings: dict[str, Any]) -> None:
@@ -151,6 +193,7 @@ def save_settings(settings: dict[str, Any]) -> None:
     # Create directory if it doesn't exist
     settings_dir.mkdir(parents=True, exist_ok=True)
 
+    _clear_settings_cache()
     with open(settings_path, "w", encoding="utf-8") as f:
         json.dump(settings, f, indent=2)
 
@@ -166,12 +209,13 @@ def reset_settings() -> dict[str, Any]:
         Default settings dictionary
     """
     settings_path = get_settings_path()
+    _clear_settings_cache()
 
     if settings_path.exists():
         settings_path.unlink()
         logger.info("Settings file deleted: %s", settings_path)
 
-    return DEFAULT_SETTINGS.copy()
+    return _default_settings()
 
 
 def get_editor_command(settings: dict[str, Any]) -> tuple[list[str] | None, str]:
@@ -190,13 +234,6 @@ def get_editor_command(settings: dict[str, Any]) -> tuple[list[str] | None, str]
     if always_ask:
         return None, "ask"
 
-    # Editor command templates: {file} and {line} are placeholders
-    editor_commands: dict[str, tuple[list[str], str]] = {
-        "vscode": (["code", "--goto", "{file}:{line}"], "vscode"),
-        "idea": (["idea", "--line", "{line}", "{file}"], "idea"),
-        "sublime": (["subl", "{file}:{line}"], "sublime"),
-    }
-
     if preferred == "custom":
         custom_cmd = editor_settings.get("customEditorCommand", "")
         if custom_cmd:
@@ -207,8 +244,8 @@ def get_editor_command(settings: dict[str, Any]) -> tuple[list[str] | None, str]
     if preferred == "system":
         return None, "system"
 
-    if preferred in editor_commands:
-        return editor_commands[preferred]
+    if preferred in _EDITOR_COMMANDS:
+        return list(_EDITOR_COMMANDS[preferred]), preferred
 
     # Auto-detect: try VS Code first, then fall back to system
     return None, "auto"
@@ -1,14 +1,93 @@
 """Cache management for incremental updates."""
 
+import hashlib
 import json
-from dataclasses import asdict, dataclass
+import logging
+import mmap
+import os
+import pickle
+import shutil
+import sys
+import time
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, field, fields, is_dataclass
 from datetime import datetime
 from pathlib import Path
 
-from docmaker.models import SourceFile
+try:
+    import blake3
+except ImportError:  # optional: pip install docmaker[fast]
+    blake3 = None
 
+try:
+    import orjson
+except ImportError:  # optional: pip install docmaker[fast]
+    orjson = None
 
-@dataclass
+from docmaker import __version__, models
+from docmaker.models import FileSymbols, SourceFile
+
+logger = logging.getLogger(__name__)
+
+# Content hash algorithm; recorded in cache entries so a switch invalidates them
+HASH_ALGORITHM = "blake3" if blake3 is not None else "sha256"
+
+# Version of the JSON Lines cache file layout
+CACHE_FORMAT_VERSION = "2.0"
+
+# Files at least this large are memory-mapped for hashing rather than read into memory
+MMAP_THRESHOLD = 64 * 1024
+
+# Parsed symbols are cached here, keyed by file path and content hash
+SYMBOL_CACHE_DIR = Path.home() / ".cache" / "docmaker" / "symbols"
+
+# Other cache tags unused for this long are removed; younger ones may belong to
+# another install (the CLI beside the app, another Python version) still in use
+STALE_TAG_AGE_SECONDS = 30 * 24 * 60 * 60
+
+
+def _schema_fingerprint() -> str:
+    """Fingerprint the parsers and the model dataclasses that cached symbols depend on."""
+    digest = hashlib.sha256()
+    package_dir = Path(__file__).parent
+    for path in sorted([package_dir / "models.py", *(package_dir / "parser").glob("*.py")]):
+        try:
+            digest.update(path.read_bytes())
+        except OSError:
+            pass
+    # Frozen builds may ship without sources; the model layout still changes the tag
+    for name, obj in sorted(vars(models).items()):
+        if is_dataclass(obj):
+            digest.update(f"{name}({','.join(f.name for f in fields(obj))})".encode())
+    return digest.hexdigest()[:16]
+
+
+# Entries written by another docmaker, Python, parser or model version are never reused
+_SYMBOL_CACHE_TAG = (
+    f"{__version__}-py{sys.version_info.major}.{sys.version_info.minor}-{_schema_fingerprint()}"
+)
+
+
+def hash_file(path: Path) -> str:
+    """Compute the HASH_ALGORITHM hash of a file's contents."""
+    if blake3 is not None:
+        return blake3.blake3(max_threads=blake3.blake3.AUTO).update_mmap(path).hexdigest()
+    with open(path, "rb") as f:
+        # Source files are small, so hash the whole file in one update call
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            return hashlib.sha256(f.read()).hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return hashlib.sha256(mm).hexdigest()
+
+
+def hash_bytes(data: bytes | mmap.mmap) -> str:
+    """Compute the HASH_ALGORITHM hash of an in-memory buffer, matching hash_file."""
+    if blake3 is not None:
+        return blake3.blake3(data, max_threads=blake3.blake3.AUTO).hexdigest()
+    return hashlib.sha256(data).hexdigest()
+
+
+@dataclass(slots=True, frozen=True)
 class CacheEntry:
     """Represents a cached file entry."""
 
@@ -18,27 +97,69 @@ class CacheEntry:
     category: str
     size_bytes: int
     last_processed: str
+    hash_algorithm: str = "sha256"
+    mtime_ns: int = 0
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CacheEntry":
+        """Create an entry from its serialized form."""
+        return cls(
+            relative_path=data["relative_path"],
+            hash=data["hash"],
+            # Few distinct values across all entries; share one string each
+            language=sys.intern(data["language"]),
+            category=sys.intern(data["category"]),
+            size_bytes=data["size_bytes"],
+            last_processed=data["last_processed"],
+            hash_algorithm=sys.intern(data.get("hash_algorithm", "sha256")),
+            mtime_ns=data.get("mtime_ns", 0),
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheData:
     """The complete cache structure."""
 
-    version: str = "1.0"
+    version: str = CACHE_FORMAT_VERSION
     last_run: str = ""
-    entries: dict[str, CacheEntry] | None = None
+    entries: dict[str, CacheEntry] = field(default_factory=dict)
+
 
-    def __post_init__(self):
-        if self.entries is None:
-            self.entries = {}
+def _loads(data: bytes):
+    """Decode JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dump_line(obj) -> bytes:
+    """Encode one JSON Lines record, using orjson when it is installed."""
+    if orjson is not None:
+        # orjson serializes the CacheEntry dataclasses natively, skipping asdict
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    if isinstance(obj, CacheEntry):
+        obj = asdict(obj)
+    return json.dumps(obj, separators=(",", ":")).encode() + b"\n"
 
 
 class CacheManager:
-    """Manages the file cache for incremental updates."""
+    """Manages the file cache for incremental updates.
+
+    The cache file is JSON Lines: a header line with the format version and
+    last run, then one line per entry write. Removals are written as
+    ``{"relative_path": ..., "deleted": true}`` tombstones and later lines
+    win, so a save only appends the entries touched since the last one. The
+    file is rewritten in full once it holds more than twice as many lines
+    as live entries.
+    """
 
     def __init__(self, cache_path: Path):
         self.cache_path = cache_path
         self._cache: CacheData | None = None
+        # Paths updated or removed since the cache was last loaded or saved
+        self._dirty: set[str] = set()
+        # Records in the cache file after its header; None if it must be rewritten
+        self._disk_lines: int | None = None
 
     def load(self) -> CacheData:
         """Load the cache from disk."""
@@ -50,46 +171,103 @@ class CacheManager:
             return self._cache
 
         try:
-            with open(self.cache_path) as f:
-                data = json.load(f)
-
-            entries = {}
-            for path, entry_data in data.get("entries", {}).items():
-                entries[path] = CacheEntry(
-                    relative_path=entry_data["relative_path"],
-                    hash=entry_data["hash"],
-                    language=entry_data["language"],
-                    category=entry_data["category"],
-                    size_bytes=entry_data["size_bytes"],
-                    last_processed=entry_data["last_processed"],
-                )
-
-            self._cache = CacheData(
-                version=data.get("version", "1.0"),
-                last_run=data.get("last_run", ""),
-                entries=entries,
-            )
+            self._cache = self._read_cache()
         except (json.JSONDecodeError, KeyError):
             self._cache = CacheData()
+            self._disk_lines = None
 
         return self._cache
 
+    def _read_cache(self) -> CacheData:
+        """Parse the cache file, memory-mapping it when it is large."""
+        with open(self.cache_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+                return self._replay_lines(iter(f))
+            # Large caches are read line by line straight from a read-only mapping
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return self._replay_lines(iter(mm.readline, b""))
+
+    def _replay_lines(self, lines: Iterator[bytes]) -> CacheData:
+        """Build the cache from the file's lines, replaying entry records in order."""
+        try:
+            header = _loads(next(lines, b"{}"))
+        except json.JSONDecodeError:
+            header = None
+
+        if header is None or "entries" in header:
+            # Single JSON document written by older versions; rewritten on save
+            data = header if header is not None else _loads(self.cache_path.read_bytes())
+            return CacheData(
+                version=data.get("version", "1.0"),
+                last_run=data.get("last_run", ""),
+                entries={
+                    path: CacheEntry.from_dict(entry_data)
+                    for path, entry_data in data.get("entries", {}).items()
+                },
+            )
+
+        cache = CacheData(
+            version=header.get("version", CACHE_FORMAT_VERSION),
+            last_run=header.get("last_run", ""),
+        )
+        disk_lines = 0
+        for line in lines:
+            try:
+                record = _loads(line)
+            except json.JSONDecodeError:
+                # Torn append from an interrupted save; drop it and rewrite next time
+                logger.debug("Ignoring truncated cache record in %s", self.cache_path)
+                self._disk_lines = None
+                return cache
+            disk_lines += 1
+
+            path = record.get("relative_path")
+            if path is None:
+                cache.last_run = record.get("last_run", cache.last_run)
+            elif record.get("deleted"):
+                cache.entries.pop(path, None)
+            else:
+                cache.entries[path] = CacheEntry.from_dict(record)
+
+        self._disk_lines = disk_lines
+        return cache
+
     def save(self) -> None:
-        """Save the cache to disk."""
+        """Save the cache to disk, appending only the entries changed since the last save."""
         if self._cache is None:
             return
 
         self._cache.last_run = datetime.now().isoformat()
+        entries = self._cache.entries
 
-        data = {
-            "version": self._cache.version,
-            "last_run": self._cache.last_run,
-            "entries": {path: asdict(entry) for path, entry in self._cache.entries.items()},
-        }
+        if self._disk_lines is not None and self.cache_path.exists():
+            records = [
+                entries[path] if path in entries else {"relative_path": path, "deleted": True}
+                for path in self._dirty
+            ]
+            records.append({"last_run": self._cache.last_run})
+            if self._disk_lines + len(records) <= 2 * len(entries):
+                with open(self.cache_path, "ab") as f:
+                    f.write(b"".join(map(_dump_line, records)))
+                self._disk_lines += len(records)
+                self._dirty.clear()
+                return
 
+        self._cache.version = CACHE_FORMAT_VERSION
+        header = {"version": self._cache.version, "last_run": self._cache.last_run}
+        payload = _dump_line(header) + b"".join(map(_dump_line, entries.values()))
+
+        # Write beside the cache and swap it in, so a crash never leaves a torn file
         self.cache_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.cache_path, "w") as f:
-            json.dump(data, f, indent=2)
+        tmp_path = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        self._disk_lines = len(entries)
+        self._dirty.clear()
 
     def is_file_changed(self, file: SourceFile) -> bool:
         """Check if a file has changed since last processing."""
@@ -100,7 +278,20 @@ class CacheManager:
             return True
 
         cached = cache.entries[path_key]
-        return cached.hash != file.hash
+        return cached.hash != file.hash or cached.hash_algorithm != HASH_ALGORITHM
+
+    def get_unchanged_hash(self, relative_path: Path, mtime_ns: int, size: int) -> str | None:
+        """Return the cached hash of a file whose mtime and size match its entry, or None."""
+        cached = self.load().entries.get(str(relative_path))
+        if (
+            cached is None
+            or not cached.mtime_ns
+            or cached.mtime_ns != mtime_ns
+            or cached.size_bytes != size
+            or cached.hash_algorithm != HASH_ALGORITHM
+        ):
+            return None
+        return cached.hash
 
     def update_file(self, file: SourceFile) -> None:
         """Update the cache entry for a file."""
@@ -114,13 +305,17 @@ class CacheManager:
             category=file.category.value,
             size_bytes=file.size_bytes,
             last_processed=datetime.now().isoformat(),
+            hash_algorithm=HASH_ALGORITHM,
+            mtime_ns=file.mtime_ns,
         )
+        self._dirty.add(path_key)
 
     def remove_file(self, relative_path: Path) -> None:
         """Remove a file from the cache."""
         cache = self.load()
         path_key = str(relative_path)
-        cache.entries.pop(path_key, None)
+        if cache.entries.pop(path_key, None) is not None:
+            self._dirty.add(path_key)
 
     def get_changed_files(self, files: list[SourceFile]) -> list[SourceFile]:
         """Filter to only files that have changed since last run."""
@@ -132,8 +327,123 @@ class CacheManager:
         current_paths = {str(f.relative_path) for f in current_files}
         return [path for path in cache.entries.keys() if path not in current_paths]
 
+    def diff(self, files: list[SourceFile]) -> tuple[list[SourceFile], list[str]]:
+        """Split a crawl against the cache in one pass.
+
+        Returns the files that changed since the last run and the cached paths
+        that no longer exist.
+        """
+        entries = self.load().entries
+        current = {str(f.relative_path): f for f in files}
+
+        changed = []
+        for path_key, file in current.items():
+            cached = entries.get(path_key)
+            if (
+                cached is None
+                or cached.hash != file.hash
+                or cached.hash_algorithm != HASH_ALGORITHM
+            ):
+                changed.append(file)
+
+        deleted = [path for path in entries if path not in current]
+        return changed, deleted
+
     def clear(self) -> None:
         """Clear the entire cache."""
         self._cache = CacheData()
+        self._dirty.clear()
+        self._disk_lines = None
         if self.cache_path.exists():
             self.cache_path.unlink()
+
+
+class SymbolCache:
+    """Persistent cache of parsed FileSymbols, keyed by file path and content hash.
+
+    Files without a content hash are never cached. Each file keeps only the
+    entry for its latest content. The first put also removes entries from
+    other cache tags that have gone unused for STALE_TAG_AGE_SECONDS; creating
+    a cache never touches the disk. ``hits`` and ``misses`` count lookups
+    since the cache was created.
+    """
+
+    def __init__(self, cache_dir: Path = SYMBOL_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+        self._pruned = False
+
+    def _prune_stale_tags(self) -> None:
+        """Mark this tag as in use and remove other tags unused for STALE_TAG_AGE_SECONDS."""
+        now = time.time()
+        try:
+            os.utime(self.cache_dir / _SYMBOL_CACHE_TAG, (now, now))
+            stale = [
+                p
+                for p in self.cache_dir.iterdir()
+                if p.name != _SYMBOL_CACHE_TAG and now - p.stat().st_mtime > STALE_TAG_AGE_SECONDS
+            ]
+        except OSError:
+            return
+        for path in stale:
+            logger.debug("Removing stale symbol cache entries in %s", path)
+            if path.is_dir():
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                path.unlink(missing_ok=True)
+
+    def get(self, file: SourceFile) -> FileSymbols | None:
+        """Return the cached symbols for an unchanged file, or None."""
+        entry_path = self._entry_path(file)
+        if entry_path is not None:
+            try:
+                with open(entry_path, "rb") as f:
+                    symbols = pickle.load(f)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.debug("Ignoring unreadable symbol cache entry %s: %s", entry_path, e)
+            else:
+                # Category and other crawl results may have changed since caching
+                symbols.file = file
+                self.hits += 1
+                return symbols
+
+        self.misses += 1
+        return None
+
+    def put(self, file: SourceFile, symbols: FileSymbols) -> None:
+        """Store the symbols parsed from a file."""
+        entry_path = self._entry_path(file)
+        if entry_path is None:
+            return
+
+        tmp_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+        try:
+            data = pickle.dumps(symbols, protocol=pickle.HIGHEST_PROTOCOL)
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, entry_path)
+        except Exception as e:
+            logger.warning("Failed to cache symbols for %s: %s", file.relative_path, e)
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        # Entries for the file's earlier contents can never be hit again
+        for sibling in entry_path.parent.glob("*.pickle"):
+            if sibling != entry_path:
+                sibling.unlink(missing_ok=True)
+
+        # Puts run on the parse thread, never the UI one, so prune here once
+        if not self._pruned:
+            self._pruned = True
+            self._prune_stale_tags()
+
+    def _entry_path(self, file: SourceFile) -> Path | None:
+        """Return where the entry for a file lives, or None if it has no hash."""
+        if not file.hash:
+            return None
+        # One directory per file, so a put can drop the entries of older contents
+        key = hashlib.sha256(str(file.path).encode()).hexdigest()
+        return self.cache_dir / _SYMBOL_CACHE_TAG / key[:2] / key / f"{file.hash}.pickle"
@@ -2,27 +2,35 @@
 
 import logging
 import sys
+from functools import cache
 from pathlib import Path
 
 import click
-from rich.console import Console
-from rich.logging import RichHandler
 
 from docmaker import __version__
-from docmaker.config import DocmakerConfig
-from docmaker.pipeline import Pipeline
 
-console = Console()
+# Heavier modules (rich, yaml, the pipeline and its LLM clients) are imported
+# inside the commands that use them, keeping `docmaker --version` fast
+
+
+@cache
+def _get_console():
+    """Return the shared rich console, creating it on first use."""
+    from rich.console import Console
+
+    return Console()
 
 
 def setup_logging(verbose: bool) -> None:
     """Configure logging with rich output."""
+    from rich.logging import RichHandler
+
     level = logging.DEBUG if verbose else logging.INFO
     logging.basicConfig(
         level=level,
         format="%(message)s",
         datefmt="[%X]",
-        handlers=[RichHandler(console=console, rich_tracebacks=True)],
+        handlers=[RichHandler(console=_get_console(), rich_tracebacks=True)],
     )
 
 
@@ -79,6 +87,10 @@ def generate(
 
     SOURCE_DIR is the path to the source code repository.
     """
+    from docmaker.config import DocmakerConfig
+    from docmaker.pipeline import Pipeline
+
+    console = _get_console()
     setup_logging(verbose)
 
     try:
@@ -119,6 +131,9 @@ def generate(
 )
 def init(output: Path, force: bool) -> None:
     """Initialize a new docmaker configuration file."""
+    from docmaker.config import DocmakerConfig
+
+    console = _get_console()
     if output.exists() and not force:
         console.print(f"[yellow]Configuration file already exists: {output}[/yellow]")
         console.print("Use --force to overwrite")
@@ -143,6 +158,10 @@ def init(output: Path, force: bool) -> None:
 )
 def scan(source_dir: Path, config: Path | None) -> None:
     """Scan a codebase and show statistics without generating docs."""
+    from docmaker.config import DocmakerConfig
+    from docmaker.crawler import FileCrawler
+
+    console = _get_console()
     setup_logging(False)
 
     try:
@@ -150,8 +169,6 @@ def scan(source_dir: Path, config: Path | None) -> None:
         cfg.source_dir = source_dir.resolve()
         cfg.llm.enabled = False
 
-        from docmaker.crawler import FileCrawler
-
         crawler = FileCrawler(cfg)
         files = crawler.crawl()
 
@@ -214,12 +231,14 @@ def app(project: Path | None, dev: bool) -> None:
 )
 def clear_cache(source_dir: Path, config: Path | None) -> None:
     """Clear the incremental update cache."""
+    from docmaker.cache import CacheManager
+    from docmaker.config import DocmakerConfig
+
+    console = _get_console()
     try:
         cfg = DocmakerConfig.load(config)
         cfg.source_dir = source_dir.resolve()
 
-        from docmaker.cache import CacheManager
-
         cache = CacheManager(cfg.source_dir / cfg.cache_file)
         cache.clear()
 
@@ -1,11 +1,23 @@
 """Configuration management for docmaker."""
 
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+# LibYAML's C loader and dumper when PyYAML was built with them
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper
+    from yaml import SafeLoader as _SafeLoader
+
+# Config files looked up in the working directory, in order of precedence
+DEFAULT_CONFIG_NAMES = ("docmaker.yaml", "docmaker.yml", ".docmaker.yaml", ".docmaker.yml")
+
 
 @dataclass
 class LLMConfig:
@@ -101,7 +113,7 @@ class DocmakerConfig:
     def from_yaml(cls, path: Path) -> "DocmakerConfig":
         """Load configuration from a YAML file."""
         with open(path) as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_SafeLoader) or {}
         return cls.from_dict(data)
 
     @classmethod
@@ -110,16 +122,15 @@ class DocmakerConfig:
         if config_path and config_path.exists():
             return cls.from_yaml(config_path)
 
-        default_paths = [
-            Path("docmaker.yaml"),
-            Path("docmaker.yml"),
-            Path(".docmaker.yaml"),
-            Path(".docmaker.yml"),
-        ]
+        # One directory listing instead of a stat per candidate name
+        try:
+            names = set(os.listdir("."))
+        except OSError:
+            names = set()
 
-        for path in default_paths:
-            if path.exists():
-                return cls.from_yaml(path)
+        for name in DEFAULT_CONFIG_NAMES:
+            if name in names:
+                return cls.from_yaml(Path(name))
 
         return cls()
 
@@ -156,4 +167,6 @@ class DocmakerConfig:
     def save(self, path: Path) -> None:
         """Save configuration to a YAML file."""
         with open(path, "w") as f:
-            yaml.dump(self.to_dict(), f, default_flow_style=False, sort_keys=False)
+            yaml.dump(
+                self.to_dict(), f, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False
+            )
@@ -1,23 +1,126 @@
 """File crawler for traversing repositories and identifying source files."""
 
-import hashlib
+import mmap
 import os
+import re
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pathspec
 
+from docmaker.cache import MMAP_THRESHOLD, CacheManager, hash_bytes, hash_file
 from docmaker.config import DocmakerConfig
 from docmaker.models import FileCategory, Language, SourceFile
 
+# Threads hashing files during a crawl
+CRAWL_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+# Path substrings that mark a file's category, checked in this order
+_CATEGORY_PATTERNS: list[tuple[FileCategory, list[str]]] = [
+    (
+        FileCategory.TEST,
+        [
+            "/test/",
+            "/tests/",
+            "/__tests__/",
+            "/spec/",
+            ".test.",
+            ".spec.",
+            "_test.",
+            "_spec.",
+            "test_",
+        ],
+    ),
+    (
+        FileCategory.CONFIG,
+        [
+            "config",
+            "configuration",
+            "settings",
+            "properties",
+            "application.yml",
+            "application.yaml",
+            "application.properties",
+            ".env",
+            "pom.xml",
+            "build.gradle",
+            "package.json",
+            "tsconfig.json",
+        ],
+    ),
+    (
+        FileCategory.FRONTEND,
+        [
+            "/frontend/",
+            "/web/",
+            "/ui/",
+            "/client/",
+            "/components/",
+            "/pages/",
+            "/views/",
+            ".tsx",
+            ".jsx",
+            ".vue",
+            ".svelte",
+        ],
+    ),
+    (
+        FileCategory.BACKEND,
+        [
+            "/backend/",
+            "/server/",
+            "/api/",
+            "/service/",
+            "/controller/",
+            "/repository/",
+            "/domain/",
+            "/entity/",
+            "/model/",
+            "controller.java",
+            "service.java",
+            "repository.java",
+        ],
+    ),
+]
+# One alternation per category, so each check is a single regex scan
+_CATEGORY_REGEXES = [
+    (category, re.compile("|".join(map(re.escape, patterns))))
+    for category, patterns in _CATEGORY_PATTERNS
+]
+
+
+def _lines_end(data: bytes | str, newline: bytes | str, num_lines: int) -> int:
+    """Return the offset just past the Nth newline in data, or its length."""
+    end = 0
+    for _ in range(num_lines):
+        end = data.find(newline, end) + 1
+        if not end:
+            return len(data)
+    return end
+
+
+def _decode_header(data: bytes | mmap.mmap, num_lines: int) -> str:
+    """Decode the first N lines of raw file contents the way a text-mode read would."""
+    text = data[: _lines_end(data, b"\n", num_lines)].decode("utf-8", errors="replace")
+    if "\r" in text:
+        # Universal newlines: \r\n and a lone \r both end a line and read as \n
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+        text = text[: _lines_end(text, "\n", num_lines)]
+    return text
+
 
 class FileCrawler:
     """Crawls a repository and identifies relevant source files."""
 
-    def __init__(self, config: DocmakerConfig):
+    def __init__(self, config: DocmakerConfig, cache: CacheManager | None = None):
         self.config = config
+        # Incremental cache; files whose stat matches an entry reuse its hash
+        self.cache = cache
         self.source_dir = config.source_dir.resolve()
-        self._gitignore_spec: pathspec.PathSpec | None = None
-        self._custom_spec: pathspec.PathSpec | None = None
+        # Length of "<source_dir>/", sliced off entry paths to make them relative
+        self._prefix_len = len(os.path.join(self.source_dir, ""))
+        self._ignore_spec: pathspec.PathSpec | None = None
         self._load_ignore_patterns()
 
     def _load_ignore_patterns(self) -> None:
@@ -57,42 +160,23 @@ class FileCrawler:
             "*.war",
         ]
         patterns.extend(always_ignore)
+        patterns.extend(self.config.crawler.custom_ignore_patterns)
 
-        if patterns:
-            self._gitignore_spec = pathspec.PathSpec.from_lines("gitignore", patterns)
-
-        if self.config.crawler.custom_ignore_patterns:
-            self._custom_spec = pathspec.PathSpec.from_lines(
-                "gitignore", self.config.crawler.custom_ignore_patterns
-            )
-
-    def _should_ignore(self, path: Path) -> bool:
-        """Check if a path should be ignored based on patterns."""
-        try:
-            relative = path.relative_to(self.source_dir)
-            relative_str = str(relative).replace("\\", "/")
-        except ValueError:
-            return True
+        # One spec for all sources, so each path is matched in a single pass
+        self._ignore_spec = pathspec.PathSpec.from_lines("gitignore", patterns)
 
-        if self._gitignore_spec and self._gitignore_spec.match_file(relative_str):
-            return True
+    def _should_ignore(self, entry: os.DirEntry) -> bool:
+        """Check if a directory entry should be ignored based on patterns."""
+        relative_str = entry.path[self._prefix_len :].replace("\\", "/")
+        return self._ignore_spec.match_file(relative_str)
 
-        if self._custom_spec and self._custom_spec.match_file(relative_str):
-            return True
-
-        return False
-
-    def _is_relevant_extension(self, path: Path) -> bool:
-        """Check if the file has a relevant extension."""
-        return path.suffix.lower() in self.config.crawler.include_extensions
+    def _is_relevant_extension(self, name: str) -> bool:
+        """Check if the file name has a relevant extension."""
+        return os.path.splitext(name)[1].lower() in self.config.crawler.include_extensions
 
     def _compute_hash(self, path: Path) -> str:
-        """Compute SHA256 hash of file contents."""
-        sha256 = hashlib.sha256()
-        with open(path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+        """Compute the content hash used by the incremental cache."""
+        return hash_file(path)
 
     def _read_header(self, path: Path, num_lines: int) -> str:
         """Read the first N lines of a file for classification."""
@@ -107,124 +191,103 @@ class FileCrawler:
             pass
         return "".join(lines)
 
+    def _read_header_and_hash(self, path: Path, num_lines: int) -> tuple[str, str]:
+        """Read a file once, returning its first N lines and its content hash."""
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+                data = f.read()
+                return _decode_header(data, num_lines), hash_bytes(data)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _decode_header(mm, num_lines), hash_bytes(mm)
+
     def _categorize_by_path(self, path: Path) -> FileCategory:
         """Quick categorization based on file path patterns."""
         path_str = str(path).lower().replace("\\", "/")
 
-        test_patterns = [
-            "/test/",
-            "/tests/",
-            "/__tests__/",
-            "/spec/",
-            ".test.",
-            ".spec.",
-            "_test.",
-            "_spec.",
-            "test_",
-        ]
-        if any(pattern in path_str for pattern in test_patterns):
-            return FileCategory.TEST
-
-        config_patterns = [
-            "config",
-            "configuration",
-            "settings",
-            "properties",
-            "application.yml",
-            "application.yaml",
-            "application.properties",
-            ".env",
-            "pom.xml",
-            "build.gradle",
-            "package.json",
-            "tsconfig.json",
-        ]
-        if any(pattern in path_str for pattern in config_patterns):
-            return FileCategory.CONFIG
-
-        frontend_patterns = [
-            "/frontend/",
-            "/web/",
-            "/ui/",
-            "/client/",
-            "/components/",
-            "/pages/",
-            "/views/",
-            ".tsx",
-            ".jsx",
-            ".vue",
-            ".svelte",
-        ]
-        if any(pattern in path_str for pattern in frontend_patterns):
-            return FileCategory.FRONTEND
-
-        backend_patterns = [
-            "/backend/",
-            "/server/",
-            "/api/",
-            "/service/",
-            "/controller/",
-            "/repository/",
-            "/domain/",
-            "/entity/",
-            "/model/",
-            "controller.java",
-            "service.java",
-            "repository.java",
-        ]
-        if any(pattern in path_str for pattern in backend_patterns):
-            return FileCategory.BACKEND
+        for category, regex in _CATEGORY_REGEXES:
+            if regex.search(path_str):
+                return category
 
         return FileCategory.UNKNOWN
 
-    def crawl(self) -> list[SourceFile]:
-        """Crawl the source directory and return a list of relevant files."""
-        files: list[SourceFile] = []
-        max_size = self.config.crawler.max_file_size_kb * 1024
-
-        for root, dirs, filenames in os.walk(self.source_dir):
-            root_path = Path(root)
-
-            dirs[:] = [d for d in dirs if not self._should_ignore(root_path / d)]
-
-            for filename in filenames:
-                file_path = root_path / filename
-
-                if self._should_ignore(file_path):
-                    continue
-
-                if not self._is_relevant_extension(file_path):
-                    continue
-
+    def _collect_entries(self) -> Iterator[os.DirEntry]:
+        """Walk the source directory, yielding files that pass the ignore and extension filters.
+
+        Files are yielded in the same top-down order as ``os.walk``; like it,
+        symlinked directories are listed but not descended into.
+        """
+        stack = [str(self.source_dir)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+
+            subdirs = []
+            for entry in entries:
                 try:
-                    stat = file_path.stat()
-                    if stat.st_size > max_size:
-                        continue
-                    size_bytes = stat.st_size
+                    is_dir = entry.is_dir()
                 except OSError:
-                    continue
+                    is_dir = False
 
-                relative_path = file_path.relative_to(self.source_dir)
-                language = Language.from_extension(file_path.suffix)
-                category = self._categorize_by_path(file_path)
-
-                header_content = ""
-                if self.config.llm.enabled:
-                    header_content = self._read_header(
-                        file_path, self.config.crawler.header_lines_for_classification
-                    )
+                if is_dir:
+                    if not entry.is_symlink() and not self._should_ignore(entry):
+                        subdirs.append(entry.path)
+                elif self._is_relevant_extension(entry.name) and not self._should_ignore(entry):
+                    yield entry
 
-                file_hash = self._compute_hash(file_path)
+            stack.extend(reversed(subdirs))
 
-                source_file = SourceFile(
-                    path=file_path,
-                    relative_path=relative_path,
-                    language=language,
-                    category=category,
-                    size_bytes=size_bytes,
-                    hash=file_hash,
-                    header_content=header_content,
-                )
-                files.append(source_file)
+    def _process_file(self, entry: os.DirEntry) -> SourceFile | None:
+        """Stat, categorize and hash a file; None if it is too large or unreadable."""
+        try:
+            # Free on Windows, where scandir already returned the stat data
+            stat = entry.stat()
+            if stat.st_size > self.config.crawler.max_file_size_kb * 1024:
+                return None
+            size_bytes = stat.st_size
+        except OSError:
+            return None
+
+        file_path = Path(entry.path)
+        relative_path = Path(entry.path[self._prefix_len :])
+        language = Language.from_extension(file_path.suffix)
+        category = self._categorize_by_path(file_path)
+
+        file_hash = None
+        if self.cache is not None:
+            file_hash = self.cache.get_unchanged_hash(relative_path, stat.st_mtime_ns, size_bytes)
+
+        header_content = ""
+        if self.config.llm.enabled:
+            num_lines = self.config.crawler.header_lines_for_classification
+            if file_hash is None:
+                # One read serves both the header and the hash
+                header_content, file_hash = self._read_header_and_hash(file_path, num_lines)
+            else:
+                header_content = self._read_header(file_path, num_lines)
+        elif file_hash is None:
+            file_hash = self._compute_hash(file_path)
+
+        return SourceFile(
+            path=file_path,
+            relative_path=relative_path,
+            language=language,
+            category=category,
+            size_bytes=size_bytes,
+            hash=file_hash,
+            header_content=header_content,
+            mtime_ns=stat.st_mtime_ns,
+        )
 
-        return files
+    def crawl(self) -> list[SourceFile]:
+        """Crawl the source directory and return a list of relevant files."""
+        if self.cache is not None:
+            self.cache.load()  # once, before worker threads read it
+
+        # Hashing and header reads are I/O bound and release the GIL, so
+        # process files on a thread pool; map() keeps the walk order
+        with ThreadPoolExecutor(max_workers=CRAWL_WORKERS) as executor:
+            results = executor.map(self._process_file, self._collect_entries())
+            return [f for f in results if f is not None]
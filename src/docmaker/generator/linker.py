@@ -1,12 +1,16 @@
 """Import resolver and linker for creating WikiLinks."""
 
 import logging
+import re
 from pathlib import Path
 
 from docmaker.models import FileSymbols, ImportDef, SymbolTable
 
 logger = logging.getLogger(__name__)
 
+# Identifiers immediately followed by an opening parenthesis, i.e. call sites
+_CALL_RE = re.compile(r"([A-Za-z_$][\w$]*)\s*\(")
+
 
 class ImportLinker:
     """Resolves imports and creates links between symbols."""
@@ -14,6 +18,37 @@ class ImportLinker:
     def __init__(self, symbol_table: SymbolTable):
         self.symbol_table = symbol_table
         self._import_cache: dict[str, Path | None] = {}
+        # Lookup indexes over the symbol table, rebuilt when its version changes
+        self._indexed_version: int | None = None
+        self._class_names: set[str] = set()
+        self._importers_by_name: dict[str, list[tuple[FileSymbols, str]]] = {}
+        # (type name, file path) -> resolve_type result; few distinct types repeat a lot
+        self._resolve_cache: dict[tuple[str, Path], str | None] = {}
+        # Same key -> rendered get_wikilink text, so repeated table rows skip all lookups
+        self._wikilink_cache: dict[tuple[str, Path], str] = {}
+        # Called name -> (class, method) pairs calling it; built on first find_callers
+        self._callers_index: dict[str, list[tuple[str, str]]] | None = None
+
+    def _ensure_indexes(self) -> None:
+        """Build the class name and importer indexes if the symbol table changed."""
+        if self._indexed_version == self.symbol_table.version:
+            return
+
+        self._class_names = {cls.name for cls in self.symbol_table.class_index.values()}
+
+        # Last dotted part of each imported module -> (importing file, module)
+        importers: dict[str, list[tuple[FileSymbols, str]]] = {}
+        for file_symbols in self.symbol_table.files.values():
+            for imp in file_symbols.imports:
+                if "." in imp.module:
+                    name = imp.module.rsplit(".", 1)[1]
+                    importers.setdefault(name, []).append((file_symbols, imp.module))
+        self._importers_by_name = importers
+
+        self._resolve_cache.clear()
+        self._wikilink_cache.clear()
+        self._callers_index = None
+        self._indexed_version = self.symbol_table.version
 
     def resolve_import(self, import_def: ImportDef) -> Path | None:
         """Resolve an import to a file path."""
@@ -33,6 +68,17 @@ class ImportLinker:
         if not type_name:
             return None
 
+        self._ensure_indexes()
+        key = (type_name, file_symbols.file.path)
+        if key in self._resolve_cache:
+            return self._resolve_cache[key]
+
+        fqn = self._resolve_type_uncached(type_name, file_symbols)
+        self._resolve_cache[key] = fqn
+        return fqn
+
+    def _resolve_type_uncached(self, type_name: str, file_symbols: FileSymbols) -> str | None:
+        """Resolve a type name against the class index, file imports and package."""
         base_type = type_name.split("<")[0].split("[")[0].strip()
 
         if base_type in self.symbol_table.class_index:
@@ -55,54 +101,71 @@ class ImportLinker:
 
     def get_wikilink(self, type_name: str, file_symbols: FileSymbols) -> str:
         """Get a WikiLink for a type if it exists in the codebase."""
+        self._ensure_indexes()
+        key = (type_name, file_symbols.file.path)
+        link = self._wikilink_cache.get(key)
+        if link is not None:
+            return link
+
+        link = f"`{type_name}`"
         fqn = self.resolve_type(type_name, file_symbols)
         if fqn:
             cls = self.symbol_table.class_index.get(fqn)
             if cls:
-                return f"[[{cls.name}]]"
+                link = f"[[{cls.name}]]"
 
-        return f"`{type_name}`"
+        self._wikilink_cache[key] = link
+        return link
 
     def get_class_link(self, class_name: str) -> str:
         """Get a WikiLink for a class by name."""
-        for fqn, cls in self.symbol_table.class_index.items():
-            if cls.name == class_name:
-                return f"[[{class_name}]]"
+        self._ensure_indexes()
+        if class_name in self._class_names:
+            return f"[[{class_name}]]"
 
         return f"`{class_name}`"
 
     def get_method_link(self, class_name: str, method_name: str) -> str:
         """Get a WikiLink to a specific method."""
-        for fqn, cls in self.symbol_table.class_index.items():
-            if cls.name == class_name:
-                return f"[[{class_name}#{method_name}]]"
+        self._ensure_indexes()
+        if class_name in self._class_names:
+            return f"[[{class_name}#{method_name}]]"
 
         return f"`{class_name}.{method_name}()`"
 
     def find_callers(self, class_name: str, method_name: str) -> list[tuple[str, str]]:
-        """Find all methods that call the given method (basic text search)."""
-        callers = []
-        target = f"{method_name}("
-
+        """Find methods whose bodies call a method of this name, as a whole identifier.
+
+        Callers come from a call-site index built once per symbol table version, so
+        a call to findById does not count as a call to ById. The receiver's class is
+        not checked.
+        """
+        self._ensure_indexes()
+        if self._callers_index is None:
+            self._callers_index = self._build_callers_index()
+
+        target = (class_name, method_name)
+        return [caller for caller in self._callers_index.get(method_name, []) if caller != target]
+
+    def _build_callers_index(self) -> dict[str, list[tuple[str, str]]]:
+        """Tokenize every method body once, mapping each called name to its callers."""
+        index: dict[str, list[tuple[str, str]]] = {}
         for file_symbols in self.symbol_table.files.values():
             for cls in file_symbols.classes:
                 for method in cls.methods:
-                    if target in method.source_code and not (
-                        cls.name == class_name and method.name == method_name
-                    ):
-                        callers.append((cls.name, method.name))
-
-        return callers
+                    caller = (cls.name, method.name)
+                    for name in set(_CALL_RE.findall(method.source_code)):
+                        index.setdefault(name, []).append(caller)
+        return index
 
     def find_usages(self, class_name: str) -> list[tuple[str, str]]:
         """Find all places where a class is used."""
+        self._ensure_indexes()
         usages = []
+        suffix = f".{class_name}"
 
-        for file_symbols in self.symbol_table.files.values():
-            for imp in file_symbols.imports:
-                if imp.module.endswith(f".{class_name}"):
-                    for cls in file_symbols.classes:
-                        usages.append((cls.name, "imports"))
-                        break
+        for file_symbols, module in self._importers_by_name.get(class_name.rsplit(".", 1)[-1], []):
+            if module.endswith(suffix) and file_symbols.classes:
+                usages.append((file_symbols.classes[0].name, "imports"))
 
         return usages
@@ -1,7 +1,12 @@
 """Markdown generator for Obsidian documentation."""
 
 import logging
+import multiprocessing
+import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
 
 from docmaker.config import OutputConfig
@@ -12,11 +17,71 @@ from docmaker.models import (
     EndpointDef,
     FileSymbols,
     FunctionDef,
+    Parameter,
     SymbolTable,
 )
 
 logger = logging.getLogger(__name__)
 
+# Frontmatter tags added for class annotations
+TAG_MAP = {
+    "RestController": "controller",
+    "Controller": "controller",
+    "Service": "service",
+    "Repository": "repository",
+    "Entity": "entity",
+    "Configuration": "configuration",
+    "interface": "interface",
+    "dataclass": "dataclass",
+    "Component": "component",
+    "Injectable": "injectable",
+}
+
+# Class roles in priority order: (role, index section title, annotations marking it)
+CLASS_ROLES = [
+    ("controller", "Controllers", frozenset({"RestController", "Controller"})),
+    ("service", "Services", frozenset({"Service"})),
+    ("repository", "Repositories", frozenset({"Repository"})),
+    ("entity", "Entities", frozenset({"Entity"})),
+]
+
+# Annotation name -> position of the role it marks in CLASS_ROLES
+_ROLE_RANK = {name: rank for rank, (_, _, names) in enumerate(CLASS_ROLES) for name in names}
+
+# Spring annotations that classify an endpoint parameter
+_PARAM_KIND_RE = re.compile(r"@(PathVariable|RequestParam|RequestBody)")
+
+# Below this many files, rendering in-process beats starting worker processes
+PARALLEL_GENERATE_MIN_FILES = 200
+
+# Files handed to a render worker per round trip
+GENERATE_CHUNK_SIZE = 32
+
+# Buffer size for page files, so a whole page is flushed in one write
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Each render worker's copy of the parent's generator, set by _init_worker
+_worker_generator: "MarkdownGenerator | None" = None
+
+
+def _init_worker(generator: "MarkdownGenerator") -> None:
+    """Keep the generator a render worker was started with."""
+    global _worker_generator
+    _worker_generator = generator
+
+
+def _write_lines(path: Path, lines: list[str]) -> None:
+    """Write lines separated by newlines without joining them into one string."""
+    with open(path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+        if lines:
+            f.write(lines[0])
+            f.writelines(map("\n".__add__, islice(lines, 1, None)))
+
+
+def _write_file_page(file_path: Path) -> Path:
+    """Render and write one file's page with the worker's generator."""
+    return _worker_generator._write_file_page(_worker_generator.symbol_table.files[file_path])
+
 
 class MarkdownGenerator:
     """Generates Obsidian-compatible markdown documentation."""
@@ -26,23 +91,35 @@ class MarkdownGenerator:
         self.symbol_table = symbol_table
         self.linker = ImportLinker(symbol_table)
         self.output_dir = config.output_dir
+        # id(class) -> (class, its annotation names); holding the class keeps its id unique
+        self._ann_names: dict[int, tuple[ClassDef, frozenset[str]]] = {}
+        # Output directories already created during this run
+        self._made_dirs: set[Path] = set()
+        self._set_run_time()
+
+    def __getstate__(self) -> dict:
+        """Pickle for a render worker, dropping the id-keyed annotation cache."""
+        # Class ids are only meaningful in this process, so workers start empty
+        state = self.__dict__.copy()
+        state["_ann_names"] = {}
+        return state
+
+    def _set_run_time(self) -> None:
+        """Record the timestamp stamped on every page of a generation run."""
+        now = datetime.now()
+        self._run_timestamp = now.isoformat()
+        self._run_pretty = now.strftime("%Y-%m-%d %H:%M")
 
     def generate_all(self) -> list[Path]:
         """Generate documentation for all files in the symbol table."""
         generated_files = []
+        self._set_run_time()
+        self._ann_names.clear()
+        self._made_dirs.clear()
 
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-
-        for file_path, file_symbols in self.symbol_table.files.items():
-            output_path = self._get_output_path(file_symbols)
-            content = self._generate_file_doc(file_symbols)
+        self._ensure_dir(self.output_dir)
 
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(content)
-
-            generated_files.append(output_path)
-            logger.debug(f"Generated: {output_path}")
+        generated_files.extend(self._write_file_pages())
 
         if self.config.generate_index:
             index_path = self._generate_index()
@@ -58,6 +135,41 @@ class MarkdownGenerator:
 
         return generated_files
 
+    def _write_file_pages(self) -> list[Path]:
+        """Write every file's page, using worker processes for large symbol tables."""
+        files = self.symbol_table.files
+        if len(files) < PARALLEL_GENERATE_MIN_FILES:
+            return [self._write_file_page(file_symbols) for file_symbols in files.values()]
+
+        # Pages only read the symbol table, so render and write them in
+        # processes that each get one copy of this generator up front. Spawn
+        # rather than fork, since the app calls this from a job thread
+        logger.debug("Generating %d file pages in worker processes", len(files))
+        with ProcessPoolExecutor(
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self,),
+        ) as executor:
+            return list(executor.map(_write_file_page, files, chunksize=GENERATE_CHUNK_SIZE))
+
+    def _write_file_page(self, file_symbols: FileSymbols) -> Path:
+        """Render a file's documentation and write it to its output path."""
+        output_path = self._get_output_path(file_symbols)
+        lines: list[str] = []
+        self._write_file_doc(file_symbols, lines)
+
+        self._ensure_dir(output_path.parent)
+        _write_lines(output_path, lines)
+
+        logger.debug(f"Generated: {output_path}")
+        return output_path
+
+    def _ensure_dir(self, directory: Path) -> None:
+        """Create an output directory unless it was already created this run."""
+        if directory not in self._made_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._made_dirs.add(directory)
+
     def _get_output_path(self, file_symbols: FileSymbols) -> Path:
         """Get the output path for a file's documentation."""
         relative = file_symbols.file.relative_path
@@ -70,9 +182,13 @@ class MarkdownGenerator:
 
     def _generate_file_doc(self, file_symbols: FileSymbols) -> str:
         """Generate documentation for a single file."""
-        lines = []
+        lines: list[str] = []
+        self._write_file_doc(file_symbols, lines)
+        return "\n".join(lines)
 
-        lines.append(self._generate_frontmatter(file_symbols))
+    def _write_file_doc(self, file_symbols: FileSymbols, lines: list[str]) -> None:
+        """Append the lines of a file's documentation to lines."""
+        self._write_frontmatter(file_symbols, lines)
 
         lines.append(f"# {file_symbols.file.relative_path.stem}\n")
 
@@ -94,52 +210,46 @@ class MarkdownGenerator:
             lines.append("")
 
         for cls in file_symbols.classes:
-            lines.append(self._generate_class_doc(cls, file_symbols))
+            self._write_class_doc(cls, file_symbols, lines)
 
         for func in file_symbols.functions:
-            lines.append(self._generate_function_doc(func, file_symbols))
+            self._write_function_doc(func, file_symbols, lines)
 
-        endpoints = [ep for ep in file_symbols.endpoints]
-        if endpoints:
+        if file_symbols.endpoints:
             lines.append("## REST Endpoints\n")
-            for endpoint in endpoints:
-                lines.append(self._generate_endpoint_doc(endpoint, file_symbols))
-
-        return "\n".join(lines)
+            for endpoint in file_symbols.endpoints:
+                self._write_endpoint_doc(endpoint, file_symbols, lines)
 
     def _generate_frontmatter(self, file_symbols: FileSymbols) -> str:
         """Generate YAML frontmatter compatible with Obsidian."""
+        lines: list[str] = []
+        self._write_frontmatter(file_symbols, lines)
+        return "\n".join(lines)
+
+    def _write_frontmatter(self, file_symbols: FileSymbols, lines: list[str]) -> None:
+        """Append the lines of a file's frontmatter to lines."""
         tags = [file_symbols.file.language.value, file_symbols.file.category.value]
 
         for cls in file_symbols.classes:
-            for ann in cls.annotations:
-                tag_map = {
-                    "RestController": "controller",
-                    "Controller": "controller",
-                    "Service": "service",
-                    "Repository": "repository",
-                    "Entity": "entity",
-                    "Configuration": "configuration",
-                    "interface": "interface",
-                    "dataclass": "dataclass",
-                    "Component": "component",
-                    "Injectable": "injectable",
-                }
-                tag = tag_map.get(ann.name)
-                if tag:
-                    tags.append(tag)
+            if not self._annotation_names(cls).isdisjoint(TAG_MAP):
+                for ann in cls.annotations:
+                    tag = TAG_MAP.get(ann.name)
+                    if tag:
+                        tags.append(tag)
 
         # Collect class names as aliases so [[ClassName]] WikiLinks resolve
         aliases = [cls.name for cls in file_symbols.classes]
 
-        lines = [
-            "---",
-            f"title: {file_symbols.file.relative_path.stem}",
-            f"path: {file_symbols.file.relative_path}",
-            f"language: {file_symbols.file.language.value}",
-            f"category: {file_symbols.file.category.value}",
-            "tags:",
-        ]
+        lines.extend(
+            [
+                "---",
+                f"title: {file_symbols.file.relative_path.stem}",
+                f"path: {file_symbols.file.relative_path}",
+                f"language: {file_symbols.file.language.value}",
+                f"category: {file_symbols.file.category.value}",
+                "tags:",
+            ]
+        )
         for tag in tags:
             lines.append(f"  - {tag}")
         if aliases:
@@ -148,14 +258,17 @@ class MarkdownGenerator:
                 lines.append(f"  - {alias}")
         if file_symbols.package:
             lines.append(f"package: {file_symbols.package}")
-        lines.append(f"generated: {datetime.now().isoformat()}")
+        lines.append(f"generated: {self._run_timestamp}")
         lines.append("---\n")
-        return "\n".join(lines)
 
     def _generate_class_doc(self, cls: ClassDef, file_symbols: FileSymbols) -> str:
         """Generate documentation for a class."""
-        lines = []
+        lines: list[str] = []
+        self._write_class_doc(cls, file_symbols, lines)
+        return "\n".join(lines)
 
+    def _write_class_doc(self, cls: ClassDef, file_symbols: FileSymbols, lines: list[str]) -> None:
+        """Append the lines of a class's documentation to lines."""
         lines.append(f"## Class: `{cls.name}`\n")
 
         if cls.annotations:
@@ -206,16 +319,20 @@ class MarkdownGenerator:
         if cls.methods:
             lines.append("### Methods\n")
             for method in cls.methods:
-                lines.append(self._generate_method_doc(method, cls, file_symbols))
-
-        return "\n".join(lines)
+                self._write_method_doc(method, cls, file_symbols, lines)
 
     def _generate_method_doc(
         self, method: FunctionDef, cls: ClassDef, file_symbols: FileSymbols
     ) -> str:
         """Generate documentation for a method."""
-        lines = []
+        lines: list[str] = []
+        self._write_method_doc(method, cls, file_symbols, lines)
+        return "\n".join(lines)
 
+    def _write_method_doc(
+        self, method: FunctionDef, cls: ClassDef, file_symbols: FileSymbols, lines: list[str]
+    ) -> None:
+        """Append the lines of a method's documentation to lines."""
         lines.append(f"#### `{method.name}()`\n")
 
         if method.annotations:
@@ -259,12 +376,16 @@ class MarkdownGenerator:
 
         lines.append(f"📍 *Line {method.line_number}*\n")
 
-        return "\n".join(lines)
-
     def _generate_function_doc(self, func: FunctionDef, file_symbols: FileSymbols) -> str:
         """Generate documentation for a standalone function."""
-        lines = []
+        lines: list[str] = []
+        self._write_function_doc(func, file_symbols, lines)
+        return "\n".join(lines)
 
+    def _write_function_doc(
+        self, func: FunctionDef, file_symbols: FileSymbols, lines: list[str]
+    ) -> None:
+        """Append the lines of a function's documentation to lines."""
         lines.append(f"## Function: `{func.name}()`\n")
 
         if func.annotations:
@@ -303,12 +424,16 @@ class MarkdownGenerator:
             lines.append("```")
             lines.append("</details>\n")
 
-        return "\n".join(lines)
-
     def _generate_endpoint_doc(self, endpoint: EndpointDef, file_symbols: FileSymbols) -> str:
         """Generate documentation for a REST endpoint."""
-        lines = []
+        lines: list[str] = []
+        self._write_endpoint_doc(endpoint, file_symbols, lines)
+        return "\n".join(lines)
 
+    def _write_endpoint_doc(
+        self, endpoint: EndpointDef, file_symbols: FileSymbols, lines: list[str]
+    ) -> None:
+        """Append the lines of an endpoint's documentation to lines."""
         method_badge = self._get_method_badge(endpoint.http_method)
         lines.append(f"### {method_badge} `{endpoint.path}`\n")
 
@@ -327,15 +452,18 @@ class MarkdownGenerator:
             lines.append(f"| **Request Body** | {body_link} |")
         lines.append("")
 
-        path_params = [
-            p for p in endpoint.parameters if p.description and "@PathVariable" in p.description
-        ]
-        query_params = [
-            p for p in endpoint.parameters if p.description and "@RequestParam" in p.description
-        ]
-        body_params = [
-            p for p in endpoint.parameters if p.description and "@RequestBody" in p.description
-        ]
+        params_by_kind: dict[str, list[Parameter]] = {
+            "PathVariable": [],
+            "RequestParam": [],
+            "RequestBody": [],
+        }
+        for param in endpoint.parameters:
+            if param.description:
+                for kind in dict.fromkeys(_PARAM_KIND_RE.findall(param.description)):
+                    params_by_kind[kind].append(param)
+        path_params = params_by_kind["PathVariable"]
+        query_params = params_by_kind["RequestParam"]
+        body_params = params_by_kind["RequestBody"]
 
         if path_params:
             lines.append("#### Path Parameters\n")
@@ -394,20 +522,18 @@ class MarkdownGenerator:
 
         lines.append(f"📍 *{endpoint.file_path.name}:{endpoint.line_number}*\n")
 
-        return "\n".join(lines)
-
     def _generate_index(self) -> Path:
         """Generate the main index file."""
         lines = []
 
         lines.append("---")
         lines.append("title: Documentation Index")
-        lines.append(f"generated: {datetime.now().isoformat()}")
+        lines.append(f"generated: {self._run_timestamp}")
         lines.append("---\n")
 
         lines.append("# Documentation Index\n")
 
-        lines.append(f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}*\n")
+        lines.append(f"*Generated: {self._run_pretty}*\n")
 
         lines.append("## Statistics\n")
         lines.append(f"- **Total Files:** {len(self.symbol_table.files)}")
@@ -415,60 +541,29 @@ class MarkdownGenerator:
         lines.append(f"- **Total Endpoints:** {len(self.symbol_table.endpoint_index)}")
         lines.append("")
 
-        controllers = []
-        services = []
-        repositories = []
-        entities = []
-        others = []
-
-        for fqn, cls in self.symbol_table.class_index.items():
-            ann_names = {a.name for a in cls.annotations}
-            if "RestController" in ann_names or "Controller" in ann_names:
-                controllers.append(cls)
-            elif "Service" in ann_names:
-                services.append(cls)
-            elif "Repository" in ann_names:
-                repositories.append(cls)
-            elif "Entity" in ann_names:
-                entities.append(cls)
-            else:
-                others.append(cls)
-
-        if controllers:
-            lines.append("## Controllers\n")
-            for cls in sorted(controllers, key=lambda c: c.name):
-                lines.append(f"- [[{cls.name}]]")
-            lines.append("")
+        by_role: dict[str | None, list[ClassDef]] = {role: [] for role, _, _ in CLASS_ROLES}
+        by_role[None] = []
+        for cls in self.symbol_table.class_index.values():
+            by_role[self._class_role(cls)].append(cls)
 
-        if services:
-            lines.append("## Services\n")
-            for cls in sorted(services, key=lambda c: c.name):
-                lines.append(f"- [[{cls.name}]]")
-            lines.append("")
-
-        if repositories:
-            lines.append("## Repositories\n")
-            for cls in sorted(repositories, key=lambda c: c.name):
-                lines.append(f"- [[{cls.name}]]")
-            lines.append("")
-
-        if entities:
-            lines.append("## Entities\n")
-            for cls in sorted(entities, key=lambda c: c.name):
-                lines.append(f"- [[{cls.name}]]")
-            lines.append("")
+        for role, title, _ in CLASS_ROLES:
+            if by_role[role]:
+                lines.append(f"## {title}\n")
+                for cls in sorted(by_role[role], key=attrgetter("name")):
+                    lines.append(f"- [[{cls.name}]]")
+                lines.append("")
 
+        others = by_role[None]
         if others:
             lines.append("## Other Classes\n")
-            for cls in sorted(others, key=lambda c: c.name)[:50]:
+            for cls in sorted(others, key=attrgetter("name"))[:50]:
                 lines.append(f"- [[{cls.name}]]")
             if len(others) > 50:
                 lines.append(f"- *... and {len(others) - 50} more*")
             lines.append("")
 
         index_path = self.output_dir / "index.md"
-        with open(index_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
+        _write_lines(index_path, lines)
 
         return index_path
 
@@ -481,7 +576,7 @@ class MarkdownGenerator:
 
         lines.append("---")
         lines.append("title: API Endpoints")
-        lines.append(f"generated: {datetime.now().isoformat()}")
+        lines.append(f"generated: {self._run_timestamp}")
         lines.append("---\n")
 
         lines.append("# API Endpoints\n")
@@ -500,14 +595,13 @@ class MarkdownGenerator:
 
             lines.append("| Method | Path | Handler |")
             lines.append("|--------|------|---------|")
-            for ep in sorted(endpoints, key=lambda e: e.path):
+            for ep in sorted(endpoints, key=attrgetter("path")):
                 badge = self._get_method_badge(ep.http_method)
                 lines.append(f"| {badge} | `{ep.path}` | `{ep.handler_method}()` |")
             lines.append("")
 
         index_path = self.output_dir / "endpoints.md"
-        with open(index_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
+        _write_lines(index_path, lines)
 
         return index_path
 
@@ -567,7 +661,7 @@ class MarkdownGenerator:
             lines.append("  - package")
             if pkg:
                 lines.append(f"package: {pkg}")
-            lines.append(f"generated: {datetime.now().isoformat()}")
+            lines.append(f"generated: {self._run_timestamp}")
             lines.append("---\n")
 
             lines.append(f"# {moc_title}\n")
@@ -599,18 +693,10 @@ class MarkdownGenerator:
 
             if classes_in_pkg:
                 lines.append("## Classes\n")
-                for cls in sorted(classes_in_pkg, key=lambda c: c.name):
-                    ann_names = {a.name for a in cls.annotations}
-                    role = ""
-                    if "RestController" in ann_names or "Controller" in ann_names:
-                        role = " `controller`"
-                    elif "Service" in ann_names:
-                        role = " `service`"
-                    elif "Repository" in ann_names:
-                        role = " `repository`"
-                    elif "Entity" in ann_names:
-                        role = " `entity`"
-                    lines.append(f"- [[{cls.name}]]{role}")
+                for cls in sorted(classes_in_pkg, key=attrgetter("name")):
+                    role = self._class_role(cls)
+                    role_tag = f" `{role}`" if role else ""
+                    lines.append(f"- [[{cls.name}]]{role_tag}")
                 lines.append("")
 
             # Standalone functions
@@ -627,14 +713,12 @@ class MarkdownGenerator:
                 lines.append("")
 
             # Endpoints in this package
-            endpoints_in_pkg = []
-            for fs in file_symbols_list:
-                for ep in fs.endpoints:
-                    endpoints_in_pkg.append(ep)
-
+            endpoints_in_pkg = sorted(
+                (ep for fs in file_symbols_list for ep in fs.endpoints), key=attrgetter("path")
+            )
             if endpoints_in_pkg:
                 lines.append("## Endpoints\n")
-                for ep in sorted(endpoints_in_pkg, key=lambda e: e.path):
+                for ep in endpoints_in_pkg:
                     badge = self._get_method_badge(ep.http_method)
                     lines.append(f"- {badge} `{ep.path}` - [[{ep.handler_class}]]")
                 lines.append("")
@@ -642,7 +726,7 @@ class MarkdownGenerator:
             # Files list
             if file_symbols_list:
                 lines.append("## Files\n")
-                for fs in sorted(file_symbols_list, key=lambda f: f.file.relative_path.name):
+                for fs in sorted(file_symbols_list, key=attrgetter("file.relative_path.name")):
                     stem = fs.file.relative_path.stem
                     lines.append(f"- [[{stem}]] (`{fs.file.relative_path}`)")
                 lines.append("")
@@ -658,17 +742,29 @@ class MarkdownGenerator:
             else:
                 moc_dir = self.output_dir
 
-            moc_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(moc_dir)
             moc_path = moc_dir / f"MOC - {pkg_name}.md"
 
-            with open(moc_path, "w", encoding="utf-8") as f:
-                f.write("\n".join(lines))
+            _write_lines(moc_path, lines)
 
             generated.append(moc_path)
             logger.debug(f"Generated MOC: {moc_path}")
 
         return generated
 
+    def _annotation_names(self, cls: ClassDef) -> frozenset[str]:
+        """Get the names of a class's annotations, computed once per run."""
+        cached = self._ann_names.get(id(cls))
+        if cached is None:
+            cached = (cls, frozenset(a.name for a in cls.annotations))
+            self._ann_names[id(cls)] = cached
+        return cached[1]
+
+    def _class_role(self, cls: ClassDef) -> str | None:
+        """Get the highest-priority role in CLASS_ROLES a class is annotated with."""
+        ranks = [_ROLE_RANK[name] for name in self._annotation_names(cls) if name in _ROLE_RANK]
+        return CLASS_ROLES[min(ranks)][0] if ranks else None
+
     def _format_annotation(self, ann: Annotation) -> str:
         """Format an annotation for display."""
         if ann.arguments:
@@ -682,13 +778,13 @@ class MarkdownGenerator:
         if class_name == "*":
             return f"`{module}`"
 
-        if module in self.symbol_table.class_index:
+        # A class with this simple name in any package still gets a link
+        if (
+            module in self.symbol_table.class_index
+            or class_name in self.symbol_table.class_suffix_index
+        ):
             return f"[[{class_name}]] (`{module}`)"
 
-        for fqn in self.symbol_table.class_index:
-            if fqn.endswith(f".{class_name}"):
-                return f"[[{class_name}]] (`{module}`)"
-
         return f"`{module}`"
 
     def _get_method_badge(self, method: str) -> str:
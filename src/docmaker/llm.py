@@ -386,4 +386,6 @@ class Summarizer:
                     func.summary = summary
                     method_count += 1
 
+        if class_count or method_count:
+            symbol_table.mark_changed()
         return class_count, method_count
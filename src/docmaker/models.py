@@ -1,5 +1,6 @@
 """Data models for docmaker."""
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -55,6 +56,7 @@ class SourceFile:
     size_bytes: int = 0
     hash: str = ""
     header_content: str = ""
+    mtime_ns: int = 0
 
 
 @dataclass
@@ -112,6 +114,11 @@ class ClassDef:
     source_code: str = ""
     summary: str | None = None
 
+    @property
+    def is_interface(self) -> bool:
+        """Whether the parser marked this class as an interface."""
+        return "interface" in self.modifiers
+
 
 @dataclass
 class FieldDef:
@@ -173,18 +180,38 @@ class SymbolTable:
     class_index: dict[str, ClassDef] = field(default_factory=dict)
     endpoint_index: dict[str, EndpointDef] = field(default_factory=dict)
     function_index: dict[str, FunctionDef] = field(default_factory=dict)
+    # Trailing dotted parts of each class FQN ("Foo", "pkg.Foo") -> first matching FQN
+    class_suffix_index: dict[str, str] = field(default_factory=dict)
+    # Bumped on every change so derived data (e.g. the code graph) can be reused safely
+    version: int = 0
+
+    def mark_changed(self) -> None:
+        """Record an in-place change to symbols already in the table, such as summaries."""
+        self.version += 1
 
     def add_file_symbols(self, symbols: FileSymbols) -> None:
         """Add symbols from a file to the table."""
+        self.version += 1
         self.files[symbols.file.path] = symbols
 
         for cls in symbols.classes:
             fqn = f"{symbols.package}.{cls.name}" if symbols.package else cls.name
             self.class_index[fqn] = cls
 
+            parts = fqn.split(".")
+            for i in range(1, len(parts)):
+                self.class_suffix_index.setdefault(".".join(parts[i:]), fqn)
+
+            # Intern annotation names, including those of cached or worker-parsed
+            # symbols, so the generator's name comparisons hit on identity
+            for ann in cls.annotations:
+                ann.name = sys.intern(ann.name)
+
             for method in cls.methods:
                 method_fqn = f"{fqn}.{method.name}"
                 self.function_index[method_fqn] = method
+                for ann in method.annotations:
+                    ann.name = sys.intern(ann.name)
 
         for func in symbols.functions:
             fqn = f"{symbols.package}.{func.name}" if symbols.package else func.name
@@ -194,6 +221,16 @@ class SymbolTable:
             key = f"{endpoint.http_method}:{endpoint.path}"
             self.endpoint_index[key] = endpoint
 
+    def find_class(self, name: str) -> tuple[str, ClassDef] | None:
+        """Find a class by FQN, or failing that by simple name or trailing FQN parts."""
+        cls = self.class_index.get(name)
+        if cls is not None:
+            return name, cls
+        fqn = self.class_suffix_index.get(name)
+        if fqn is not None:
+            return fqn, self.class_index[fqn]
+        return None
+
     def resolve_import(self, import_path: str) -> ClassDef | None:
         """Resolve an import to a class definition."""
         return self.class_index.get(import_path)
@@ -75,3 +75,8 @@ def get_parser_registry() -> ParserRegistry:
 def get_parser(language: Language) -> BaseParser | None:
     """Convenience function to get a parser for a language."""
     return get_parser_registry().get_parser(language)
+
+
+def parse_file(file: SourceFile) -> FileSymbols | None:
+    """Parse a file with the default registry; usable as a worker process target."""
+    return get_parser_registry().parse(file)
@@ -6,7 +6,7 @@ from pathlib import Path
 from rich.console import Console
 from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
 
-from docmaker.cache import CacheManager
+from docmaker.cache import CacheManager, SymbolCache
 from docmaker.config import DocmakerConfig
 from docmaker.crawler import FileCrawler
 from docmaker.generator.markdown import MarkdownGenerator
@@ -20,14 +20,20 @@ logger = logging.getLogger(__name__)
 class Pipeline:
     """Orchestrates the complete code-to-documentation pipeline."""
 
-    def __init__(self, config: DocmakerConfig, console: Console | None = None):
+    def __init__(
+        self,
+        config: DocmakerConfig,
+        console: Console | None = None,
+        symbol_cache: SymbolCache | None = None,
+    ):
         self.config = config
         self.console = console or Console()
-        self.crawler = FileCrawler(config)
+        self.cache = CacheManager(config.source_dir / config.cache_file)
+        self.crawler = FileCrawler(config, self.cache)
         self.classifier = FileClassifier(config.llm)
         self.summarizer = Summarizer(config.llm)
-        self.cache = CacheManager(config.source_dir / config.cache_file)
         self.parser_registry = get_parser_registry()
+        self.symbol_cache = symbol_cache
         self.symbol_table = SymbolTable()
 
     def run(self, incremental: bool = False) -> list[Path]:
@@ -72,8 +78,7 @@ class Pipeline:
 
     def _filter_changed_files(self, files: list[SourceFile]) -> list[SourceFile]:
         """Filter to only changed files (incremental mode)."""
-        changed = self.cache.get_changed_files(files)
-        deleted = self.cache.get_deleted_files(files)
+        changed, deleted = self.cache.diff(files)
 
         if deleted:
             self.console.print(f"[yellow]Detected {len(deleted)} deleted files[/yellow]")
@@ -134,7 +139,11 @@ class Pipeline:
             task = progress.add_task("Parsing files...", total=len(parseable))
 
             for file in parseable:
-                symbols = self.parser_registry.parse(file)
+                symbols = self.symbol_cache.get(file) if self.symbol_cache else None
+                if symbols is None:
+                    symbols = self.parser_registry.parse(file)
+                    if symbols and self.symbol_cache:
+                        self.symbol_cache.put(file, symbols)
                 if symbols:
                     self.symbol_table.add_file_symbols(symbols)
                 progress.advance(task)
@@ -199,6 +208,8 @@ class Pipeline:
                         func.summary = summary
                     progress.advance(task)
 
+        self.symbol_table.mark_changed()
+
         class_summaries = sum(
             1 for fs in self.symbol_table.files.values() for cls in fs.classes if cls.summary
         )
@@ -10,6 +10,7 @@ Usage:
 import json
 import logging
 import sys
+import uuid
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
 from typing import Any
@@ -38,6 +39,7 @@ class BridgeState:
         self.config: DocmakerConfig | None = None
         self.files: list[SourceFile] = []
         self.graph_dict: dict[str, Any] | None = None
+        self.job_results: dict[str, str] = {}
 
 
 state = BridgeState()
@@ -180,6 +182,19 @@ def ipc_get_endpoint_details(endpoint_key: str) -> str:
     })
 
 
+def ipc_get_details_bulk(keys_json: str) -> str:
+    if not state.symbol_table:
+        return json.dumps({"error": "No symbol table available"})
+
+    keys = json.loads(keys_json)
+    return json.dumps({
+        "classes": {key: json.loads(ipc_get_class_details(key)) for key in keys.get("classes", [])},
+        "endpoints": {
+            key: json.loads(ipc_get_endpoint_details(key)) for key in keys.get("endpoints", [])
+        },
+    })
+
+
 def ipc_get_project_info() -> str:
     if not state.current_project:
         return json.dumps({"loaded": False})
@@ -224,6 +239,23 @@ def ipc_reset_settings_ipc() -> str:
         return json.dumps({"error": str(e)})
 
 
+# Jobs run synchronously here; the result is ready by the first poll
+def ipc_start_job(name: str, arg: str) -> str:
+    if name not in ("parse_only",):
+        return json.dumps({"error": f"Not a job bridge: {name}"})
+
+    job_id = uuid.uuid4().hex
+    state.job_results[job_id] = METHODS[name](arg)
+    return json.dumps({"jobId": job_id})
+
+
+def ipc_get_job_result(job_id: str) -> str:
+    result = state.job_results.pop(job_id, None)
+    if result is None:
+        return json.dumps({"error": f"Unknown job: {job_id}"})
+    return json.dumps({"done": True, "result": json.loads(result)})
+
+
 # No-op stubs for GUI-only methods
 def ipc_select_folder() -> str:
     return json.dumps({"path": None})
@@ -245,9 +277,12 @@ def ipc_get_window_size() -> str:
 
 METHODS: dict[str, Any] = {
     "parse_only": ipc_parse_only,
+    "start_job": ipc_start_job,
+    "get_job_result": ipc_get_job_result,
     "get_graph_data": ipc_get_graph_data,
     "get_class_details": ipc_get_class_details,
     "get_endpoint_details": ipc_get_endpoint_details,
+    "get_details_bulk": ipc_get_details_bulk,
     "get_project_info": ipc_get_project_info,
     "get_settings": ipc_get_settings,
     "save_settings_ipc": ipc_save_settings_ipc,
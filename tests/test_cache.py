@@ -0,0 +1,237 @@
+"""Tests for the cache module."""
+
+import hashlib
+import json
+import os
+from dataclasses import asdict, replace
+from pathlib import Path
+
+import pytest
+
+from docmaker.cache import HASH_ALGORITHM, MMAP_THRESHOLD, CacheManager, SymbolCache, hash_file
+from docmaker.models import ClassDef, FileCategory, FileSymbols, Language, SourceFile
+
+
+@pytest.fixture
+def source_file(tmp_path) -> SourceFile:
+    return SourceFile(
+        path=tmp_path / "Main.java",
+        relative_path=Path("Main.java"),
+        language=Language.JAVA,
+        category=FileCategory.BACKEND,
+        hash="abc123",
+    )
+
+
+@pytest.fixture
+def file_symbols(source_file) -> FileSymbols:
+    return FileSymbols(
+        file=source_file,
+        package="com.example",
+        classes=[ClassDef(name="Main", file_path=source_file.path, line_number=1, end_line=9)],
+    )
+
+
+@pytest.mark.skipif(HASH_ALGORITHM != "sha256", reason="blake3 is installed")
+@pytest.mark.parametrize("size", [0, 100, MMAP_THRESHOLD + 1])
+def test_hash_file_is_sha256_of_contents(tmp_path, size):
+    path = tmp_path / "data.bin"
+    path.write_bytes(bytes(range(256)) * (size // 256) + b"x" * (size % 256))
+
+    assert hash_file(path) == hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+class TestSymbolCache:
+    def test_miss_then_hit(self, tmp_path, source_file, file_symbols):
+        cache = SymbolCache(tmp_path / "symbols")
+
+        assert cache.get(source_file) is None
+        cache.put(source_file, file_symbols)
+        cached = cache.get(source_file)
+
+        assert cached is not None
+        assert cached.classes[0].name == "Main"
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_hit_uses_current_source_file(self, tmp_path, source_file, file_symbols):
+        cache = SymbolCache(tmp_path / "symbols")
+        cache.put(source_file, file_symbols)
+
+        source_file.category = FileCategory.FRONTEND
+        assert cache.get(source_file).file is source_file
+
+    def test_changed_hash_misses(self, tmp_path, source_file, file_symbols):
+        cache = SymbolCache(tmp_path / "symbols")
+        cache.put(source_file, file_symbols)
+
+        source_file.hash = "def456"
+        assert cache.get(source_file) is None
+
+    def test_files_without_hash_are_not_cached(self, tmp_path, source_file, file_symbols):
+        cache = SymbolCache(tmp_path / "symbols")
+        source_file.hash = ""
+
+        cache.put(source_file, file_symbols)
+
+        assert cache.get(source_file) is None
+        assert not (tmp_path / "symbols").exists()
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path, source_file, file_symbols):
+        cache = SymbolCache(tmp_path / "symbols")
+        cache.put(source_file, file_symbols)
+        for entry in (tmp_path / "symbols").rglob("*.pickle"):
+            entry.write_bytes(b"not a pickle")
+
+        assert cache.get(source_file) is None
+
+    def test_put_drops_entries_for_older_contents(self, tmp_path, source_file, file_symbols):
+        cache = SymbolCache(tmp_path / "symbols")
+        cache.put(source_file, file_symbols)
+
+        source_file.hash = "def456"
+        cache.put(source_file, file_symbols)
+
+        assert [p.name for p in (tmp_path / "symbols").rglob("*.pickle")] == ["def456.pickle"]
+
+    def test_creating_cache_leaves_other_tags_alone(self, tmp_path):
+        other = tmp_path / "symbols" / "0.0.1-py3.8-0000"
+        other.mkdir(parents=True)
+        os.utime(other, (0, 0))
+
+        SymbolCache(tmp_path / "symbols")
+
+        assert other.exists()
+
+    def test_first_put_removes_only_long_unused_tags(self, tmp_path, source_file, file_symbols):
+        stale = tmp_path / "symbols" / "0.0.1-py3.8-0000"
+        recent = tmp_path / "symbols" / "0.0.1-py3.12-1111"
+        (stale / "ab").mkdir(parents=True)
+        recent.mkdir()
+        os.utime(stale, (0, 0))
+        cache = SymbolCache(tmp_path / "symbols")
+
+        cache.put(source_file, file_symbols)
+
+        assert not stale.exists()
+        assert recent.exists()
+        assert cache.get(source_file) is not None
+
+
+class TestCacheManager:
+    def test_unchanged_file_is_not_changed(self, tmp_path, source_file):
+        cache = CacheManager(tmp_path / "cache.json")
+        cache.update_file(source_file)
+        cache.save()
+
+        assert not CacheManager(tmp_path / "cache.json").is_file_changed(source_file)
+
+    def test_entry_from_other_hash_algorithm_is_changed(self, tmp_path, source_file):
+        cache = CacheManager(tmp_path / "cache.json")
+        cache.update_file(source_file)
+        entries = cache.load().entries
+        entries["Main.java"] = replace(entries["Main.java"], hash_algorithm="md5")
+
+        assert cache.is_file_changed(source_file)
+
+    def test_unchanged_hash_requires_matching_stat(self, tmp_path, source_file):
+        cache = CacheManager(tmp_path / "cache.json")
+        source_file.mtime_ns = 1_000
+        cache.update_file(source_file)
+        rel = source_file.relative_path
+
+        assert cache.get_unchanged_hash(rel, 1_000, source_file.size_bytes) == "abc123"
+        assert cache.get_unchanged_hash(rel, 2_000, source_file.size_bytes) is None
+        assert cache.get_unchanged_hash(rel, 1_000, source_file.size_bytes + 1) is None
+        assert cache.get_unchanged_hash(Path("Other.java"), 1_000, 0) is None
+
+    def test_corrupt_cache_file_loads_empty(self, tmp_path):
+        (tmp_path / "cache.json").write_bytes(b"{not json")
+
+        assert CacheManager(tmp_path / "cache.json").load().entries == {}
+
+    def test_save_appends_only_changed_entries(self, tmp_path, source_file):
+        path = tmp_path / "cache.json"
+        cache = CacheManager(path)
+        for name in ("A.java", "B.java", "C.java", "D.java", "E.java"):
+            cache.update_file(replace(source_file, relative_path=Path(name)))
+        cache.save()
+        written = path.read_bytes()
+
+        cache = CacheManager(path)
+        cache.update_file(replace(source_file, relative_path=Path("A.java"), hash="def456"))
+        cache.remove_file(Path("B.java"))
+        cache.save()
+
+        assert path.read_bytes().startswith(written)
+        entries = CacheManager(path).load().entries
+        assert sorted(entries) == ["A.java", "C.java", "D.java", "E.java"]
+        assert entries["A.java"].hash == "def456"
+
+    def test_save_compacts_once_appends_outgrow_entries(self, tmp_path, source_file):
+        path = tmp_path / "cache.json"
+        cache = CacheManager(path)
+        cache.update_file(source_file)
+        cache.save()
+
+        for i in range(3):
+            cache.update_file(replace(source_file, hash=f"hash{i}"))
+            cache.save()
+
+        assert len(path.read_bytes().splitlines()) == 2
+        assert CacheManager(path).load().entries["Main.java"].hash == "hash2"
+
+    def test_truncated_last_record_is_ignored(self, tmp_path, source_file):
+        path = tmp_path / "cache.json"
+        cache = CacheManager(path)
+        cache.update_file(source_file)
+        cache.save()
+        with open(path, "ab") as f:
+            f.write(b'{"relative_path": "Other.ja')
+
+        assert list(CacheManager(path).load().entries) == ["Main.java"]
+
+    def test_large_cache_file_is_replayed(self, tmp_path, source_file):
+        path = tmp_path / "cache.json"
+        cache = CacheManager(path)
+        for i in range(1000):
+            cache.update_file(replace(source_file, relative_path=Path(f"F{i}.java")))
+        cache.save()
+        cache.remove_file(Path("F0.java"))
+        cache.save()
+        assert path.stat().st_size >= MMAP_THRESHOLD
+
+        entries = CacheManager(path).load().entries
+
+        assert len(entries) == 999
+        assert "F0.java" not in entries
+
+    def test_loads_single_document_cache(self, tmp_path, source_file):
+        path = tmp_path / "cache.json"
+        cache = CacheManager(path)
+        cache.update_file(source_file)
+        entry = asdict(cache.load().entries["Main.java"])
+        path.write_text(json.dumps({"version": "1.0", "entries": {"Main.java": entry}}, indent=2))
+
+        assert CacheManager(path).load().entries["Main.java"].hash == "abc123"
+
+    def test_diff_splits_changed_and_deleted(self, tmp_path, source_file):
+        cache = CacheManager(tmp_path / "cache.json")
+        cache.update_file(source_file)
+        cache.update_file(replace(source_file, relative_path=Path("Gone.java")))
+        unchanged = replace(source_file, relative_path=Path("Other.java"))
+        cache.update_file(unchanged)
+
+        source_file.hash = "def456"
+        changed, deleted = cache.diff([source_file, unchanged])
+
+        assert changed == [source_file]
+        assert deleted == ["Gone.java"]
+
+    def test_save_replaces_file_without_leaving_temp_files(self, tmp_path, source_file):
+        (tmp_path / "cache.json").write_text("stale")
+        cache = CacheManager(tmp_path / "cache.json")
+        cache.update_file(source_file)
+        cache.save()
+
+        assert [p.name for p in tmp_path.iterdir()] == ["cache.json"]
+        assert CacheManager(tmp_path / "cache.json").load().entries["Main.java"].hash == "abc123"
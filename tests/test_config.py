@@ -223,3 +223,12 @@ def test_load_finds_default_paths():
             assert cfg.llm.model == "found-it"
         finally:
             os.chdir(orig_cwd)
+
+
+def test_load_prefers_earlier_default_names(tmp_path, monkeypatch):
+    """Test load() picks docmaker.yaml over the hidden .docmaker.yml."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".docmaker.yml").write_text(yaml.dump({"llm": {"model": "hidden"}}))
+    (tmp_path / "docmaker.yaml").write_text(yaml.dump({"llm": {"model": "visible"}}))
+
+    assert DocmakerConfig.load().llm.model == "visible"
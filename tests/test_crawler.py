@@ -1,10 +1,12 @@
 """Tests for the file crawler."""
 
+import hashlib
 import tempfile
 from pathlib import Path
 
 import pytest
 
+from docmaker.cache import HASH_ALGORITHM, CacheManager
 from docmaker.config import DocmakerConfig
 from docmaker.crawler import FileCrawler
 from docmaker.models import FileCategory, Language
@@ -121,3 +123,89 @@ def test_crawler_categorizes_backend_files(temp_repo):
 
     backend_files = [f for f in files if f.category == FileCategory.BACKEND]
     assert len(backend_files) >= 1
+
+
+@pytest.mark.skipif(HASH_ALGORITHM != "sha256", reason="blake3 is installed")
+def test_crawler_hashes_file_contents(temp_repo):
+    """Test that file hashes are SHA-256 digests of the contents without blake3."""
+    config = DocmakerConfig()
+    config.source_dir = temp_repo
+    config.llm.enabled = False
+
+    crawler = FileCrawler(config)
+    files = crawler.crawl()
+
+    assert files
+    for f in files:
+        assert f.hash == hashlib.sha256(f.path.read_bytes()).hexdigest()
+
+
+def test_crawler_keeps_walk_order(temp_repo):
+    """Test that files processed in parallel come back in directory walk order."""
+    config = DocmakerConfig()
+    config.source_dir = temp_repo
+    config.llm.enabled = False
+
+    crawler = FileCrawler(config)
+    files = crawler.crawl()
+
+    assert [f.path for f in files] == [Path(e.path) for e in crawler._collect_entries()]
+
+
+def test_crawler_reuses_cached_hash_for_unchanged_stat(temp_repo, monkeypatch):
+    """Test that files whose mtime and size match the cache are not re-hashed."""
+    config = DocmakerConfig()
+    config.source_dir = temp_repo
+    config.llm.enabled = False
+    cache = CacheManager(temp_repo / ".docmaker_cache.json")
+
+    for f in FileCrawler(config, cache).crawl():
+        cache.update_file(f)
+    cache.save()
+
+    crawler = FileCrawler(config, CacheManager(temp_repo / ".docmaker_cache.json"))
+    monkeypatch.setattr(crawler, "_compute_hash", lambda path: pytest.fail(f"hashed {path}"))
+    files = crawler.crawl()
+
+    assert files
+    assert all(f.hash for f in files)
+
+
+def test_crawler_applies_custom_ignore_patterns(temp_repo):
+    """Test that custom ignore patterns are matched alongside .gitignore."""
+    config = DocmakerConfig()
+    config.source_dir = temp_repo
+    config.llm.enabled = False
+    config.crawler.custom_ignore_patterns = ["src/test/"]
+
+    crawler = FileCrawler(config)
+    files = crawler.crawl()
+
+    assert files
+    assert not any(str(f.relative_path).startswith("src/test") for f in files)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"line1\nline2\nline3\nline4\n",
+        b"line1\r\nline2\r\nline3\r\nline4",
+        b"line1\rline2\rline3\rline4",
+        b"only\n",
+        b"caf\xc3\xa9 \xff\nnext\n",
+        b"",
+    ],
+)
+def test_crawler_single_read_matches_separate_header_and_hash(tmp_path, content):
+    """Test that the combined read returns the same header and hash as separate reads."""
+    path = tmp_path / "Main.java"
+    path.write_bytes(content)
+    config = DocmakerConfig()
+    config.source_dir = tmp_path
+
+    crawler = FileCrawler(config)
+
+    assert crawler._read_header_and_hash(path, 3) == (
+        crawler._read_header(path, 3),
+        crawler._compute_hash(path),
+    )
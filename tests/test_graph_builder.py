@@ -1,10 +1,11 @@
 """Tests for the graph builder module."""
 
+import json
 from pathlib import Path
 
 import pytest
 
-from docmaker.app.graph_builder import GraphBuilder
+from docmaker.app.graph_builder import CodeGraph, GraphBuilder, GraphEdge
 from docmaker.models import (
     Annotation,
     ClassDef,
@@ -169,6 +170,42 @@ def test_graph_serialization(sample_symbol_table: SymbolTable):
         assert "metadata" in node
 
 
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_graph_json_matches_dict(sample_symbol_table: SymbolTable, monkeypatch, use_orjson):
+    """Test that the JSON output matches to_dict, with or without orjson."""
+    from docmaker.app import graph_builder
+
+    if use_orjson and graph_builder.orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(graph_builder, "orjson", None)
+
+    graph = GraphBuilder(sample_symbol_table).build()
+
+    assert json.loads(graph.to_json()) == graph.to_dict()
+    assert json.loads(graph.dump_json()) == graph.to_dict()
+
+
+def test_code_graph_edge_rows_round_trip():
+    """Test that edges added as GraphEdge objects are stored as rows and read back."""
+    graph = CodeGraph()
+    graph.add_edge(GraphEdge(source="class:A", target="class:B", type="extends"))
+
+    assert graph.edge_rows == [("class:A", "class:B", "extends")]
+    assert graph.edges == (GraphEdge(source="class:A", target="class:B", type="extends"),)
+    assert graph.to_dict()["edges"] == [
+        {"source": "class:A", "target": "class:B", "type": "extends"}
+    ]
+
+
+def test_code_graph_edges_cannot_be_appended_to():
+    """Test that appending to the edges snapshot fails instead of dropping the edge."""
+    graph = CodeGraph()
+
+    with pytest.raises(AttributeError):
+        graph.edges.append(GraphEdge(source="class:A", target="class:B", type="extends"))
+
+
 def test_graph_node_metadata(sample_symbol_table: SymbolTable):
     """Test that nodes have appropriate metadata."""
     builder = GraphBuilder(sample_symbol_table)
@@ -249,6 +286,249 @@ def test_graph_builder_creates_calls_edges():
     assert calls_edges[0].target == "class:com.example.OrderValidator"
 
 
+def test_graph_builder_creates_import_edges_for_each_class():
+    """Test that every class in a file gets an imports edge to a known import."""
+    symbol_table = SymbolTable()
+
+    util_file = SourceFile(
+        path=Path("/test/Util.java"),
+        relative_path=Path("src/main/java/com/example/util/Util.java"),
+        language=Language.JAVA,
+        category=FileCategory.BACKEND,
+    )
+    multi_file = SourceFile(
+        path=Path("/test/Multi.java"),
+        relative_path=Path("src/main/java/com/example/Multi.java"),
+        language=Language.JAVA,
+        category=FileCategory.BACKEND,
+    )
+
+    symbol_table.add_file_symbols(
+        FileSymbols(
+            file=util_file,
+            package="com.example.util",
+            classes=[
+                ClassDef(name="Util", file_path=Path("/test/Util.java"), line_number=1, end_line=5)
+            ],
+        )
+    )
+    symbol_table.add_file_symbols(
+        FileSymbols(
+            file=multi_file,
+            package="com.example",
+            imports=[
+                ImportDef(module="com.example.util.Util"),
+                ImportDef(module="java.util.List"),
+                ImportDef(module="com.example.util", is_wildcard=True),
+            ],
+            classes=[
+                ClassDef(
+                    name="First", file_path=Path("/test/Multi.java"), line_number=1, end_line=5
+                ),
+                ClassDef(
+                    name="Second", file_path=Path("/test/Multi.java"), line_number=10, end_line=15
+                ),
+            ],
+        )
+    )
+
+    graph = GraphBuilder(symbol_table).build()
+
+    import_edges = {(e.source, e.target) for e in graph.edges if e.type == "imports"}
+    assert import_edges == {
+        ("class:com.example.First", "class:com.example.util.Util"),
+        ("class:com.example.Second", "class:com.example.util.Util"),
+    }
+
+
+def test_graph_builder_deduplicates_nodes_by_id():
+    """Test that a class defined in two files yields a single node."""
+    symbol_table = SymbolTable()
+
+    for name in ("A", "B"):
+        source_file = SourceFile(
+            path=Path(f"/test/{name}/Dup.java"),
+            relative_path=Path(f"src/{name}/Dup.java"),
+            language=Language.JAVA,
+            category=FileCategory.BACKEND,
+        )
+        symbol_table.add_file_symbols(
+            FileSymbols(
+                file=source_file,
+                package="com.example",
+                classes=[
+                    ClassDef(name="Dup", file_path=source_file.path, line_number=1, end_line=5)
+                ],
+            )
+        )
+
+    graph = GraphBuilder(symbol_table).build()
+
+    node_ids = [n.id for n in graph.nodes]
+    assert len(node_ids) == len(set(node_ids))
+    assert node_ids.count("class:com.example.Dup") == 1
+    assert node_ids.count("pkg:com.example") == 1
+    assert "file:src/A/Dup.java" in node_ids
+    assert "file:src/B/Dup.java" in node_ids
+
+    package_edges = [e for e in graph.edges if e.source == "pkg:com.example"]
+    assert [(e.target, e.type) for e in package_edges] == [("class:com.example.Dup", "contains")]
+
+
+def test_graph_builder_resolves_superclass_through_imports():
+    """Test that short type names resolve to imported classes from other packages."""
+    symbol_table = SymbolTable()
+
+    base_file = SourceFile(
+        path=Path("/test/BaseEntity.java"),
+        relative_path=Path("src/main/java/com/example/core/BaseEntity.java"),
+        language=Language.JAVA,
+        category=FileCategory.BACKEND,
+    )
+    user_file = SourceFile(
+        path=Path("/test/User.java"),
+        relative_path=Path("src/main/java/com/example/model/User.java"),
+        language=Language.JAVA,
+        category=FileCategory.BACKEND,
+    )
+
+    symbol_table.add_file_symbols(
+        FileSymbols(
+            file=base_file,
+            package="com.example.core",
+            classes=[
+                ClassDef(name="BaseEntity", file_path=base_file.path, line_number=1, end_line=5)
+            ],
+        )
+    )
+    symbol_table.add_file_symbols(
+        FileSymbols(
+            file=user_file,
+            package="com.example.model",
+            imports=[
+                ImportDef(module="java.util.BaseEntity"),
+                ImportDef(module="com.example.core.BaseEntity"),
+            ],
+            classes=[
+                ClassDef(
+                    name="User",
+                    file_path=user_file.path,
+                    line_number=1,
+                    end_line=5,
+                    superclass="BaseEntity",
+                )
+            ],
+        )
+    )
+
+    graph = GraphBuilder(symbol_table).build()
+
+    extends_edges = [e for e in graph.edges if e.type == "extends"]
+    assert len(extends_edges) == 1
+    assert extends_edges[0].source == "class:com.example.model.User"
+    assert extends_edges[0].target == "class:com.example.core.BaseEntity"
+
+
+def test_graph_builder_resolves_nested_class_names_through_imports():
+    """Test that dotted names like Outer.Inner resolve to the imported nested class."""
+    symbol_table = SymbolTable()
+
+    outer_file = SourceFile(
+        path=Path("/test/Outer.java"),
+        relative_path=Path("src/main/java/com/example/core/Outer.java"),
+        language=Language.JAVA,
+        category=FileCategory.BACKEND,
+    )
+    user_file = SourceFile(
+        path=Path("/test/User.java"),
+        relative_path=Path("src/main/java/com/example/model/User.java"),
+        language=Language.JAVA,
+        category=FileCategory.BACKEND,
+    )
+
+    symbol_table.add_file_symbols(
+        FileSymbols(
+            file=outer_file,
+            package="com.example.core",
+            classes=[
+                ClassDef(name="Outer.Inner", file_path=outer_file.path, line_number=1, end_line=5)
+            ],
+        )
+    )
+    symbol_table.add_file_symbols(
+        FileSymbols(
+            file=user_file,
+            package="com.example.model",
+            imports=[ImportDef(module="com.example.core.Outer.Inner")],
+            classes=[
+                ClassDef(
+                    name="User",
+                    file_path=user_file.path,
+                    line_number=1,
+                    end_line=5,
+                    superclass="Outer.Inner",
+                )
+            ],
+        )
+    )
+
+    graph = GraphBuilder(symbol_table).build()
+
+    extends_edges = [e for e in graph.edges if e.type == "extends"]
+    assert [e.target for e in extends_edges] == ["class:com.example.core.Outer.Inner"]
+
+
+def test_graph_builder_deduplicates_calls_edges():
+    """Test that repeated call sites produce a single calls edge per class pair."""
+    symbol_table = SymbolTable()
+
+    source_file = SourceFile(
+        path=Path("/test/Checkout.java"),
+        relative_path=Path("src/main/java/com/example/Checkout.java"),
+        language=Language.JAVA,
+        category=FileCategory.BACKEND,
+    )
+    methods = [
+        FunctionDef(
+            name=name,
+            file_path=source_file.path,
+            line_number=line,
+            end_line=line + 3,
+            calls=["Receipt", "Receipt"],
+        )
+        for name, line in (("pay", 5), ("refund", 10))
+    ]
+
+    symbol_table.add_file_symbols(
+        FileSymbols(
+            file=source_file,
+            package="com.example",
+            imports=[
+                ImportDef(module="com.example.Receipt"),
+                ImportDef(module="com.example.Receipt"),
+            ],
+            classes=[
+                ClassDef(
+                    name="Checkout",
+                    file_path=source_file.path,
+                    line_number=1,
+                    end_line=20,
+                    methods=methods,
+                ),
+                ClassDef(name="Receipt", file_path=source_file.path, line_number=21, end_line=30),
+            ],
+        )
+    )
+
+    graph = GraphBuilder(symbol_table).build()
+
+    calls_edges = [(e.source, e.target) for e in graph.edges if e.type == "calls"]
+    assert calls_edges == [("class:com.example.Checkout", "class:com.example.Receipt")]
+
+    import_edges = [(e.source, e.target) for e in graph.edges if e.type == "imports"]
+    assert len(import_edges) == len(set(import_edges)) == 2
+
+
 def test_empty_symbol_table():
     """Test that empty symbol table produces empty graph."""
     symbol_table = SymbolTable()
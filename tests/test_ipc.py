@@ -1,8 +1,10 @@
 """Tests for the IPC bridge (DocmakerAPI)."""
 
 import json
+import os
 import sys
 import textwrap
+import time
 from pathlib import Path
 from unittest import mock
 
@@ -25,7 +27,7 @@ from docmaker.models import (
 
 
 @pytest.fixture
-def api():
+def api(tmp_path_factory):
     """Create a DocmakerAPI instance with mocked Qt/Pyloid dependencies."""
     # Set up mock modules before importing ipc
     bridge_mock = mock.MagicMock()
@@ -56,8 +58,10 @@ def api():
             del sys.modules["docmaker.app.ipc"]
 
         from docmaker.app.ipc import DocmakerAPI
+        from docmaker.cache import SymbolCache
 
-        yield DocmakerAPI()
+        # Never touch the developer's real ~/.cache
+        yield DocmakerAPI(symbol_cache=SymbolCache(tmp_path_factory.mktemp("symbols")))
     finally:
         # Restore original modules
         for mod_name in mocks:
@@ -274,10 +278,43 @@ class TestScanProject:
         assert result["stats"]["byLanguage"]["java"] == 1
         assert result["stats"]["byCategory"]["backend"] == 1
         assert len(result["files"]) == 1
-        assert result["files"][0]["path"] == "Main.java"
-        assert result["files"][0]["size"] == 512
+        assert result["files"][0] == ["Main.java", "java", "backend", 512]
         assert result["projectPath"] == str(project.resolve())
 
+    @mock.patch("docmaker.app.ipc.FileCrawler")
+    @mock.patch("docmaker.app.ipc.DocmakerConfig.load")
+    def test_rescan_reuses_config_until_inputs_change(
+        self, mock_config_load, mock_crawler_cls, api, tmp_path
+    ):
+        project = tmp_path / "proj"
+        project.mkdir()
+        gitignore = project / ".gitignore"
+        gitignore.write_text("*.log\n")
+        mock_crawler_cls.return_value.crawl.return_value = []
+
+        api.scan_project(str(project))
+        api.parse_only(str(project))
+        assert mock_config_load.call_count == 1
+        assert mock_crawler_cls.call_count == 1
+
+        os.utime(gitignore, ns=(0, 0))
+        api.scan_project(str(project))
+        assert mock_config_load.call_count == 2
+        assert mock_crawler_cls.call_count == 2
+
+    @mock.patch("docmaker.app.ipc.load_settings", return_value={})
+    def test_rescan_does_not_see_earlier_run_config_changes(self, _load_settings, api, tmp_path):
+        project = tmp_path / "proj"
+        project.mkdir()
+
+        api.scan_project(str(project))
+        first = api._config
+        first.llm.enabled = False
+        api.scan_project(str(project))
+
+        assert api._config is not first
+        assert api._config.llm.enabled is True
+
 
 # ---------------------------------------------------------------------------
 # parse_only
@@ -326,7 +363,7 @@ class TestParseOnly:
         mock_registry_fn.return_value = registry
 
         mock_graph = mock.MagicMock()
-        mock_graph.to_dict.return_value = {"nodes": [], "edges": []}
+        mock_graph.to_json.return_value = json.dumps({"nodes": [], "edges": []})
         mock_graph_cls.return_value.build.return_value = mock_graph
 
         result = json.loads(api.parse_only(str(project)))
@@ -361,7 +398,7 @@ class TestParseOnly:
         mock_registry_fn.return_value = registry
 
         mock_graph = mock.MagicMock()
-        mock_graph.to_dict.return_value = {"nodes": [], "edges": []}
+        mock_graph.to_json.return_value = json.dumps({"nodes": [], "edges": []})
         mock_graph_cls.return_value.build.return_value = mock_graph
 
         result = json.loads(api.parse_only(str(project)))
@@ -369,6 +406,98 @@ class TestParseOnly:
         # TEST category should be filtered, so parser never called
         registry.can_parse.assert_not_called()
 
+    def test_large_projects_parse_in_worker_processes(self, api, tmp_path_factory, monkeypatch):
+        ipc = sys.modules["docmaker.app.ipc"]
+        monkeypatch.setattr(ipc, "PARALLEL_PARSE_MIN_FILES", 2)
+        monkeypatch.setattr(ipc, "PARSE_CHUNK_SIZE", 1)
+
+        # tmp_path embeds the test name, and "test_" in a path marks files as tests
+        project = tmp_path_factory.mktemp("proj")
+        for name in ("alpha", "beta", "gamma"):
+            (project / f"{name}.py").write_text(f"class {name.title()}:\n    pass\n")
+
+        result = json.loads(api.parse_only(str(project)))
+
+        assert result["success"] is True
+        assert result["stats"]["filesParsed"] == 3
+        assert result["stats"]["classesFound"] == 3
+
+    def test_unchanged_files_reuse_cached_symbols(self, api, tmp_path_factory):
+        project = tmp_path_factory.mktemp("proj")
+        (project / "alpha.py").write_text("class Alpha:\n    pass\n")
+        (project / "beta.py").write_text("class Beta:\n    pass\n")
+
+        first = json.loads(api.parse_only(str(project)))
+        assert first["stats"]["cacheHits"] == 0
+        assert first["stats"]["cacheMisses"] == 2
+
+        (project / "beta.py").write_text("class Beta:\n    pass\n\nclass Gamma:\n    pass\n")
+        second = json.loads(api.parse_only(str(project)))
+
+        assert second["stats"]["cacheHits"] == 1
+        assert second["stats"]["cacheMisses"] == 1
+        assert second["stats"]["classesFound"] == 3
+
+    def test_graph_data_reuses_parsed_graph(self, api, tmp_path_factory):
+        project = tmp_path_factory.mktemp("proj")
+        (project / "alpha.py").write_text("class Alpha:\n    pass\n")
+
+        result = json.loads(api.parse_only(str(project)))
+
+        with mock.patch("docmaker.app.ipc.GraphBuilder") as mock_builder_cls:
+            graph = json.loads(api.get_graph_data())
+        mock_builder_cls.assert_not_called()
+        assert graph == result["graph"]
+        assert any(node["label"] == "Alpha" for node in graph["nodes"])
+
+    def test_symbol_table_is_published_only_when_parse_finishes(self, api, tmp_path_factory):
+        project = tmp_path_factory.mktemp("proj")
+        (project / "alpha.py").write_text("class Alpha:\n    pass\n")
+        api.parse_only(str(project))
+        table = api._symbol_table
+
+        (project / "beta.py").write_text("class Beta:\n    pass\n")
+        with mock.patch("docmaker.app.ipc.GraphBuilder", side_effect=RuntimeError("boom")):
+            result = json.loads(api.parse_only(str(project)))
+
+        assert result["error"] == "boom"
+        assert api._symbol_table is table
+        assert len(api._symbol_table.files) == 1
+
+
+# ---------------------------------------------------------------------------
+# Background jobs
+# ---------------------------------------------------------------------------
+
+
+class TestJobs:
+    def _wait(self, api, job_id):
+        for _ in range(500):
+            result = json.loads(api.get_job_result(job_id))
+            if result["done"]:
+                return result["result"]
+            time.sleep(0.01)
+        raise AssertionError("job did not finish")
+
+    def test_parse_only_job_returns_bridge_result(self, api, tmp_path_factory):
+        project = tmp_path_factory.mktemp("proj")
+        (project / "alpha.py").write_text("class Alpha:\n    pass\n")
+
+        job = json.loads(api.start_job("parse_only", str(project)))
+        result = self._wait(api, job["jobId"])
+
+        assert result["success"] is True
+        assert result["stats"]["classesFound"] == 1
+        assert "error" in json.loads(api.get_job_result(job["jobId"]))
+
+    def test_job_errors_are_reported_as_results(self, api):
+        job = json.loads(api.start_job("parse_only", "/no/such/project"))
+        assert "does not exist" in self._wait(api, job["jobId"])["error"]
+
+    def test_only_long_bridges_can_be_started(self, api):
+        result = json.loads(api.start_job("open_file", "/tmp/x"))
+        assert "Not a job bridge" in result["error"]
+
 
 # ---------------------------------------------------------------------------
 # get_class_details
@@ -432,6 +561,22 @@ class TestGetClassDetails:
         assert len(f["annotations"]) == 1
         assert f["annotations"][0]["name"] == "Autowired"
 
+    def test_details_reused_until_symbol_table_changes(self, api, symbol_table):
+        api._symbol_table = symbol_table
+        first = api.get_class_details("UserController")
+        assert api.get_class_details("UserController") is first
+
+        cls = symbol_table.class_index["com.example.UserController"]
+        cls.docstring = "Changed."
+        symbol_table.mark_changed()
+        assert json.loads(api.get_class_details("UserController"))["docstring"] == "Changed."
+
+        cls.docstring = "Replaced."
+        api._symbol_table = SymbolTable()
+        for symbols in symbol_table.files.values():
+            api._symbol_table.add_file_symbols(symbols)
+        assert json.loads(api.get_class_details("UserController"))["docstring"] == "Replaced."
+
 
 # ---------------------------------------------------------------------------
 # get_endpoint_details
@@ -472,12 +617,53 @@ class TestGetEndpointDetails:
         assert p["description"] == "Page number"
 
 
+# ---------------------------------------------------------------------------
+# get_details_bulk
+# ---------------------------------------------------------------------------
+
+
+class TestGetDetailsBulk:
+    def test_no_symbol_table_returns_error(self, api):
+        result = json.loads(api.get_details_bulk(json.dumps({"classes": ["Foo"]})))
+        assert "No symbol table" in result["error"]
+
+    def test_returns_classes_and_endpoints_by_requested_key(self, api, symbol_table):
+        api._symbol_table = symbol_table
+        keys = {"classes": ["UserController", "Missing"], "endpoints": ["GET:/users"]}
+        result = json.loads(api.get_details_bulk(json.dumps(keys)))
+
+        assert result["classes"]["UserController"]["fqn"] == "com.example.UserController"
+        assert "Class not found" in result["classes"]["Missing"]["error"]
+        assert result["endpoints"]["GET:/users"]["handlerMethod"] == "getUsers"
+
+    def test_matches_single_lookups(self, api, symbol_table):
+        api._symbol_table = symbol_table
+        keys = {"classes": ["com.example.UserController"], "endpoints": ["GET:/users"]}
+        result = json.loads(api.get_details_bulk(json.dumps(keys)))
+
+        fqn = "com.example.UserController"
+        assert result["classes"][fqn] == json.loads(api.get_class_details(fqn))
+        assert result["endpoints"]["GET:/users"] == json.loads(
+            api.get_endpoint_details("GET:/users")
+        )
+
+
 # ---------------------------------------------------------------------------
 # open_file
 # ---------------------------------------------------------------------------
 
 
 class TestOpenFile:
+    @pytest.fixture(autouse=True)
+    def _editors_on_path(self, api):
+        """Resolve every executable to its bare name, as if all were on PATH."""
+        ipc = sys.modules["docmaker.app.ipc"]
+        with (
+            mock.patch.dict(ipc._EXECUTABLE_PATHS, clear=True),
+            mock.patch.object(ipc.shutil, "which", side_effect=lambda name: name) as which,
+        ):
+            yield which
+
     def test_nonexistent_file_returns_error(self, api):
         result = json.loads(api.open_file("/no/such/file.txt", 0))
         assert "error" in result
@@ -615,6 +801,40 @@ class TestOpenFile:
         assert result["success"] is True
         assert result["editor"] == "system"
 
+    @mock.patch("docmaker.app.ipc.subprocess.Popen")
+    @mock.patch("docmaker.app.ipc.load_settings")
+    @mock.patch("docmaker.app.ipc.get_editor_command")
+    def test_editor_missing_from_path_falls_back(
+        self, mock_get_cmd, mock_load, mock_popen, api, tmp_path, _editors_on_path
+    ):
+        f = tmp_path / "test.py"
+        f.write_text("pass")
+        mock_load.return_value = {}
+        mock_get_cmd.return_value = (["idea", "--line", "{line}", "{file}"], "idea")
+        _editors_on_path.side_effect = lambda name: None if name == "idea" else name
+
+        result = json.loads(api.open_file(str(f), 7))
+        assert result["editor"] == "system"
+        mock_popen.assert_called_once_with(["xdg-open", str(f)])
+
+    @mock.patch("docmaker.app.ipc.subprocess.Popen")
+    @mock.patch("docmaker.app.ipc.load_settings")
+    @mock.patch("docmaker.app.ipc.get_editor_command")
+    def test_editor_path_resolved_once(
+        self, mock_get_cmd, mock_load, mock_popen, api, tmp_path, _editors_on_path
+    ):
+        f = tmp_path / "test.py"
+        f.write_text("pass")
+        mock_load.return_value = {}
+        mock_get_cmd.return_value = (["subl", "{file}:{line}"], "sublime")
+        _editors_on_path.side_effect = lambda name: f"/usr/bin/{name}"
+
+        api.open_file(str(f), 1)
+        api.open_file(str(f), 2)
+
+        _editors_on_path.assert_called_once_with("subl")
+        mock_popen.assert_called_with(["/usr/bin/subl", f"{f}:2"])
+
 
 # ---------------------------------------------------------------------------
 # Settings operations
@@ -709,9 +929,55 @@ class TestGetGraphData:
     def test_returns_graph_dict(self, mock_builder_cls, api, symbol_table):
         api._symbol_table = symbol_table
         mock_graph = mock.MagicMock()
-        mock_graph.to_dict.return_value = {"nodes": [{"id": "a"}], "edges": []}
+        mock_graph.to_json.return_value = json.dumps({"nodes": [{"id": "a"}], "edges": []})
         mock_builder_cls.return_value.build.return_value = mock_graph
 
         result = json.loads(api.get_graph_data())
         assert result["nodes"] == [{"id": "a"}]
         assert result["edges"] == []
+
+    @mock.patch("docmaker.app.ipc.GraphBuilder")
+    def test_graph_reused_until_symbols_change(self, mock_builder_cls, api, symbol_table):
+        api._symbol_table = symbol_table
+        mock_builder_cls.return_value.build.return_value.to_json.return_value = "{}"
+
+        api.get_graph_data()
+        api.get_graph_data()
+        assert mock_builder_cls.call_count == 1
+
+        symbol_table.add_file_symbols(next(iter(symbol_table.files.values())))
+        api.get_graph_data()
+        assert mock_builder_cls.call_count == 2
+
+
+# ---------------------------------------------------------------------------
+# JSON encoding
+# ---------------------------------------------------------------------------
+
+
+class TestDumps:
+    def test_matches_stdlib_without_orjson(self, api, monkeypatch):
+        ipc = sys.modules["docmaker.app.ipc"]
+        payload = {"files": [{"path": "src/Ünï.java", "size": 1}], "error": None}
+
+        encoded = ipc._dumps(payload)
+        monkeypatch.setattr(ipc, "orjson", None)
+
+        assert json.loads(encoded) == payload
+        assert json.loads(ipc._dumps(payload)) == payload
+
+    def test_paths_encoded_as_strings(self, api, monkeypatch):
+        ipc = sys.modules["docmaker.app.ipc"]
+        payload = {"path": Path("src") / "Main.java"}
+        expected = {"path": str(Path("src") / "Main.java")}
+
+        assert json.loads(ipc._dumps(payload)) == expected
+        monkeypatch.setattr(ipc, "orjson", None)
+        assert json.loads(ipc._dumps(payload)) == expected
+
+    def test_loads_round_trip(self, api):
+        ipc = sys.modules["docmaker.app.ipc"]
+        assert ipc._loads('{"incremental": true, "useLlm": false}') == {
+            "incremental": True,
+            "useLlm": False,
+        }
@@ -162,6 +162,22 @@ class TestResolveType:
         result = linker.resolve_type("UserService", file_symbols)
         assert result == "com.example.service.UserService"
 
+    def test_resolve_sees_classes_added_later(self, linker, symbol_table, controller_file_symbols):
+        """Test that cached resolutions are dropped when the symbol table changes."""
+        assert linker.resolve_type("Order", controller_file_symbols) is None
+
+        sf = SourceFile(
+            path=Path("/src/Order.java"),
+            relative_path=Path("src/Order.java"),
+            language=Language.JAVA,
+        )
+        order_cls = ClassDef(name="Order", file_path=sf.path, line_number=1, end_line=5)
+        symbol_table.add_file_symbols(
+            FileSymbols(file=sf, package="com.example", classes=[order_cls])
+        )
+
+        assert linker.resolve_type("Order", controller_file_symbols) == "com.example.Order"
+
 
 class TestGetWikilink:
     def test_known_class(self, linker, controller_file_symbols):
@@ -172,6 +188,23 @@ class TestGetWikilink:
         result = linker.get_wikilink("UnknownType", controller_file_symbols)
         assert result == "`UnknownType`"
 
+    def test_cached_link_refreshes_when_class_added(
+        self, linker, symbol_table, controller_file_symbols
+    ):
+        assert linker.get_wikilink("Order", controller_file_symbols) == "`Order`"
+
+        sf = SourceFile(
+            path=Path("/src/Order.java"),
+            relative_path=Path("src/Order.java"),
+            language=Language.JAVA,
+        )
+        order_cls = ClassDef(name="Order", file_path=sf.path, line_number=1, end_line=5)
+        symbol_table.add_file_symbols(
+            FileSymbols(file=sf, package="com.example", classes=[order_cls])
+        )
+
+        assert linker.get_wikilink("Order", controller_file_symbols) == "[[Order]]"
+
 
 class TestGetClassLink:
     def test_known_class(self, linker):
@@ -182,6 +215,24 @@ class TestGetClassLink:
         result = linker.get_class_link("NonExistent")
         assert result == "`NonExistent`"
 
+    def test_class_added_after_first_lookup(self, linker, symbol_table):
+        assert linker.get_class_link("Order") == "`Order`"
+
+        order_file = SourceFile(
+            path=Path("/src/Order.java"),
+            relative_path=Path("src/Order.java"),
+            language=Language.JAVA,
+            category=FileCategory.BACKEND,
+        )
+        order_cls = ClassDef(
+            name="Order", file_path=order_file.path, line_number=1, end_line=5, package="com.shop"
+        )
+        symbol_table.add_file_symbols(
+            FileSymbols(file=order_file, package="com.shop", classes=[order_cls])
+        )
+
+        assert linker.get_class_link("Order") == "[[Order]]"
+
 
 class TestGetMethodLink:
     def test_known_class_method(self, linker):
@@ -203,6 +254,37 @@ class TestFindCallers:
         callers = linker.find_callers("UserController", "getUser")
         assert all(c[0] != "UserController" or c[1] != "getUser" for c in callers)
 
+    def test_find_callers_matches_whole_names(self, linker):
+        """Test that a call to findById is not a call to a method named ById."""
+        assert linker.find_callers("UserService", "ById") == []
+
+    def test_find_callers_matches_names_with_dollar(self, symbol_table, linker):
+        """Test that JS/TS identifiers containing $ are matched whole."""
+        store_file = SourceFile(
+            path=Path("/src/store.ts"),
+            relative_path=Path("src/store.ts"),
+            language=Language.TYPESCRIPT,
+        )
+        store_cls = ClassDef(
+            name="Store",
+            file_path=store_file.path,
+            line_number=1,
+            end_line=10,
+            methods=[
+                FunctionDef(
+                    name="load",
+                    file_path=store_file.path,
+                    line_number=2,
+                    end_line=4,
+                    source_code="load() { return this.$fetch(url); }",
+                )
+            ],
+        )
+        symbol_table.add_file_symbols(FileSymbols(file=store_file, classes=[store_cls]))
+
+        assert linker.find_callers("Api", "$fetch") == [("Store", "load")]
+        assert linker.find_callers("Api", "fetch") == []
+
 
 class TestFindUsages:
     def test_find_usages(self, linker):
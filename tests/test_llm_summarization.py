@@ -188,10 +188,12 @@ def test_summarize_symbol_table(enabled_config, sample_symbol_table):
     summarizer.provider = MagicMock()
     summarizer.provider.generate.return_value = "A helpful summary."
     summarizer.provider.is_available.return_value = True
+    version = sample_symbol_table.version
 
     class_count, method_count = summarizer.summarize_symbol_table(sample_symbol_table)
     assert class_count == 1
     assert method_count == 1
+    assert sample_symbol_table.version > version
 
     # Verify summaries were set on the models
     for fs in sample_symbol_table.files.values():
@@ -203,10 +205,12 @@ def test_summarize_symbol_table(enabled_config, sample_symbol_table):
 
 def test_summarize_symbol_table_noop(disabled_config, sample_symbol_table):
     summarizer = Summarizer(disabled_config)
+    version = sample_symbol_table.version
     class_count, method_count = summarizer.summarize_symbol_table(sample_symbol_table)
     # NoOpProvider.generate returns None, so no summaries
     assert class_count == 0
     assert method_count == 0
+    assert sample_symbol_table.version == version
 
 
 # --- Markdown rendering tests ---
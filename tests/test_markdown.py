@@ -765,6 +765,10 @@ class TestWikiLinks:
         link = generator._get_import_link("com.example.UserController")
         assert "[[UserController]]" in link
 
+    def test_import_link_for_class_in_other_package(self, generator):
+        link = generator._get_import_link("com.other.UserController")
+        assert link == "[[UserController]] (`com.other.UserController`)"
+
     def test_import_link_for_unknown_class(self, generator):
         link = generator._get_import_link("com.external.Unknown")
         assert link == "`com.external.Unknown`"
@@ -831,6 +835,26 @@ class TestIndexGeneration:
         assert "## Controllers" in content
         assert "[[UserController]]" in content
 
+    def test_generate_index_uses_highest_priority_role(self, generator, symbol_table):
+        sf = SourceFile(
+            path=Path("/project/src/Account.java"),
+            relative_path=Path("src/Account.java"),
+            language=Language.JAVA,
+        )
+        account = ClassDef(
+            name="Account",
+            file_path=sf.path,
+            line_number=1,
+            end_line=10,
+            annotations=[Annotation(name="Entity"), Annotation(name="Service")],
+        )
+        symbol_table.add_file_symbols(FileSymbols(file=sf, classes=[account]))
+
+        content = generator._generate_index().read_text()
+        services = content.split("## Services\n")[1].split("##")[0]
+        assert "[[Account]]" in services
+        assert "## Entities" not in content
+
     def test_generate_endpoints_index_creates_file(self, generator):
         ep_path = generator._generate_endpoints_index()
         assert ep_path is not None
@@ -1,5 +1,8 @@
 """Tests for Obsidian vault markdown generation."""
 
+import pickle
+import shutil
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
@@ -699,6 +702,116 @@ class TestVaultStructure:
         moc_names = {f.name for f in generated if "MOC" in f.name}
         assert len(moc_names) >= 2  # At least service and controller packages
 
+    def test_worker_processes_write_same_pages(self, output_config, tmp_path, monkeypatch):
+        """Rendering pages in worker processes should produce the same vault."""
+        files = [
+            FileSymbols(
+                file=_make_source_file(f"src/pkg{i}/Model{i}.java"),
+                package=f"com.example.pkg{i}",
+                imports=[ImportDef(module="com.example.pkg0.Model0")],
+                classes=[
+                    ClassDef(
+                        name=f"Model{i}",
+                        file_path=Path(f"/project/src/pkg{i}/Model{i}.java"),
+                        line_number=1,
+                        end_line=10,
+                        superclass="Model0" if i else None,
+                    )
+                ],
+            )
+            for i in range(3)
+        ]
+        st = _make_symbol_table(*files)
+        sequential = MarkdownGenerator(output_config, st)
+        sequential.generate_all()
+
+        monkeypatch.setattr("docmaker.generator.markdown.PARALLEL_GENERATE_MIN_FILES", 0)
+        parallel_config = replace(output_config, output_dir=tmp_path / "parallel")
+        generated = MarkdownGenerator(parallel_config, st).generate_all()
+
+        def read_page(output_dir: Path, page: Path) -> list[str]:
+            lines = (output_dir / page).read_text(encoding="utf-8").splitlines()
+            return [line for line in lines if not line.startswith("generated: ")]
+
+        for i in range(3):
+            page = Path(f"src/pkg{i}/Model{i}.md")
+            assert parallel_config.output_dir / page in generated
+            assert read_page(parallel_config.output_dir, page) == read_page(
+                output_config.output_dir, page
+            )
+
+    def test_pickled_generator_drops_annotation_cache(self, output_config):
+        """Workers get a generator whose id-keyed annotation cache starts empty."""
+        cls = ClassDef(
+            name="Order",
+            file_path=Path("/project/src/Order.java"),
+            line_number=1,
+            end_line=10,
+            annotations=[Annotation(name="Entity")],
+        )
+        fs = FileSymbols(file=_make_source_file("src/Order.java"), classes=[cls])
+        gen = MarkdownGenerator(output_config, _make_symbol_table(fs))
+        gen._annotation_names(cls)
+
+        clone = pickle.loads(pickle.dumps(gen))
+
+        assert gen._ann_names
+        assert clone._ann_names == {}
+        clone_fs = clone.symbol_table.files[fs.file.path]
+        assert clone._generate_file_doc(clone_fs) == gen._generate_file_doc(fs)
+
+    def test_generate_all_stamps_one_timestamp(self, output_config):
+        """Every page from a single run should carry the same generated timestamp."""
+        fs = FileSymbols(
+            file=_make_source_file("src/Order.java"),
+            package="com.shop",
+            classes=[
+                ClassDef(
+                    name="Order",
+                    file_path=Path("/project/src/Order.java"),
+                    line_number=1,
+                    end_line=10,
+                )
+            ],
+        )
+        gen = MarkdownGenerator(output_config, _make_symbol_table(fs))
+        generated = gen.generate_all()
+
+        stamps = {
+            line
+            for path in generated
+            for line in path.read_text(encoding="utf-8").splitlines()
+            if line.startswith("generated: ")
+        }
+        assert len(generated) >= 3
+        assert stamps == {f"generated: {gen._run_timestamp}"}
+
+    def test_file_page_matches_generated_doc(self, output_config):
+        """Streaming a page's lines to disk should write exactly the rendered doc."""
+        fs = FileSymbols(
+            file=_make_source_file("src/Order.java"),
+            package="com.shop",
+        )
+        gen = MarkdownGenerator(output_config, _make_symbol_table(fs))
+
+        path = gen._write_file_page(fs)
+
+        assert path.read_text(encoding="utf-8") == gen._generate_file_doc(fs)
+
+    def test_generate_all_recreates_removed_output_dir(self, output_config):
+        """Directories remembered from an earlier run should be created again."""
+        fs = FileSymbols(
+            file=_make_source_file("src/Order.java"),
+            package="com.shop",
+        )
+        gen = MarkdownGenerator(output_config, _make_symbol_table(fs))
+        gen.generate_all()
+        shutil.rmtree(output_config.output_dir)
+
+        generated = gen.generate_all()
+
+        assert all(path.exists() for path in generated)
+
 
 # ---------------------------------------------------------------------------
 # Config integration tests
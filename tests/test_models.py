@@ -1,5 +1,6 @@
 """Tests for data models."""
 
+import sys
 from pathlib import Path
 
 import pytest
@@ -101,6 +102,28 @@ class TestAnnotation:
         assert a.arguments["value"] == "/api"
 
 
+class TestClassDef:
+    def test_is_interface(self):
+        cls = ClassDef(
+            name="Repo",
+            file_path=Path("Repo.kt"),
+            line_number=1,
+            end_line=5,
+            modifiers=["interface"],
+        )
+        assert cls.is_interface is True
+
+    def test_is_not_interface(self):
+        cls = ClassDef(
+            name="Repo",
+            file_path=Path("Repo.kt"),
+            line_number=1,
+            end_line=5,
+            modifiers=["public"],
+        )
+        assert cls.is_interface is False
+
+
 class TestSymbolTable:
     @pytest.fixture
     def symbol_table(self):
@@ -170,6 +193,18 @@ class TestSymbolTable:
         symbol_table.add_file_symbols(sample_file_symbols)
         assert "GET:/api/items" in symbol_table.endpoint_index
 
+    def test_add_file_symbols_interns_annotation_names(self, symbol_table, sample_file_symbols):
+        # Build the names at runtime so they start out as distinct objects
+        name = "".join(["Rest", "Controller"])
+        cls = sample_file_symbols.classes[0]
+        cls.annotations.append(Annotation(name=name))
+        cls.methods[0].annotations.append(Annotation(name="".join(["Get", "Mapping"])))
+
+        symbol_table.add_file_symbols(sample_file_symbols)
+
+        assert cls.annotations[0].name is sys.intern("RestController")
+        assert cls.methods[0].annotations[0].name is sys.intern("GetMapping")
+
     def test_add_file_symbols_no_package(self, symbol_table):
         sf = SourceFile(
             path=Path("/test/util.py"),
@@ -186,6 +221,29 @@ class TestSymbolTable:
         symbol_table.add_file_symbols(symbols)
         assert "Util" in symbol_table.class_index
 
+    def test_add_file_symbols_bumps_version(self, symbol_table, sample_file_symbols):
+        assert symbol_table.version == 0
+        symbol_table.add_file_symbols(sample_file_symbols)
+        assert symbol_table.version == 1
+
+    def test_find_class_by_fqn(self, symbol_table, sample_file_symbols):
+        symbol_table.add_file_symbols(sample_file_symbols)
+        fqn, cls = symbol_table.find_class("com.example.MyClass")
+        assert fqn == "com.example.MyClass"
+        assert cls.name == "MyClass"
+
+    @pytest.mark.parametrize("name", ["MyClass", "example.MyClass"])
+    def test_find_class_by_suffix(self, symbol_table, sample_file_symbols, name):
+        symbol_table.add_file_symbols(sample_file_symbols)
+        fqn, cls = symbol_table.find_class(name)
+        assert fqn == "com.example.MyClass"
+        assert cls.name == "MyClass"
+
+    def test_find_class_partial_segment_not_found(self, symbol_table, sample_file_symbols):
+        symbol_table.add_file_symbols(sample_file_symbols)
+        assert symbol_table.find_class("Class") is None
+        assert symbol_table.find_class("ample.MyClass") is None
+
     def test_resolve_import_found(self, symbol_table, sample_file_symbols):
         symbol_table.add_file_symbols(sample_file_symbols)
         result = symbol_table.resolve_import("com.example.MyClass")
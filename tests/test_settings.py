@@ -61,6 +61,19 @@ def test_load_settings_returns_defaults_when_no_file(tmp_path, monkeypatch):
     assert settings == DEFAULT_SETTINGS
 
 
+def test_load_settings_defaults_are_independent_copies(tmp_path, monkeypatch):
+    """Test that mutating returned defaults does not affect later loads."""
+    monkeypatch.setattr(
+        "docmaker.app.settings.get_settings_path",
+        lambda: tmp_path / "nonexistent" / "settings.json",
+    )
+
+    load_settings()["appearance"]["uiScale"] = 90
+
+    assert load_settings()["appearance"]["uiScale"] == 100
+    assert DEFAULT_SETTINGS["appearance"]["uiScale"] == 100
+
+
 def test_load_settings_merges_saved_with_defaults(tmp_path, monkeypatch):
     """Test that saved settings are merged with defaults (partial settings file)."""
     settings_path = tmp_path / "settings.json"
@@ -129,6 +142,47 @@ def test_load_settings_handles_missing_keys(tmp_path, monkeypatch):
     assert settings["general"] == DEFAULT_SETTINGS["general"]
 
 
+def test_load_settings_returns_independent_copies(tmp_path, monkeypatch):
+    """Test that mutating loaded settings does not leak into later loads."""
+    settings_path = tmp_path / "settings.json"
+    settings_path.write_text(json.dumps({"appearance": {"uiScale": 125}}))
+
+    monkeypatch.setattr("docmaker.app.settings.get_settings_path", lambda: settings_path)
+
+    first = load_settings()
+    first["appearance"]["uiScale"] = 90
+    second = load_settings()
+
+    assert second["appearance"]["uiScale"] == 125
+
+
+def test_load_settings_rereads_after_save(tmp_path, monkeypatch):
+    """Test that cached settings are invalidated when settings are saved."""
+    settings_path = tmp_path / "settings.json"
+    settings_path.write_text(json.dumps({"appearance": {"uiScale": 125}}))
+
+    monkeypatch.setattr("docmaker.app.settings.get_settings_path", lambda: settings_path)
+
+    assert load_settings()["appearance"]["uiScale"] == 125
+    save_settings({"appearance": {"uiScale": 150}})
+
+    assert load_settings()["appearance"]["uiScale"] == 150
+
+
+def test_load_settings_replaces_section_overridden_by_non_dict(tmp_path, monkeypatch):
+    """Test that a non-dict value saved over a section replaces it wholesale."""
+    settings_path = tmp_path / "settings.json"
+    settings_path.write_text(json.dumps({"appearance": None, "graphView": {}}))
+
+    monkeypatch.setattr("docmaker.app.settings.get_settings_path", lambda: settings_path)
+
+    settings = load_settings()
+
+    assert settings["appearance"] is None
+    assert settings["graphView"] == DEFAULT_SETTINGS["graphView"]
+    assert DEFAULT_SETTINGS["appearance"] is not None
+
+
 # --- Save Settings Tests ---
 
 